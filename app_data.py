@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: app_data.py
+# Description: Shared data layer of the multi-page Streamlit app
+#
+# The entrypoint (app.py) and every page in app_pages/ get their data from
+# here, so a page only computes what it renders. load_data() returns the
+# current dataset of the session's match format (cricdata.formats): the
+# version published by cricdata.shared_dataset (mapped and shared by
+# processes), or the data file itself until one is published. Either way it
+# is built once per process, format and version (st.cache_resource), so
+# calling it from a page costs microseconds. A format's data, aggregate
+# state and watcher are only created once some session selects it.
+#
+# Per-selection results (filtered innings, regimes, distributions, bootstrap
+# jobs) are computed on first use and kept in the process-wide selection
+# cache, keyed by selection_key() on the (format, aggregate state version).
+#
+# The calculations themselves live in the cricdata package (cricdata.core),
+# which batch jobs use without Streamlit; this module only adds the caches.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import logging
+import os
+import threading
+
+import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from cricdata.agg_state import IncrementalAggregates
+from cricdata.bootstrap import bootstrap_ci
+from cricdata.core import (AGG_BY, BOOTSTRAP_BATCHES, DATA_DIR, filter_selection,
+                           load_dataset, mapped_dataset, matchup_cube,
+                           season_ci_batches, season_range, selection_distributions,
+                           selection_matchups, selection_regimes, time_pyramid)
+from cricdata.curve_index import CurveIndex
+from cricdata.data_watcher import DataWatcher
+from cricdata.formats import DEFAULT_FORMAT, FORMATS, get_format
+from cricdata.jobs import QUEUED, RUNNING, JobManager, QueueFull, report_progress
+from cricdata.selection_log import SelectionCache, SelectionLog, selection_key
+from cricdata.shared_dataset import SharedData
+
+CHART_CACHE_SIZE = 64  # rendered selections kept per chart (LRU)
+
+
+# %% Part 2: Loading data
+
+def current_format():
+    """ Returns the match format selected in this session (set by app.py). """
+    return st.session_state.get('format', DEFAULT_FORMAT)
+
+@st.cache_resource
+def agg_state(fmt=DEFAULT_FORMAT):
+    """ Function to hold a format's (Season, Batting_Team) aggregate state
+        shared by all sessions. A data refresh only re-aggregates changed
+        innings.
+        Parameters: fmt (str, format name)
+        Returns: IncrementalAggregates
+    """
+    return IncrementalAggregates(by=AGG_BY, size=get_format(fmt).max_balls + 1)
+
+@st.cache_resource
+def csv_dataset(data_file, fmt=DEFAULT_FORMAT):
+    """ Function to load a data file into the tables the pages use, once per
+        process (used until a version is published).
+        Parameters: data_file (str, path of .csv file), fmt (str, format name)
+        Returns: data (dict, see cricdata.core.load_dataset())
+    """
+    return load_dataset(data_file, agg_state(fmt), fmt)
+
+@st.cache_resource
+def shared_data(fmt=DEFAULT_FORMAT):
+    """ Function to follow a format's dataset published by
+        cricdata.shared_dataset.
+        Returns: SharedData (current() is None until a version is published)
+    """
+    return SharedData(get_format(fmt).shared_dir)
+
+@st.cache_resource
+def data_watcher(fmt=DEFAULT_FORMAT):
+    """ Function to start the background watcher that republishes a format's
+        data file to its shared dataset when it changes (one per process and
+        format, started when the format is first selected).
+        Returns: DataWatcher
+    """
+    match_format = get_format(fmt)
+    return DataWatcher(match_format.data_file, match_format.shared_dir,
+                       fmt=fmt).start()
+
+@st.cache_resource(max_entries=2 * len(FORMATS))
+def published_dataset(_shared, version, fmt=DEFAULT_FORMAT):
+    """ Function to collect the tables of a published version, once per
+        version and process. Also syncs the format's aggregate state with it.
+        Parameters: _shared (MappedDataset, not hashed)
+                    version (str, published dataset version)
+                    fmt (str, format name)
+        Returns: data (dict, as csv_dataset())
+    """
+    return mapped_dataset(_shared, agg_state(fmt))
+
+def load_data(fmt=None):
+    """ Function to get the current dataset of a format: the published
+        version, or the data file until a version is published.
+        Parameters: fmt (str, format name, default: current_format())
+        Returns: data (dict, see csv_dataset())
+    """
+    fmt = fmt or current_format()
+    shared = shared_data(fmt).current()
+    if shared is None:
+        return csv_dataset(get_format(fmt).data_file, fmt)
+
+    return published_dataset(shared, shared.version, fmt)
+
+
+# %% Part 3: Selections
+
+def state_version(fmt):
+    """ Returns the data version key of a format: (format, aggregate state
+        version), so cache keys of different formats never collide.
+    """
+    return fmt, agg_state(fmt).version
+
+def current_selection():
+    """ Function to get this session's sidebar selection (set by app.py) on
+        the current aggregate state of its format.
+        Returns: sel_key (tuple, selection_key() on the state_version()),
+                 grp_state (GroupedAggState)
+    """
+    fmt = current_format()
+    teams, start_season, end_season = st.session_state['selection']
+    grp_state, grp_version = agg_state(fmt).snapshot()
+
+    return selection_key((fmt, grp_version), teams, start_season, end_season), grp_state
+
+def selected_seasons(data, sel_key):
+    """ Returns the season names from the selection's start to its end season. """
+    return season_range(data['seasons'], sel_key[2], sel_key[3])
+
+@st.cache_resource
+def selection_cache():
+    """ Function to hold the per-selection results (filtered innings, regimes,
+        distributions) shared by all sessions, keyed by selection_key().
+        Returns: SelectionCache
+    """
+    return SelectionCache()
+
+def selection_calc(df_full, dims, sel_key):
+    """ Function to filter full innings for a sidebar selection (on integer
+        keys, then join names for display).
+        Parameters: df_full (fact DataFrame), dims (dict of DataFrames)
+                    sel_key (tuple, selection_key(): data version, teams,
+                    start and end season)
+        Returns: selection_df (DataFrame, denormalised)
+    """
+    _, teams, start_season, end_season = sel_key
+
+    def compute():
+        return filter_selection(df_full, dims, teams, start_season, end_season)
+
+    return selection_cache().get('selection', sel_key, compute)
+
+def regime_calc(df_in, sel_key):
+    """ Function to detect halfway delivery regime changes (PELT) overall and
+        per team, cached per selection key rather than by hashing the frame.
+        Parameters: df_in (DataFrame, selected innings)
+                    sel_key (tuple, selection_key() of df_in)
+        Returns: df_seg (DataFrame of regimes: Batting_Team, Start, End,
+                 Half_Ball, Count, Half_Del)
+    """
+    return selection_cache().get('regimes', sel_key,
+                                 lambda: selection_regimes(df_in))
+
+def distribution_calc(grp_state, sel_key, seasons):
+    """ Function to merge (Season, Team) sketches into distribution tables for
+        the selected seasons and teams (no sorting of innings rows).
+        Parameters: grp_state (GroupedAggState)
+                    sel_key (tuple, selection_key() on the version of grp_state)
+                    seasons (tuple of selected season names)
+        Returns: df_ssn_dist, df_team_dist, df_team_dens (DataFrames)
+    """
+    return selection_cache().get('distributions', sel_key,
+                                 lambda: selection_distributions(grp_state, seasons,
+                                                                 sel_key[1]))
+
+def matchup_calc(cube, dims, sel_key):
+    """ Function to total the head to head pairs of a selection from the
+        matchup cube (see matchup_index()).
+        Parameters: cube (MatchupCube), dims (dict of DataFrames)
+                    sel_key (tuple, selection_key() on the version of cube)
+        Returns: df_pairs (DataFrame: Batting_Team, Bowling_Team, Count,
+                 Half_Ball, Half_Del)
+    """
+    return selection_cache().get('matchups', sel_key,
+                                 lambda: selection_matchups(cube, dims, *sel_key[1:]))
+
+@st.cache_resource
+def selection_log():
+    """ Function to hold the sidebar selection log shared by all sessions. """
+    return SelectionLog()
+
+@st.cache_resource(max_entries=2)
+def warm_caches(_df_full, _dims, _df_season, version_key):
+    """ Function to precompute the cached views (filtered frame, regimes,
+        distributions, bootstrap jobs) of the most popular logged selections
+        in a background thread, once per data version.
+        Parameters: _df_full, _dims, _df_season (current data, not hashed)
+                    version_key (tuple, state_version()) : data version key
+        Returns: warmed (list of selections, appended as each one finishes)
+    """
+    warmed = []
+    script_ctx_log = logging.getLogger(
+        'streamlit.runtime.scriptrunner_utils.script_run_context')
+
+    def not_warmer(record):
+        # cached functions warn about the missing session in this thread
+        return record.threadName != 'cache-warmer'
+
+    def warm():
+        fmt, version = version_key
+        grp_state, grp_version = agg_state(fmt).snapshot()
+        if grp_version != version:
+            return  # data refreshed again: the next version warms itself
+        for (teams, start, end), _ in selection_log().popular():
+            if start not in _df_season or end not in _df_season or not teams:
+                continue
+            seasons = season_range(_df_season, start, end)
+            sel_key = selection_key(version_key, teams, start, end)
+            regime_calc(selection_calc(_df_full, _dims, sel_key), sel_key)
+            distribution_calc(grp_state, sel_key, seasons)
+            try:
+                season_ci_jobs(grp_state, version_key, seasons, teams)
+            except QueueFull:
+                pass
+            warmed.append((teams, start, end))
+
+    def run():
+        script_ctx_log.addFilter(not_warmer)
+        try:
+            warm()
+        finally:
+            script_ctx_log.removeFilter(not_warmer)
+
+    threading.Thread(target=run, daemon=True, name='cache-warmer').start()
+
+    return warmed
+
+
+# %% Part 4: Background jobs
+
+def session_is_active(session_id):
+    """ Function to check whether a browser session is still connected. """
+    return not runtime.exists() or runtime.get_instance().is_active_session(session_id)
+
+@st.cache_resource
+def job_manager():
+    """ Function to hold the background job executor shared by all sessions.
+        Jobs whose sessions have all ended are cancelled by its reaper thread.
+        Returns: JobManager
+    """
+    manager = JobManager()
+    manager.start_reaper(session_is_active)
+
+    return manager
+
+def season_ci_jobs(grp_state, version_key, seasons, teams):
+    """ Function to submit (or pick up) bootstrap CI jobs of season means for
+        a selection. Resamples are drawn from the merged season sketches.
+        Parameters: grp_state (GroupedAggState)
+                    version_key (tuple, state_version())
+                    seasons, teams (tuples of selected names)
+        Returns: keys (list of job keys, one per batch of seasons)
+    """
+    manager = job_manager()
+    n_batches = min(BOOTSTRAP_BATCHES, len(seasons))
+    keys = [('bootstrap', version_key, seasons, teams, i) for i in range(n_batches)]
+
+    idle = [manager.status(key)[0] not in (QUEUED, RUNNING) for key in keys]
+    if manager.results(keys) is None and any(idle):
+        ctx = get_script_run_ctx()
+        batches = season_ci_batches(grp_state, seasons, teams, n_batches)
+        for key, (batch, seed) in zip(keys, batches):
+            manager.submit(key, bootstrap_ci, batch, seed=seed, name='bootstrap',
+                           owner=ctx.session_id if ctx else None,
+                           progress=report_progress)
+
+    return keys
+
+
+# %% Part 5: Page resources (loaded on first use)
+
+@st.cache_resource
+def innings_index(_df_fact, version_key):
+    """ Function to build the scoring curve index over all innings, once per
+        format and data version.
+        Parameters: _df_fact (DataFrame, all innings, not hashed)
+                    version_key (tuple, state_version()) : data version key
+        Returns: index (CurveIndex)
+    """
+    return CurveIndex(_df_fact, max_balls=get_format(version_key[0]).max_balls)
+
+@st.cache_resource
+def matchup_index(_df_full, _dims, version_key):
+    """ Function to aggregate full innings into the head to head cube, once
+        per format and data version.
+        Parameters: _df_full, _dims (current data, not hashed)
+                    version_key (tuple, state_version()) : data version key
+        Returns: cube (MatchupCube)
+    """
+    return matchup_cube(_df_full, _dims)
+
+@st.cache_resource
+def pyramid_index(_df_full, _dims, version_key):
+    """ Function to aggregate full innings into the multi-resolution time
+        pyramid, once per format and data version.
+        Parameters: _df_full, _dims (current data, not hashed)
+                    version_key (tuple, state_version()) : data version key
+        Returns: pyramid (TimePyramid)
+    """
+    return time_pyramid(_df_full, _dims)
+
+@st.cache_resource
+def match_archive():
+    """ Function to open the ball-by-ball match archive (index only).
+        Returns: archive (MatchArchive) or None if it has not been built
+    """
+    from cricdata.match_archive import ARCHIVE_FILE, MatchArchive
+
+    try:
+        return MatchArchive(ARCHIVE_FILE)
+    except FileNotFoundError:
+        return None
+
+def file_signature(path):
+    """ Returns (size, mtime) of a file, or None if it does not exist. """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+@st.cache_data(max_entries=8)
+def data_file_version(data_file, signature):
+    """ Returns the content version of a data file, hashed again only when
+        its file_signature() changes.
+    """
+    from cricdata.snapshot_store import file_version
+
+    return file_version(data_file)
+
+@st.cache_resource(max_entries=8)
+def trained_model(version, signature):
+    """ Loads a saved model, again whenever its file_signature() changes. """
+    from cricdata import train_model
+
+    return train_model.load_model(version)
+
+def prediction_model(data_file):
+    """ Function to load the final score model trained on the current data
+        file. Only called (and train_model only imported) once the predictions
+        page is opened. A missing model is not cached, so one trained later
+        is picked up on the next rerun.
+        Parameters: data_file (str, path of .csv file)
+        Returns: version (str), model (LinearModel or None), df_cv (DataFrame)
+    """
+    from cricdata.train_model import model_path
+
+    version = data_file_version(data_file, file_signature(data_file))
+    signature = file_signature(model_path(version))
+    if signature is None:
+        return version, None, None
+    model, df_cv = trained_model(version, signature)
+
+    return version, model, df_cv
+
+@st.cache_resource
+def replay_table():
+    """ Function to load the projection lookup table used by match replays. """
+    from cricdata.projection_service import load_table
+
+    return load_table()
+
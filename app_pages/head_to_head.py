@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: app_pages/head_to_head.py
+# Description: Head to head page of the cricdata app
+#
+# Average halfway delivery and innings count of every batting team against
+# every bowling team in the sidebar selection's seasons, totalled from the
+# matchup cube (cricdata.matchups) rather than by regrouping innings rows.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import streamlit as st
+
+from app_data import (CHART_CACHE_SIZE, current_selection, load_data, matchup_calc,
+                      matchup_index)
+from cricdata.charts import matchup_chart
+from cricdata.formats import get_format
+
+
+# %% Part 2: Functions
+
+@st.cache_data(max_entries=CHART_CACHE_SIZE)
+def display_plot7(_df_pairs, chart_key):
+    """ Function to display the Altair head to head heatmap.
+        Parameters: _df_pairs (DataFrame, matchup_calc() table)
+                    chart_key (tuple, selection_key() + opponent choice)
+        Returns: None.
+    """
+    st.altair_chart(matchup_chart(_df_pairs))
+
+
+# current dataset and this session's sidebar selection (set in app.py)
+data = load_data()
+dims = data['dims']
+match_format = get_format(data['format'])
+sel_key, _ = current_selection()
+teams, start_season, end_season = sel_key[1:]
+
+
+# %% Part 3 : Display head to head heatmap
+
+cube = matchup_index(data['full'], dims, sel_key[0])
+df_pairs = matchup_calc(cube, dims, sel_key)
+
+st.header('Head to Head')
+st.write('Average halfway delivery of each selected batting team against each '
+         'bowling team, in ' + match_format.innings_label + ' innings from '
+         + start_season + ' to ' + end_season + ' (cell number: innings)')
+
+all_opponents = st.toggle('All bowling teams', value=False,
+                          help='Off: only opponents among the selected teams')
+if not all_opponents:
+    df_pairs = df_pairs[df_pairs['Bowling_Team'].isin(teams)]
+
+if df_pairs.empty:
+    st.info(':information_source: No innings between the selected teams in these '
+            'seasons.')
+else:
+    display_plot7(df_pairs, sel_key + (all_opponents,))
+    with st.expander(label='Head to head table', expanded=False):
+        st.dataframe(df_pairs.drop(columns='Half_Ball')
+                     .style.format({'Half_Del': '{:.1f}'}),
+                     hide_index=True)
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: app_pages/innings_explorer.py
+# Description: Innings explorer page of the cricdata app
+#
+# The innings of the sidebar selection as an interactive table. Selecting an
+# innings shows its ball-by-ball scorecard from the match archive and the
+# innings whose scoring curves were most similar. The curve index and the
+# archive are only loaded once this page is opened.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import streamlit as st
+
+from app_data import (current_selection, innings_index, load_data, match_archive,
+                      selection_calc)
+from cricdata.charts import curve_chart
+from cricdata.dimensions import denormalise
+from cricdata.formats import get_format
+
+
+# %% Part 2: Functions
+
+def display_plot6(df_curves):
+    """ Function to plot the scoring curve of an innings and its neighbours.
+        Parameters: df_curves (DataFrame: Innings, Balls, Runs, Selected)
+        Returns: None
+    """
+    st.altair_chart(curve_chart(df_curves), use_container_width=True)
+
+def similar_innings_section(df_row):
+    """ Function to display the innings with the most similar scoring curves
+        to the innings selected in the raw data table.
+        Parameters: df_row (DataFrame, the selected innings row)
+    """
+    index = innings_index(df_fact, sel_key[0])
+    match_id, inn_num = df_row['Match_ID'].iloc[0], df_row['Inn_Num'].iloc[0]
+    k = st.slider('Number of similar innings', 3, 15, 5)
+
+    df_sim = index.similar(match_id, inn_num, k)
+    df_show = df_sim.merge(
+        denormalise(df_fact, dims)[['Match_ID', 'Inn_Num', 'Batting_Team',
+                                    'Bowling_Team', 'Season', 'Date', 'Venue',
+                                    'Half_Del', 'Half_Total', 'Final_Del',
+                                    'Final_Total']],
+        on=['Match_ID', 'Inn_Num'], how='left')
+    st.dataframe(df_show.style.format({'Distance': '{:.2f}', 'Half_Del': '{:.1f}',
+                                       'Final_Del': '{:.1f}',
+                                       'Date': '{:%Y-%m-%d}'}),
+                 hide_index=True)
+
+    labels = [row['Batting_Team'] + ' v ' + row['Bowling_Team'] + ' '
+              + '{:%Y-%m-%d}'.format(row['Date'])
+              for row in [df_row.iloc[0]] + [r for _, r in df_show.iterrows()]]
+    positions = [index.position(match_id, inn_num)] \
+        + [index.position(m, i) for m, i in zip(df_sim['Match_ID'], df_sim['Inn_Num'])]
+    df_curves = index.curve_frame(positions, labels=labels)
+    df_curves['Selected'] = df_curves['Innings'] == labels[0]
+    display_plot6(df_curves)
+
+def scorecard_section(match_id, inn_num):
+    """ Function to display the ball-by-ball scorecard of one innings, loaded
+        from the match archive on demand.
+        Parameters: match_id (int), inn_num (int)
+    """
+    from cricdata.match_archive import scorecard
+
+    archive = match_archive()
+    if archive is None:
+        st.info(':information_source: No match archive has been built. Run '
+                '`python -m cricdata build --artifacts archive` with Cricsheet ball-by-ball '
+                'files in data/matches/.')
+        return
+    if match_id not in archive:
+        st.info(':information_source: Match ' + str(match_id)
+                + ' is not in the match archive.')
+        return
+
+    df_bat, df_bowl, df_overs = scorecard(archive.load(match_id), inn_num)
+    col1, col2 = st.columns(2)
+    col1.dataframe(df_bat, hide_index=True)
+    col2.dataframe(df_bowl.style.format({'Overs': '{:.1f}'}), hide_index=True)
+    st.bar_chart(df_overs, x='Over', y='Runs', height=200)
+
+
+# current dataset and this session's sidebar selection (set in app.py)
+data = load_data()
+dims, df_fact = data['dims'], data['fact']
+sel_key, _ = current_selection()
+_, _, start_season, end_season = sel_key
+match_format = get_format(data['format'])
+selection_df = selection_calc(data['full'], dims, sel_key)
+
+
+# %% Part 3 : Display df data
+
+# a row selection reruns only this fragment (table, scorecard, similar innings)
+@st.fragment
+def raw_data_section():
+    with st.container():
+
+        # Display df_cs data
+        with st.expander(label='Show/Hide raw data', expanded=True):
+
+        # if st.checkbox('Show raw data'):
+            st.subheader(':memo: ' + match_format.name + ' innings raw data')
+            st.write('> Explore the data for every ' + match_format.innings_label
+                     + ' innings on selected playing seasons between', start_season,
+                     'and', end_season)
+            st.info(':information_source: This table is interactive.'\
+                    'Select options on the sidebar to customise')
+
+            # Display data table (select a row to find similar innings)
+            raw_table = st.dataframe(selection_df.style.format(
+                                        {'Half_Del': '{:.1f}','Date': '{:%Y-%m-%d}'}),
+                                     on_select='rerun', selection_mode='single-row',
+                                     key='raw_table')
+            # st.write(selection_df)
+
+        # Display innings with the most similar scoring curves
+        selected_rows = raw_table.selection.rows
+        st.subheader(':chart_with_upwards_trend: Similar innings')
+        if selected_rows:
+            df_row = selection_df.iloc[selected_rows]
+            with st.expander(label=':cricket_bat_and_ball: Scorecard', expanded=True):
+                scorecard_section(df_row['Match_ID'].iloc[0], df_row['Inn_Num'].iloc[0])
+            similar_innings_section(df_row)
+        else:
+            st.info(':information_source: Select an innings in the raw data table '\
+                    'to find the innings whose scoring curves were most similar.')
+
+
+raw_data_section()
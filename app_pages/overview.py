@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: app_pages/overview.py
+# Description: Overview page (landing page) of the cricdata app
+#
+# Match counter, the average halfway delivery, and the halfway delivery
+# scatter of the sidebar selection with its regime changes. Only the
+# selection's filtered innings and regimes are computed here, so the landing
+# page does not slow down as analysis pages are added.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+from datetime import datetime
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from app_data import (CHART_CACHE_SIZE, DATA_DIR, current_selection, load_data,
+                      regime_calc, selection_calc)
+from cricdata.charts import scatter_chart
+from cricdata.formats import get_format
+
+
+# %% Part 2: Functions
+
+@st.cache_data(max_entries=CHART_CACHE_SIZE)
+def display_plot1(_df_in2, _dim_team, chart_key, _df_seg=None):
+    """ Function to display Altair scatterplot with ruled line.
+        Parameters: _df_in2 (DataFrame with innings info)
+                    _dim_team (DataFrame, team dimension with colours)
+                    chart_key (tuple, selection_key() + regime view)
+                    _df_seg (DataFrame, regimes from regime_calc(), optional)
+        Returns: None.
+    """
+    st.altair_chart(scatter_chart(_df_in2, _dim_team, _df_seg))
+
+@st.cache_data
+def html_counter(starter, target, label='ODI COUNT'):
+
+    my_html2 = """
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <style>
+                div.a {{
+                  /*white-space: nowrap; */
+                  width: 250px;
+                  overflow: hidden;
+                  text-overflow: clip;
+                  border: 1px solid #000000;
+                  font-family:Verdana;
+                  font-size: 30px
+                }}
+
+                div.b {{
+                  /*white-space: nowrap; */
+                  width: 250px;
+                  overflow: hidden;
+                  text-overflow: clip;
+                  border: 1px solid #000000;
+                  font-family:Verdana;
+                  font-size: 50px
+                }}
+            </style>
+        </head>
+
+        <body style="text-align:left; margin: auto; border: 1px solid #000000;">
+            <div class="a">{2}</div>
+            <div class="b"; id="counter">
+        		<!-- counts -->
+        	</div>
+
+            <script>
+                let counts = setInterval(updated, 50);
+                let starter = {0};
+                const target = {1};
+                let count = document.getElementById("counter");
+
+                function updated() {{
+                    starter += 1;
+                    count.innerHTML = starter;
+
+                    if (starter === target) {{
+                        clearInterval(counts);
+                    }}
+                }}
+            </script>
+        </body>
+        </html>
+        """.format(starter, target, label)
+
+    return my_html2
+
+
+# %% Part 3: Opening Paragraph & Instructions
+
+# current dataset and this session's sidebar selection (set in app.py)
+data = load_data()
+dims = data['dims']
+match_format = get_format(data['format'])
+sel_key, _ = current_selection()
+_, _, start_season, end_season = sel_key
+selection_df = selection_calc(data['full'], dims, sel_key)
+
+if match_format.name == 'ODI':
+    """
+    # ODI Cricket : The 30 Over Prediction 🏏
+    ### The common assumption when watching an ODI match is that the score at \
+    (or around) the 30 over mark can be doubled to predict the final score at the \
+    50 over mark. But is this accurate and is it a stable trend?
+
+    The following analysis uses match data starting from the 2003-2004 season \
+    till the present to answer this question.
+    """
+else:
+    st.markdown('# {} Cricket : The Halfway Delivery 🏏\n'
+                '### How far into a {} innings is half of the final score '
+                'reached, and is it a stable trend?'.format(match_format.name,
+                                                            match_format.innings_label))
+
+"""
+N.B. Afghanistan matches are missing from the source data.
+*[Explanation for withholding of Afghanistani matches](https://cricsheet.org/article/explanation-for-withholding-of-afghanistani-matches/)*
+"""
+
+
+# %% Part 4 : Stats Columns
+
+# calc match stats
+match_count = data['fact']['Match_ID'].nunique()
+
+st.subheader('Stats')
+components.html(html_counter(match_count - 50, match_count,
+                             match_format.name + ' COUNT'), width=250, height=120,)
+
+st.header('_Avg Halfway Delivery_')
+st.header('_{}_'.format(float(data['all_avg_ihd'])) )
+
+
+# %% Part 5 : Display selection info & Instructons
+
+# find max (latest available match) date/teams/venue
+last_inn = data['last_inn']
+max_date = datetime.strftime(last_inn['Date'], '%b %d, %Y')
+
+# Display config info selected in sidebar form
+latest_match = ':information_source: Latest available match: **' \
+            + last_inn['Batting_Team'] + '** vs **' + last_inn['Bowling_Team'] \
+            + '** at **'+ last_inn['Venue'] + '** on '+ max_date
+
+selected_seasons = ':calendar: You selected playing seasons between **' \
+                    + start_season + '** and **'+ end_season + '**'
+
+st.info(latest_match + '\n\n' + selected_seasons)
+
+with st.container():
+
+    # Display df_cs data
+    with st.expander(label='Instructions  &  Definitions', expanded=False):
+        """### :information_source: Instructions:"""
+        st.markdown('- Make selections for seasons and teams on the User Input sidebar to the left')
+        st.markdown('- Your selections update the interactive graphs and the table '\
+                    'on the Innings Explorer page')
+
+        """### :book: Definitions:"""
+        st.markdown('+ Halfway Delivery:')
+        st.markdown('Delivery at which half of all runs for that innings \
+            were scored. e.g. If the innings score after 50 overs was 200 runs \
+            and 100 runs were scored after 30.1 overs then 30.1 overs is the \
+            halfway delivery number.')
+        st.markdown(r'+ Full Innings \ Completed Innings:')
+        st.markdown(match_format.definition)
+
+
+# %% Part 6 : Display visualisations - Plot 1 & Infographic Image
+
+st.header('Average Delivery Number')
+st.write('Delivery Number at halfway point of a {} innings'.format(
+    match_format.innings_label))
+
+# the regime view only reruns this fragment, not the page
+@st.fragment
+def scatter_section():
+    regime_view = st.radio('Regime changes (PELT change-point detection):',
+                           ['Overall', 'Per team', 'Off'], horizontal=True)
+    df_regimes = None
+    if regime_view != 'Off':
+        df_regimes = regime_calc(selection_df, sel_key)
+        is_overall = df_regimes['Batting_Team'] == 'All'
+        df_regimes = df_regimes[is_overall if regime_view == 'Overall' else ~is_overall]
+
+    display_plot1(selection_df, dims['team'], sel_key + (regime_view,), df_regimes)
+
+scatter_section()
+
+
+# the rule changes and the infographic are about ODI data
+if match_format.name == 'ODI':
+    st.header('New Balll and Powerplay Rule Changes')
+    st.subheader(data['all_avg_ihd'] + ' overs are bowled on average before the halfway '\
+                 'mark (in terms of final score) is reached in a completed 50 over '\
+                 'innings. But this mark has varied over time. The peak was '\
+                 'around the 2014-2015 season and continued to the 2015 World Cup. '\
+                 'After the dropping of the Batting Powerplay rule the averages declined again.')
+    """> *[wikipedia: Powerplay(cricket)](https://en.wikipedia.org/wiki/Powerplay_(cricket))*"""
+
+    st.image(DATA_DIR + 'avg_halfway_del+PP+NB.png')
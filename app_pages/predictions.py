@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: app_pages/predictions.py
+# Description: Predictions page of the cricdata app
+#
+# The final score predictor (prediction at halfway, 25 overs) and the
+# ball-by-ball match replay with live score projections. The model and the projection table are
+# only loaded once this page is opened.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import pandas as pd
+import streamlit as st
+
+from app_data import current_format, load_data, prediction_model, replay_table
+from cricdata.charts import projection_chart
+from cricdata.formats import get_format
+
+# overs bowled at halfway of an ODI innings (train_model.MID_BALL, without
+# importing the model code before the predictor is opened)
+MID_OVERS = get_format('ODI').max_balls // 2 // 6
+
+
+# %% Part 2: Functions
+
+def prediction_section():
+    """ Function to display the final score predictor inputs and output. """
+    version, model, df_cv = prediction_model(get_format('ODI').data_file)
+    if model is None:
+        st.warning(':warning: No model has been trained for this data (version '
+                   + version + '). Run `python -m cricdata build --artifacts model` to '
+                   'train one.')
+        return
+
+    from cricdata.train_model import MID_COLUMNS
+
+    # only what is known at halfway (train_model.MID_BALL) is asked for; the
+    # score inputs are disabled for models trained without them
+    has_mid = set(MID_COLUMNS) <= set(model.numeric)
+    col1, col2, col3 = st.columns(3)
+    mid_runs = col1.number_input('Runs after {} overs'.format(MID_OVERS), 0, 300, 125,
+                                 disabled=not has_mid)
+    mid_wickets = col2.slider('Wickets after {} overs'.format(MID_OVERS), 0, 9, 3,
+                              disabled=not has_mid)
+    inn_num = col3.radio('Innings', [1, 2], horizontal=True)
+    venue = col1.selectbox('Venue', dims['venue']['Venue'])
+    season = col2.selectbox('Season', df_season, index=len(df_season) - 1)
+
+    df_query = pd.DataFrame({'Mid_Runs': [mid_runs], 'Mid_Wickets': [mid_wickets],
+                             'Inn_Num': [inn_num], 'Venue': [venue],
+                             'Season': [season]})
+    predicted = float(model.predict(df_query)[0])
+
+    if not has_mid:
+        st.caption(':information_source: The ' + model.name + ' model was trained '
+                   'without halfway scores (no ball-by-ball files in data/matches/), '
+                   'so it predicts from the innings, venue and season only.')
+    st.metric(label='Predicted final score (' + model.name + ')',
+              value='{:.0f}'.format(predicted),
+              delta='{:+.0f} vs. doubling'.format(predicted - 2 * mid_runs)
+                    if has_mid else None)
+    st.caption('Season-blocked cross-validation (runs): '
+               + ', '.join('{} MAE {:.1f}'.format(name, row['mae'])
+                           for name, row in df_cv.iterrows()))
+
+def display_plot5(df_hist):
+    """ Function to plot running and projected totals of replayed innings.
+        Parameters: df_hist (DataFrame: Innings, Balls, Runs, Projected)
+        Returns: None
+    """
+    st.altair_chart(projection_chart(df_hist), use_container_width=True)
+
+def replay_section():
+    """ Function to display the ball-by-ball replay controls and live view.
+        Matches are replayed from Cricsheet ball-by-ball csv files in
+        MATCH_DIR or uploaded ones. The replay state lives in the session.
+    """
+    import os
+    from cricdata.ball_stream import MATCH_DIR, ReplayHub, match_files, read_deliveries
+
+    files = match_files()
+    chosen = st.multiselect('Matches in ' + MATCH_DIR, files, default=files[:4],
+                            format_func=os.path.basename)
+    uploads = st.file_uploader('Or upload Cricsheet ball-by-ball csv files',
+                               type='csv', accept_multiple_files=True)
+    col1, col2 = st.columns(2)
+    speed = col1.slider('Deliveries per second (each match)', 1, 30, 6)
+    if col2.button('Start replay', disabled=not (chosen or uploads)):
+        hub = ReplayHub(replay_table())
+        for source in list(chosen) + list(uploads):
+            hub.add(read_deliveries(source))
+        st.session_state['replay_hub'] = hub
+
+    hub = st.session_state.get('replay_hub')
+    if hub is None:
+        st.info(':information_source: Choose matches and press Start replay. '
+                'Ball-by-ball files are available from '
+                '[Cricsheet](https://cricsheet.org/downloads/) (CSV format).')
+        return
+    playing = not hub.finished
+
+    # one tick per second while any match is still being replayed
+    @st.fragment(run_every=1 if playing else None)
+    def live_replay():
+        hub.tick(speed)
+        df_live = hub.frame()
+        st.dataframe(df_live.drop(columns=['Match_ID']).style.format(
+                        {'Projected': '{:.0f}', 'Low': '{:.0f}', 'High': '{:.0f}',
+                         'Half_Del': '{:.1f}', 'Half_Ball': '{:.0f}'}),
+                     hide_index=True)
+        display_plot5(pd.DataFrame(
+            [(tracker.batting_team + ' (' + str(tracker.match_id) + ')',)
+             + point for tracker in hub.trackers() for point in tracker.history],
+            columns=['Innings', 'Balls', 'Runs', 'Projected']))
+        if playing and hub.finished:
+            st.rerun()  # stop the timer
+
+    live_replay()
+
+
+# the model and the projection table are built from ODI innings, so this
+# page uses the ODI dataset whatever format the sidebar selects
+data = load_data('ODI')
+dims, df_season = data['dims'], data['seasons']
+if current_format() != 'ODI':
+    st.info(':information_source: Predictions and replays are for ODI innings '
+            '(the sidebar selects ' + get_format(current_format()).title + ').')
+
+
+# %% Part 3 : Display final score prediction (model loaded on demand)
+
+st.header('The {} Over Prediction'.format(MID_OVERS))
+
+# predictor inputs rerun only this fragment
+@st.fragment
+def prediction_panel():
+    if st.toggle('Open the final score predictor', value=False):
+        prediction_section()
+
+prediction_panel()
+
+
+# %% Part 4 : Display ball-by-ball match replay (live feed stand-in)
+
+st.header('Live Match Replay')
+st.write('Replays matches ball by ball with the score projection and the '\
+         'halfway delivery estimate updated after every delivery')
+
+# replay controls rerun only this fragment (the live view is a nested fragment)
+@st.fragment
+def replay_panel():
+    if st.toggle('Open the match replay', value=False):
+        replay_section()
+
+replay_panel()
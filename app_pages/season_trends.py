@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: app_pages/season_trends.py
+# Description: Season trends page of the cricdata app
+#
+# Halfway delivery distributions by season and by team, merged from the
+# (Season, Team) sketches of the sidebar selection, season averages with
+# bootstrap confidence intervals computed by background jobs, and trends by
+# month, season, calendar year or rolling innings window read from the time
+# pyramid (cricdata.time_pyramid).
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import streamlit as st
+
+from app_data import (CHART_CACHE_SIZE, current_selection, distribution_calc,
+                      job_manager, load_data, pyramid_index, season_ci_jobs,
+                      selected_seasons)
+from cricdata.bootstrap import combine_bootstrap
+from cricdata.charts import (season_avg_chart, season_dist_chart, team_violin_chart,
+                             trend_chart)
+from cricdata.core import selection_rolling, selection_trend
+from cricdata.formats import get_format
+from cricdata.jobs import QueueFull
+from cricdata.time_pyramid import ROLLING_WINDOWS
+
+# trend granularities: display name -> pyramid level (None: rolling innings)
+GRANULARITIES = {'Season': 'Season', 'Calendar year': 'Year', 'Month': 'Month',
+                 'Rolling innings': None}
+
+
+# %% Part 2: Functions
+
+@st.cache_data(max_entries=CHART_CACHE_SIZE)
+def display_plot2(_df_in3, chart_key, _df_ci=None, overs=50):
+    """ Function to display Altair line and bar graph plots.
+        Parameters: _df_in3 (DataFrame with innings info grouped by season)
+                    chart_key (tuple, selection_key() + whether CIs are shown)
+                    _df_ci (DataFrame, bootstrap CIs by season, optional)
+                    overs (int, over limit of the format, sets the axis)
+        Returns: None.
+    """
+    st.altair_chart(season_avg_chart(_df_in3, _df_ci, overs))
+
+@st.cache_data(max_entries=CHART_CACHE_SIZE)
+def display_plot3(_df_in4, chart_key):
+    """ Function to display Altair box plot with percentile band by season.
+        Parameters: _df_in4 (DataFrame, season distribution_calc() table)
+                    chart_key (tuple, selection_key())
+        Returns: None.
+    """
+    st.altair_chart(season_dist_chart(_df_in4))
+
+@st.cache_data(max_entries=CHART_CACHE_SIZE)
+def display_plot4(_df_in5, _dim_team, chart_key):
+    """ Function to display Altair violin plots by batting team.
+        Parameters: _df_in5 (DataFrame, team density table from distribution_calc())
+                    _dim_team (DataFrame, team dimension with colours)
+                    chart_key (tuple, selection_key())
+        Returns: None.
+    """
+    st.altair_chart(team_violin_chart(_df_in5, _dim_team))
+
+@st.cache_data(max_entries=CHART_CACHE_SIZE)
+def display_plot8(_df_trend, _dim_team, chart_key, x, tooltip):
+    """ Function to display Altair trend lines by batting team.
+        Parameters: _df_trend (DataFrame, selection_trend() or
+                    selection_rolling() table)
+                    _dim_team (DataFrame, team dimension with colours)
+                    chart_key (tuple, selection_key() + granularity options)
+                    x (str, date column), tooltip (tuple of extra columns)
+        Returns: None.
+    """
+    st.altair_chart(trend_chart(_df_trend, _dim_team, x, tooltip))
+
+
+# current dataset and this session's sidebar selection (set in app.py)
+data = load_data()
+dims = data['dims']
+sel_key, grp_state = current_selection()
+grp_version = sel_key[0]
+
+
+# %% Part 3 : Display distributions - Box/Percentile Bands & Violins
+
+selected_season_list = selected_seasons(data, sel_key)
+df_ssn_dist, df_team_dist, df_team_dens = distribution_calc(
+    grp_state, sel_key, selected_season_list)
+
+st.header('Halfway Delivery Distribution')
+st.write('Spread of the halfway delivery for the selected seasons and teams '\
+         '(box: 25th-75th percentile, band: 10th-90th percentile)')
+
+tab_season, tab_team = st.tabs(['By Season', 'By Team'])
+with tab_season:
+    display_plot3(df_ssn_dist, sel_key)
+with tab_team:
+    display_plot4(df_team_dens, dims['team'], sel_key)
+    st.dataframe(df_team_dist.style.format(precision=1), hide_index=True)
+
+
+# %% Part 4 : Display season averages with bootstrap confidence intervals
+
+st.header('Season Averages')
+st.write('Average halfway delivery by season for the selected teams, with '\
+         '95% bootstrap confidence intervals (10,000 resamples)')
+
+df_ssn_sel = df_ssn_dist[['Season', 'Mean', 'Count']] \
+             .rename(columns={'Mean': 'Half_Del'})
+try:
+    ci_keys = season_ci_jobs(grp_state, grp_version, selected_season_list, sel_key[1])
+except QueueFull:
+    ci_keys = None
+    st.warning('The server is busy - confidence intervals will be added later.')
+ci_errors = [] if ci_keys is None else job_manager().errors(ci_keys)
+ci_pending = ci_keys is not None and not ci_errors \
+             and job_manager().results(ci_keys) is None
+
+# poll the job executor until the intervals are ready or a job has failed
+# (script never waits)
+@st.fragment(run_every=1 if ci_pending else None)
+def season_averages():
+    df_ci = None
+    if ci_keys is not None:
+        frames = job_manager().results(ci_keys)
+        if frames is not None:
+            df_ci = combine_bootstrap(frames)
+            if ci_pending:
+                st.rerun()
+        else:
+            errors = job_manager().errors(ci_keys)
+            if errors:
+                st.warning('Confidence intervals could not be computed ({}: {}).'.format(
+                    type(errors[0]).__name__, errors[0]))
+                if ci_pending:
+                    st.rerun()   # rerun the page to stop polling
+            else:
+                status = [job_manager().status(key) for key in ci_keys]
+                st.progress(sum(progress for _, progress in status) / len(status),
+                            text=':hourglass: computing confidence intervals...')
+    display_plot2(df_ssn_sel, sel_key + (df_ci is not None,), df_ci,
+                  get_format(data['format']).overs)
+
+season_averages()
+
+
+# %% Part 5 : Display trends by month, season, calendar year or rolling innings
+
+st.header('Trends Over Time')
+st.write('Average halfway delivery of the selected teams by time period, or '\
+         'over each team\'s last innings (rolling window)')
+
+pyramid = pyramid_index(data['full'], dims, grp_version)
+
+# the granularity and its option only rerun this fragment, not the page
+@st.fragment
+def trend_section():
+    col_granularity, col_option = st.columns([3, 2])
+    granularity = col_granularity.radio('Granularity', list(GRANULARITIES),
+                                        horizontal=True, key='trend_granularity')
+    level = GRANULARITIES[granularity]
+    if level is None:
+        window = col_option.select_slider('Innings per window', ROLLING_WINDOWS,
+                                          value=ROLLING_WINDOWS[1])
+        df_trend = selection_rolling(pyramid, dims, window, *sel_key[1:])
+        chart_key, x, tooltip = sel_key + (granularity, window), 'Date', ('Date', 'Innings')
+    else:
+        combine = col_option.toggle('Combine selected teams', value=False)
+        df_trend = selection_trend(pyramid, dims, level, *sel_key[1:], combine)
+        chart_key, x, tooltip = sel_key + (granularity, combine), 'Start', ('Period', 'Count')
+
+    if df_trend.empty:
+        st.info(':information_source: Not enough innings of the selected teams for '
+                'this view.')
+    else:
+        display_plot8(df_trend, dims['team'], chart_key, x, tooltip)
+
+trend_section()
+
+
+# %% Part 6 : Display background job metrics
+
+with st.expander(label='Background jobs', expanded=False):
+    st.dataframe(job_manager().metrics().style.format(
+                    {'progress': '{:.0%}', 'wait_s': '{:.2f}', 'run_s': '{:.2f}'}),
+                 hide_index=True)
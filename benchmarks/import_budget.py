@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: import_budget.py
+# Description: Import-time report and budget check for the app's cold start
+#
+# Collects the module-level imports of the entrypoint (app.py) and of every
+# page in app_pages/, then imports them in fresh interpreters with
+# `python -X importtime`. Streamlit and pandas are imported first as the
+# baseline every worker pays anyway. The time spent on the app's own imports
+# after that is reported (median of --runs), with the modules that cost the
+# most.
+#
+# Exits with status 1 when that time is over the budget, or when a module
+# that should only be imported on first use (LAZY_MODULES) is imported at
+# startup. tests/test_import_budget.py runs both checks under pytest.
+#
+# Usage (from the repo root):
+#   python benchmarks/import_budget.py [--runs 5] [--budget-ms 150] [--report FILE]
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+import ast
+import glob
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+ENTRYPOINTS = ['app.py'] + sorted(glob.glob(os.path.join(ROOT, 'app_pages', '*.py')))
+
+BASELINE = ['streamlit', 'pandas']
+BUDGET_MS = 150         # app-owned import time at startup (after the baseline)
+RUNS = 5
+TOP_N = 10              # heaviest modules listed in the report
+MARKER = '### baseline imported'
+
+# imported on first use only (charts, models, replay, archive)
+LAZY_MODULES = {'altair', 'vega_datasets', 'sklearn', 'scipy', 'matplotlib',
+                'cricdata.train_model', 'cricdata.projection_service',
+                'cricdata.ball_stream', 'cricdata.match_archive'}
+
+
+# %% Part 2: Measuring
+
+def startup_imports(paths=ENTRYPOINTS):
+    """ Function to collect the module-level imports of the app scripts.
+        Parameters: paths (list of str, relative to ROOT or absolute)
+        Returns: modules (list of dotted module names, in first seen order)
+    """
+    modules = []
+    for path in paths:
+        with open(os.path.join(ROOT, path), encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+        for node in tree.body:      # top level only: function imports are lazy
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0:
+                names = [node.module]
+            else:
+                continue
+            modules += [name for name in names if name not in modules]
+
+    return modules
+
+def parse_importtime(stderr):
+    """ Function to parse `-X importtime` output after the baseline marker.
+        Parameters: stderr (str)
+        Returns: rows (list of (module, self_us, cumulative_us, depth))
+    """
+    rows, after = [], False
+    for line in stderr.splitlines():
+        if line == MARKER:
+            after = True
+        elif after and line.startswith('import time:') and 'self [us]' not in line:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+
+    return rows
+
+def measure(modules, baseline=BASELINE):
+    """ Function to import modules in a fresh interpreter after the baseline.
+        Returns: total_ms (float, app-owned import time), rows (parse_importtime())
+    """
+    code = '\n'.join(['import sys'] + ['import ' + name for name in baseline]
+                     + ['sys.stderr.write({!r})'.format(MARKER + '\n')]
+                     + ['import ' + name for name in modules])
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError('import failed:\n' + proc.stderr[-2000:])
+    rows = parse_importtime(proc.stderr)
+
+    return sum(row[2] for row in rows if row[3] == 0) / 1000, rows
+
+
+# %% Part 3: Report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import-time budget of the app')
+    parser.add_argument('--runs', type=int, default=RUNS)
+    parser.add_argument('--budget-ms', type=float, default=BUDGET_MS)
+    parser.add_argument('--report', help='write the raw importtime rows (csv) to FILE')
+    args = parser.parse_args(argv)
+
+    modules = [name for name in startup_imports()
+               if name.split('.')[0] not in BASELINE]
+    results = [measure(modules) for _ in range(args.runs)]
+    total_ms = statistics.median(total for total, _ in results)
+    rows = results[0][1]
+
+    print('startup imports: ' + ', '.join(modules))
+    print('app-owned import time: {:.1f} ms (median of {}, budget {:.0f} ms)'.format(
+        total_ms, args.runs, args.budget_ms))
+    print('\n{:>10} {:>10}  module'.format('self ms', 'cum. ms'))
+    for name, self_us, cumulative_us, _ in sorted(rows, key=lambda row: -row[1])[:TOP_N]:
+        print('{:10.1f} {:10.1f}  {}'.format(self_us / 1000, cumulative_us / 1000, name))
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            f.write('module,self_us,cumulative_us,depth\n')
+            f.writelines('{},{},{},{}\n'.format(*row) for row in rows)
+
+    eager = sorted({lazy for name, *_ in rows for lazy in LAZY_MODULES
+                    if name == lazy or name.startswith(lazy + '.')})
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append('import time {:.1f} ms is over the {:.0f} ms budget'.format(
+            total_ms, args.budget_ms))
+    if eager:
+        failures.append('imported at startup (should be lazy): ' + ', '.join(eager))
+    for failure in failures:
+        print('FAIL: ' + failure)
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: loadtest_aggregates.py
+# Description: Load test for the aggregates API
+#
+# Starts cricdata.aggregates_api on a free local port (or targets --url;
+# the dataset is published first if nothing is), then measures throughput
+# and per-request latency from concurrent keep-alive clients for: cached
+# JSON and Arrow bodies, innings pages of many selections, and revalidations
+# answered with 304 Not Modified.
+#
+# Usage (from the repo root):
+#   python benchmarks/loadtest_aggregates.py [--clients 8] [--seconds 5]
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from cricdata import aggregates_api  # noqa: E402
+from cricdata.formats import DEFAULT_FORMAT, FORMATS, get_format  # noqa: E402
+from cricdata.shared_dataset import current_version, publish  # noqa: E402
+
+
+# %% Part 2: Clients
+
+def innings_paths(summary, n, seed=0):
+    """ Function to draw innings page requests over random selections
+        (1-4 teams, a random season range, one of the first pages).
+    """
+    rng = np.random.default_rng(seed)
+    seasons, teams = summary['seasons'], summary['teams']
+    paths = []
+    for _ in range(n):
+        start, end = sorted(rng.integers(0, len(seasons), 2))
+        picked = rng.choice(teams, rng.integers(1, 5), replace=False)
+        paths.append('/innings?' + urlencode({'teams': ','.join(picked),
+                                              'start': seasons[start],
+                                              'end': seasons[end],
+                                              'offset': 50 * int(rng.integers(0, 3)),
+                                              'limit': 50}))
+    return paths
+
+def run_client(host, port, paths, headers, deadline, latencies, statuses):
+    conn = http.client.HTTPConnection(host, port)
+    i = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        conn.request('GET', paths[i % len(paths)], headers=headers)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+        i += 1
+    conn.close()
+
+def load(host, port, paths, clients, seconds, headers=None):
+    """ Function to request paths round robin from concurrent clients.
+        Returns: latencies (ndarray, seconds), statuses (dict of counts)
+    """
+    deadline = time.perf_counter() + seconds
+    per_client = [[] for _ in range(clients)]
+    statuses = [{} for _ in range(clients)]
+    threads = [threading.Thread(target=run_client,
+                                args=(host, port, paths[i::clients] or paths,
+                                      headers or {}, deadline, per_client[i],
+                                      statuses[i]))
+               for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total = {}
+    for counts in statuses:
+        for status, n in counts.items():
+            total[status] = total.get(status, 0) + n
+    return np.concatenate([np.asarray(l) for l in per_client]), total
+
+def cold_pass(host, port, paths):
+    """ Function to request every path once (each is rendered, then cached).
+        Returns: latencies (ndarray, seconds), statuses (dict of counts)
+    """
+    conn = http.client.HTTPConnection(host, port)
+    latencies, statuses = [], {}
+    for path in paths:
+        start = time.perf_counter()
+        conn.request('GET', path)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+    conn.close()
+    return np.asarray(latencies), statuses
+
+def report(label, latencies, seconds, statuses):
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    print('{:<30} {:>8,.0f} req/s   p50 {:.3f} ms   p99 {:.3f} ms   {}'.format(
+        label, len(latencies) / seconds, p50, p99,
+        ' '.join('{}x{}'.format(n, status) for status, n in sorted(statuses.items()))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Aggregates API load test')
+    parser.add_argument('--url', help='running service (default: start one)')
+    parser.add_argument('--format', default=DEFAULT_FORMAT, choices=list(FORMATS))
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--selections', type=int, default=200,
+                        help='distinct innings pages requested')
+    args = parser.parse_args(argv)
+
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        shared_dir = get_format(args.format).shared_dir
+        if current_version(shared_dir) is None:
+            print('published', publish(fmt=args.format))
+        server = aggregates_api.make_server(port=0, shared_dir=shared_dir)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+
+    conn = http.client.HTTPConnection(host, port)
+    conn.request('GET', '/summary')
+    response = conn.getresponse()
+    summary = json.loads(response.read())
+    etag = response.getheader('ETag')
+    conn.close()
+    print('dataset {}: {} innings, {} teams'.format(
+        summary['version'], summary['innings'], len(summary['teams'])))
+
+    paths = innings_paths(summary, args.selections)
+    # the first pass renders (and caches) every page, later ones are lookups
+    start = time.perf_counter()
+    latencies, statuses = cold_pass(host, port, paths)
+    report('innings pages, first request', latencies, time.perf_counter() - start,
+           statuses)
+
+    for label, run_paths, headers in [
+            ('summary (JSON)', ['/summary'], None),
+            ('seasons (Arrow)', ['/seasons?format=arrow'], None),
+            ('innings pages', paths, None),
+            ('innings pages, 304', paths, {'If-None-Match': etag})]:
+        latencies, statuses = load(host, port, run_paths, args.clients, args.seconds,
+                                   headers)
+        report('{}, {} clients'.format(label, args.clients), latencies, args.seconds,
+               statuses)
+
+
+if __name__ == '__main__':
+    main()
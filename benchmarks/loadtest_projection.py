@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: loadtest_projection.py
+# Description: Load test for the projection service
+#
+# Starts projection_service on a free local port (or targets --url), then
+# measures throughput and per-request latency of single GET queries from
+# concurrent keep-alive clients, of batched POST queries, and of the
+# in-process API for comparison.
+#
+# Usage (from the repo root):
+#   python benchmarks/loadtest_projection.py [--clients 8] [--seconds 5]
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from cricdata import projection_service  # noqa: E402
+
+
+# %% Part 2: Clients
+
+def random_queries(n, seed=0):
+    """ Function to draw (runs, balls) pairs spread over an innings. """
+    rng = np.random.default_rng(seed)
+    balls = rng.integers(1, 301, n)
+    runs = np.rint(balls * rng.uniform(0.6, 1.2, n))
+    return np.column_stack([runs, balls])
+
+def run_get_client(host, port, queries, deadline, latencies):
+    conn = http.client.HTTPConnection(host, port)
+    i = 0
+    while time.perf_counter() < deadline:
+        runs, balls = queries[i % len(queries)]
+        start = time.perf_counter()
+        conn.request('GET', '/project?runs={:.0f}&balls={:.0f}'.format(runs, balls))
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        i += 1
+    conn.close()
+
+def load_get(host, port, clients, seconds):
+    """ Function to hammer GET /project from concurrent clients.
+        Returns: n (int, requests), latencies (ndarray, seconds)
+    """
+    deadline = time.perf_counter() + seconds
+    per_client = [[] for _ in range(clients)]
+    threads = [threading.Thread(target=run_get_client,
+                                args=(host, port, random_queries(1000, seed=i),
+                                      deadline, per_client[i]))
+               for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies = np.concatenate([np.asarray(l) for l in per_client])
+    return len(latencies), latencies
+
+def load_post(host, port, batch, seconds):
+    """ Function to send batched POST /project requests from one client.
+        Returns: n (int, queries answered), elapsed (float, seconds)
+    """
+    body = json.dumps({'queries': random_queries(batch).tolist()})
+    conn = http.client.HTTPConnection(host, port)
+    n, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        conn.request('POST', '/project', body,
+                     {'Content-Type': 'application/json'})
+        conn.getresponse().read()
+        n += batch
+    conn.close()
+    return n, time.perf_counter() - start
+
+def report(label, n, elapsed, latencies=None):
+    line = '{:<28} {:>10,.0f} queries/s'.format(label, n / elapsed)
+    if latencies is not None and len(latencies):
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        line += '   p50 {:.3f} ms   p99 {:.3f} ms'.format(p50, p99)
+    print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Projection service load test')
+    parser.add_argument('--url', help='running service (default: start one)')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--batch', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    table = projection_service.load_table()
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        server = projection_service.make_server(port=0, table=table)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+
+    # in-process API: the floor the HTTP paths are measured against
+    queries = random_queries(100000)
+    start = time.perf_counter()
+    table.project(queries[:, 0], queries[:, 1])
+    report('in-process (vectorized)', len(queries), time.perf_counter() - start)
+
+    n, latencies = load_get(host, port, args.clients, args.seconds)
+    report('GET, {} clients'.format(args.clients), n, args.seconds, latencies)
+
+    n, elapsed = load_post(host, port, args.batch, args.seconds)
+    report('POST, {} per batch'.format(args.batch), n, elapsed)
+
+
+if __name__ == '__main__':
+    main()
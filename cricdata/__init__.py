@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/__init__.py
+# Description: Compute layer of the cricdata app, importable without Streamlit
+#
+#   core      dataset loading and per-selection calculations
+#   charts    Altair chart builders
+#   report    per-selection reports (tables, chart specs, summary)
+#   bundle    static pre-rendered bundle of the landing view
+#   aggregates_api  read-only HTTP API of the aggregates
+#   cli       batch command line: python -m cricdata build|report|bundle
+#
+# plus the modules they build on (match formats, aggregate state, dimensions,
+# distributions, head to head matchups, time pyramid, bootstrap, change
+# points, curve index, snapshots, shared dataset, jobs, model training,
+# projections, replays and the match archive).
+#
+# Submodules are imported explicitly (from cricdata.core import ...), so
+# importing the package itself costs nothing.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+__version__ = '1.0'
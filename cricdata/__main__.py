@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/__main__.py
+# Description: Entry point of `python -m cricdata` (see cli.py)
+#
+# @author: 18HIAGC
+# =============================================================================
+
+import sys
+
+from cricdata.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
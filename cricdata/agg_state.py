@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/agg_state.py
+# Description: Mergeable aggregate state for season and team statistics
+#
+# An AggState holds count, sum, sum of squares, min/max and a ball histogram
+# for a set of Half_Ball values. States merge by addition, so season, team
+# and overall figures are roll-ups of the finest (Season, Team) grain, and a
+# data refresh only touches the groups whose innings were added or changed.
+#
+# The histogram doubles as the quantile sketch: Half_Ball is an integer ball
+# number in [0, 300], so one counter per ball gives exact quantiles (rank and
+# value error 0) in a fixed 301 counters per group, whatever the row count.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+MAX_BALLS = 300  # histogram covers ball numbers 0..MAX_BALLS
+
+
+# %% Part 2: Aggregate state
+
+class AggState:
+    """ Mergeable summary (count, sum, sum of squares, min, max, histogram)
+        of a set of integer ball numbers.
+    """
+    __slots__ = ('count', 'total', 'total_sq', 'min', 'max', 'hist')
+
+    def __init__(self, size=MAX_BALLS + 1):
+        self.count = 0
+        self.total = 0
+        self.total_sq = 0
+        self.min = None
+        self.max = None
+        self.hist = np.zeros(size, dtype=np.int32)
+
+    @classmethod
+    def from_values(cls, values, size=MAX_BALLS + 1):
+        """ Function to build a state from an array of ball numbers.
+            Parameters: values (array-like of int), size (int, histogram bins)
+            Returns: state (AggState)
+        """
+        values = np.asarray(values, dtype=np.int64)
+        state = cls(size)
+        if len(values):
+            state.count = int(len(values))
+            state.total = int(values.sum())
+            state.total_sq = int((values * values).sum())
+            state.min = int(values.min())
+            state.max = int(values.max())
+            state.hist = np.bincount(np.clip(values, 0, size - 1),
+                                     minlength=size).astype(np.int32)
+        return state
+
+    def freeze(self):
+        """ Makes the histogram read-only, so a state shared between
+            published versions fails loudly on an in-place merge.
+        """
+        self.hist.flags.writeable = False
+        return self
+
+    def copy(self):
+        state = AggState(len(self.hist))
+        state.count, state.total, state.total_sq = \
+            self.count, self.total, self.total_sq
+        state.min, state.max = self.min, self.max
+        state.hist = self.hist.copy()
+        return state
+
+    # ---- merge --------------------------------------------------------------
+
+    def merge(self, other):
+        """ Adds another state into this one (in place) and returns self. """
+        self.hist += other.hist
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def subtract(self, other):
+        """ Removes a subset's state from this one (in place) and returns
+            self. min/max are recovered from the histogram.
+        """
+        self.hist -= other.hist
+        self.count -= other.count
+        self.total -= other.total
+        self.total_sq -= other.total_sq
+        nonzero = np.flatnonzero(self.hist)
+        if len(nonzero):
+            self.min, self.max = int(nonzero[0]), int(nonzero[-1])
+        else:
+            self.min = self.max = None
+        return self
+
+    def __add__(self, other):
+        return self.copy().merge(other)
+
+    def __sub__(self, other):
+        return self.copy().subtract(other)
+
+    # ---- statistics ---------------------------------------------------------
+
+    def mean(self):
+        return self.total / self.count if self.count else np.nan
+
+    def var(self, ddof=1):
+        if self.count <= ddof:
+            return np.nan
+        return (self.total_sq - self.total * self.total / self.count) \
+               / (self.count - ddof)
+
+    def std(self, ddof=1):
+        return np.sqrt(self.var(ddof))
+
+    def quantile(self, q):
+        """ Function to calculate quantiles from the histogram, using the
+            same linear interpolation as numpy/pandas quantile().
+            Parameters: q (float or array-like of floats in [0, 1])
+            Returns: values (float or ndarray)
+        """
+        q_arr = np.atleast_1d(np.asarray(q, dtype=float))
+        if not self.count:
+            values = np.full(len(q_arr), np.nan)
+        else:
+            cum = np.cumsum(self.hist)
+            pos = q_arr * (self.count - 1)
+            lower = np.floor(pos).astype(np.int64)
+            upper = np.minimum(lower + 1, self.count - 1)
+            v_lower = np.searchsorted(cum, lower, side='right')
+            v_upper = np.searchsorted(cum, upper, side='right')
+            values = v_lower + (pos - lower) * (v_upper - v_lower)
+
+        return values if np.ndim(q) else float(values[0])
+
+    def __eq__(self, other):
+        return (isinstance(other, AggState)
+                and (self.count, self.total, self.total_sq, self.min, self.max)
+                == (other.count, other.total, other.total_sq, other.min, other.max)
+                and np.array_equal(self.hist, other.hist))
+
+    def __repr__(self):
+        return 'AggState(count={}, mean={:.2f}, min={}, max={})'.format(
+            self.count, self.mean(), self.min, self.max)
+
+
+# %% Part 3: Grouped state
+
+class GroupedAggState:
+    """ AggState per group key (e.g. (Season, Batting_Team) tuples). """
+
+    def __init__(self, size=MAX_BALLS + 1):
+        self.size = size
+        self.groups = {}
+
+    @classmethod
+    def from_frame(cls, df_in, by, value_col='Half_Ball', size=MAX_BALLS + 1):
+        """ Function to build grouped state from a DataFrame (full compute).
+            Parameters: df_in (DataFrame), by (list of group columns)
+                        value_col (str, integer ball column)
+            Returns: state (GroupedAggState)
+        """
+        state = cls(size)
+        state.add(df_in, by, value_col)
+        return state
+
+    def copy(self):
+        state = GroupedAggState(self.size)
+        state.groups = {key: agg.copy() for key, agg in self.groups.items()}
+        return state
+
+    def _apply(self, df_in, by, value_col, sign):
+        for key, values in df_in.groupby(by, sort=False)[value_col]:
+            delta = AggState.from_values(values.to_numpy(), self.size)
+            if sign > 0:
+                if key in self.groups:
+                    self.groups[key].merge(delta)
+                else:
+                    self.groups[key] = delta
+            else:
+                self.groups[key].subtract(delta)
+                if not self.groups[key].count:
+                    del self.groups[key]
+
+    def add(self, df_in, by, value_col='Half_Ball'):
+        """ Adds rows to their groups, touching only the groups present. """
+        self._apply(df_in, by, value_col, 1)
+
+    def subtract(self, df_in, by, value_col='Half_Ball'):
+        """ Removes previously added rows from their groups. """
+        self._apply(df_in, by, value_col, -1)
+
+    def updated(self, df_add, df_sub, by, value_col='Half_Ball'):
+        """ Function to derive a new grouped state with rows added and
+            removed, leaving this one untouched: only the touched groups are
+            copied (and frozen, see freeze()), the others are shared.
+            Parameters: df_add, df_sub (DataFrames of rows to add / remove)
+                        by (list of group columns), value_col (str)
+            Returns: state (GroupedAggState)
+        """
+        state = GroupedAggState(self.size)
+        state.groups = dict(self.groups)
+        touched = pd.concat([df_sub[by], df_add[by]]).drop_duplicates()
+        touched = list(touched.itertuples(index=False, name=None))
+        for key in touched:
+            if key in state.groups:
+                state.groups[key] = state.groups[key].copy()
+        if len(df_sub):
+            state.subtract(df_sub, by, value_col)
+        if len(df_add):
+            state.add(df_add, by, value_col)
+        for key in touched:
+            if key in state.groups:
+                state.groups[key].freeze()
+        return state
+
+    def merge(self, other):
+        """ Merges another grouped state into this one (in place). """
+        for key, state in other.groups.items():
+            if key in self.groups:
+                self.groups[key].merge(state)
+            else:
+                self.groups[key] = state.copy()
+        return self
+
+    def rollup(self, level=None):
+        """ Function to merge group states up to a coarser grain.
+            Parameters: level (int or None, tuple position to keep,
+                        None merges everything into one state)
+            Returns: dict of {group: AggState} or AggState when level is None
+        """
+        if level is None:
+            total = AggState(self.size)
+            for state in self.groups.values():
+                total.merge(state)
+            return total
+
+        rolled = {}
+        for key, state in self.groups.items():
+            sub_key = key[level] if isinstance(key, tuple) else key
+            if sub_key in rolled:
+                rolled[sub_key].merge(state)
+            else:
+                rolled[sub_key] = state.copy()
+        return rolled
+
+
+def states_frame(states, name):
+    """ Function to tabulate a dict of AggStates.
+        Parameters: states (dict of {group: AggState}), name (str, index name)
+        Returns: df_states (DataFrame: count, mean, std, min, max)
+    """
+    keys = sorted(states)
+    df_states = pd.DataFrame({
+        'count': [states[k].count for k in keys],
+        'mean': [states[k].mean() for k in keys],
+        'std': [states[k].std() for k in keys],
+        'min': [states[k].min for k in keys],
+        'max': [states[k].max for k in keys],
+        }, index=pd.Index(keys, name=name))
+
+    return df_states
+
+def season_averages(grp_state):
+    """ Function to calculate season average delivery number at which half of
+        total runs is reached, from (Season, ...) grouped state.
+        Parameters: grp_state (GroupedAggState, first key level is Season)
+        Returns: season_grp_AHB (DataFrame: Season, Half_Ball, Count, Half_Del)
+                 all_AHD (string of delivery numbers)
+    """
+    # Season Group Avg Haf-Ball : SELECT Season, mean(Half_Ball) ....
+    season_grp_AHB = states_frame(grp_state.rollup(0), 'Season')
+    season_grp_AHB = season_grp_AHB[['mean', 'count']].round(0)
+    season_grp_AHB.columns = ['Half_Ball', 'Count']
+
+    # calc inn. half del. no. from inn. half ball count
+    season_grp_AHB['Half_Del'] = season_grp_AHB['Half_Ball'] \
+                                 .apply(lambda x: int(x//6) + (int(x%6)/10))
+
+    season_grp_AHB = season_grp_AHB.reset_index()
+    season_grp_AHB = season_grp_AHB.astype({'Half_Ball' : int, 'Count':int})
+
+    # calc all AHD (Avg. Haf Delivery for all 50 over innnngs)
+    all_AHB = round(grp_state.rollup().mean())
+    all_AHD = str(int(all_AHB // 6) + (int(all_AHB % 6) / 10))
+
+    return season_grp_AHB, all_AHD
+
+
+# %% Part 4: Incremental maintenance
+
+class IncrementalAggregates:
+    """ Grouped state kept in sync with successive versions of a DataFrame.
+        The ledger holds the last version's rows (key, group and value
+        columns as arrays, in row order): a vectorised compare against it
+        finds the first changed row, the high-water mark, and only the rows
+        from there on are reconciled by key. Appended innings therefore cost
+        O(new rows), and an innings corrected in place O(rows after it).
+        Each sync publishes a new read-only state (copy on write: touched
+        groups are copied, the others shared), so readers get it uncopied.
+    """
+
+    def __init__(self, key_cols=('Match_ID', 'Inn_Num'), by=('Season', 'Team'),
+                 value_col='Half_Ball', size=MAX_BALLS + 1):
+        self.key_cols = list(key_cols)
+        self.by = list(by)
+        self.value_col = value_col
+        self.columns = self.key_cols + self.by + [value_col]
+        self.state = GroupedAggState(size)
+        self.ledger = None
+        self.last_changes = 0
+        self.version = 0  # bumped whenever a sync changes the state
+        self._lock = threading.Lock()
+
+    def _high_water_mark(self, new):
+        """ Returns the number of leading rows unchanged since the last sync. """
+        n_rows = min(len(self.ledger[self.value_col]), len(new[self.value_col]))
+        same = np.ones(n_rows, dtype=bool)
+        for col in self.columns:
+            same &= self.ledger[col][:n_rows] == new[col][:n_rows]
+        changed = np.flatnonzero(~same)
+
+        return int(changed[0]) if len(changed) else n_rows
+
+    def sync(self, df_in):
+        """ Function to bring the state in line with df_in.
+            Parameters: df_in (DataFrame with key_cols, by and value_col)
+            Returns: state (GroupedAggState, read-only: safe to read unlocked)
+        """
+        new = {col: df_in[col].to_numpy() for col in self.columns}
+
+        with self._lock:
+            if self.ledger is None:
+                self.ledger = {col: values[:0] for col, values in new.items()}
+            mark = self._high_water_mark(new)
+            df_old = pd.DataFrame({col: self.ledger[col][mark:] for col in self.columns})
+            df_new = pd.DataFrame({col: new[col][mark:] for col in self.columns})
+
+            if df_old.empty:  # appended rows only (or no change)
+                df_add, df_sub = df_new, df_old
+            else:
+                # rows in both tails (e.g. shifted by an inserted row) cancel out; a
+                # corrected row is removed with its old and added with its new values
+                df_tail = df_old.merge(df_new, how='outer', indicator=True)
+                df_sub = df_tail[df_tail['_merge'] == 'left_only']
+                df_add = df_tail[df_tail['_merge'] == 'right_only']
+
+            if len(df_add) or len(df_sub):
+                self.state = self.state.updated(df_add, df_sub, self.by, self.value_col)
+            self.ledger = new
+            self.last_changes = len(df_add) + len(df_sub)
+            if self.last_changes:
+                self.version += 1
+
+            return self.state
+
+    def snapshot(self):
+        """ Returns the current (read-only) state and its version number. """
+        with self._lock:
+            return self.state, self.version
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/aggregates_api.py
+# Description: Read-only HTTP API of the app's aggregates
+#
+# Serves the numbers the app shows from the published shared dataset
+# (shared_dataset.py), so other dashboards need not read the csv:
+#   GET /summary    dataset stats: matches, innings, overall average halfway
+#                   delivery, latest match, seasons and teams
+#   GET /seasons    season averages (season_grp_calc() of all innings)
+#   GET /innings    full innings of a selection, one page at a time
+#                   ?teams=India,Pakistan&start=2019&end=2023 (default: all)
+#                   &offset=0&limit=100 (limit at most MAX_LIMIT)
+#
+# Tables come as compact JSON ({"columns": [...], "data": [[...], ...]}) or,
+# with ?format=arrow or an Accept of ARROW_TYPE, as an Arrow IPC stream
+# (paging in the X-Total-Count and Link headers). The ETag is the dataset
+# version, the format and a digest of the parsed query (selection and page),
+# so every page and filter has its own tag. A client sending it back in
+# If-None-Match gets a 304 without building the body until a new version is
+# published; malformed queries get their 400 first. Response bodies are
+# cached per version, so repeated queries are a dict lookup.
+#
+# Usage:
+#   python -m cricdata.aggregates_api [--host 127.0.0.1] [--port 8503]
+#                                     [--format ODI] [--shared-dir DIR]
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+from functools import lru_cache, partial
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import pyarrow as pa
+
+from cricdata.bundle import dataset_stats
+from cricdata.core import filter_selection, mapped_dataset
+from cricdata.selection_log import canonical_selection
+from cricdata.formats import DEFAULT_FORMAT, FORMATS, get_format
+from cricdata.shared_dataset import SHARED_DIR, SharedData
+
+ARROW_TYPE = 'application/vnd.apache.arrow.stream'
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+POLL_SECONDS = 1.0      # how often the CURRENT pointer is re-read
+BODY_CACHE = 1024       # response bodies kept per dataset version
+SELECTION_CACHE = 64    # filtered selections kept per dataset version
+
+
+# %% Part 2: Responses
+
+def table_body(df_out, fmt, meta=None):
+    """ Function to encode a table as compact JSON or an Arrow IPC stream.
+        Parameters: df_out (DataFrame), fmt (str, 'json' or 'arrow')
+                    meta (dict, extra JSON fields)
+        Returns: body (bytes)
+    """
+    if fmt == 'arrow':
+        table = pa.Table.from_pandas(df_out, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    payload = dict(meta or {})
+    payload.update(json.loads(df_out.to_json(orient='split', index=False,
+                                              date_format='iso', date_unit='s')))
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+def parse_selection(data, params):
+    """ Function to read a selection from query parameters.
+        Parameters: data (dict, core.mapped_dataset())
+                    params (dict, parse_qs() of the query)
+        Returns: selection (tuple, canonical_selection())
+        Raises: ValueError (unknown teams or seasons)
+    """
+    seasons = data['seasons']
+    teams = [team.strip() for value in params.get('teams', [])
+             for team in value.split(',') if team.strip()] or data['teams']
+    unknown = sorted(set(teams) - set(data['teams']))
+    if unknown:
+        raise ValueError('unknown teams: ' + ', '.join(unknown))
+    start = params.get('start', [seasons[0]])[0]
+    end = params.get('end', [seasons[-1]])[0]
+    if start not in seasons or end not in seasons:
+        raise ValueError('seasons run from {} to {}'.format(seasons[0], seasons[-1]))
+    if seasons.index(start) > seasons.index(end):
+        raise ValueError('start is after end')
+
+    return canonical_selection(teams, start, end)
+
+def parse_page(params):
+    """ Returns (offset, limit) from query parameters, raising ValueError. """
+    try:
+        offset = int(params.get('offset', [0])[0])
+        limit = int(params.get('limit', [DEFAULT_LIMIT])[0])
+    except ValueError:
+        raise ValueError('offset and limit must be integers') from None
+    if offset < 0 or not 0 < limit <= MAX_LIMIT:
+        raise ValueError('offset >= 0 and 0 < limit <= {} required'.format(MAX_LIMIT))
+
+    return offset, limit
+
+def entity_tag(version, fmt, key=None):
+    """ Function to build a response's ETag from what its body depends on.
+        Parameters: version (str, dataset version), fmt (str)
+                    key (tuple, the resource's parsed parameters, optional)
+        Returns: etag (str, quoted)
+    """
+    if key is None:
+        return '"{}-{}"'.format(version, fmt)
+    digest = hashlib.blake2b(json.dumps(key).encode('utf-8'), digest_size=8)
+
+    return '"{}-{}-{}"'.format(version, fmt, digest.hexdigest())
+
+def render_body(data, selection, resource, fmt, key):
+    """ Function to build a response body.
+        Parameters: data (dict, core.mapped_dataset())
+                    selection (callable, filter_selection() of data by
+                    teams, start, end)
+                    resource (str), fmt (str, 'json' or 'arrow')
+                    key (tuple, the resource's parsed parameters)
+        Returns: body (bytes), headers (dict)
+    """
+    if resource == 'summary':
+        stats = dataset_stats(data)
+        stats.update(version=data['version'], format=data['format'],
+                     innings=len(data['full']),
+                     avg_half_del=float(data['all_avg_ihd']),
+                     seasons=data['seasons'], teams=data['teams'])
+        return json.dumps(stats, separators=(',', ':')).encode('utf-8'), {}
+
+    if resource == 'seasons':
+        return table_body(data['season_avg'], fmt,
+                          {'version': data['version'],
+                           'avg_half_del': float(data['all_avg_ihd'])}), {}
+
+    selection_key, offset, limit = key
+    df_sel = selection(*selection_key)
+    total = len(df_sel)
+    next_link = None
+    if offset + limit < total:
+        next_link = '/innings?' + urlencode({'teams': ','.join(selection_key[0]),
+                                             'start': selection_key[1],
+                                             'end': selection_key[2],
+                                             'offset': offset + limit,
+                                             'limit': limit})
+    meta = {'version': data['version'], 'teams': list(selection_key[0]),
+            'start': selection_key[1], 'end': selection_key[2], 'total': total,
+            'offset': offset, 'limit': limit, 'next': next_link}
+    headers = {'X-Total-Count': str(total)}
+    if next_link is not None:
+        headers['Link'] = '<{}>; rel="next"'.format(next_link)
+
+    return table_body(df_sel.iloc[offset:offset + limit], fmt, meta), headers
+
+
+# %% Part 3: Aggregate store
+
+class AggregateStore:
+    """ The published dataset's aggregates, with response bodies cached per
+        version (the caches are replaced when CURRENT moves on).
+    """
+
+    def __init__(self, shared_dir=SHARED_DIR, poll=POLL_SECONDS):
+        self.shared = SharedData(shared_dir)
+        self.poll = poll
+        self._current = (None, None)
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def current(self):
+        """ Function to get the published dataset, re-reading the pointer at
+            most every `poll` seconds.
+            Returns: data (dict, core.mapped_dataset(), None if nothing is
+                     published), body (cached render_body() of that data:
+                     body(resource, fmt, key))
+        """
+        now = time.monotonic()
+        if now - self._checked < self.poll:
+            return self._current
+        with self._lock:
+            if now - self._checked >= self.poll:
+                mapped = self.shared.current()
+                data = self._current[0]
+                if mapped is None:
+                    self._current = (None, None)
+                elif data is None or data['version'] != mapped.version:
+                    self._current = self._load(mapped)
+                self._checked = now
+        return self._current
+
+    @staticmethod
+    def _load(mapped):
+        data = mapped_dataset(mapped)
+        selection = lru_cache(SELECTION_CACHE)(
+            partial(filter_selection, data['full'], data['dims']))
+
+        return data, lru_cache(BODY_CACHE)(partial(render_body, data, selection))
+
+
+# %% Part 4: HTTP service
+
+RESOURCES = {'/summary': 'summary', '/seasons': 'seasons', '/innings': 'innings'}
+TABLE_RESOURCES = ('seasons', 'innings')  # the ones with an Arrow format
+
+class AggregatesHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive for load tests and clients
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def _send(self, status, body=b'', content_type='application/json',
+              headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message):
+        self._send(status, json.dumps({'error': message}).encode('utf-8'))
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        resource = RESOURCES.get(url.path)
+        if resource is None:
+            return self._send_error(404, 'not found, try ' + ', '.join(RESOURCES))
+        params = parse_qs(url.query)
+        fmt = params.get('format', [None])[0] or \
+            ('arrow' if ARROW_TYPE in self.headers.get('Accept', '') else 'json')
+        if fmt not in ('json', 'arrow') or \
+                (fmt == 'arrow' and resource not in TABLE_RESOURCES):
+            return self._send_error(406, 'format is json, or arrow for tables')
+
+        data, body_cache = self.server.store.current()
+        if data is None:
+            return self._send_error(503, 'no published dataset: run '
+                                    'python -m cricdata build --artifacts dataset')
+
+        key = None
+        if resource == 'innings':
+            try:
+                key = (parse_selection(data, params),) + parse_page(params)
+            except ValueError as exc:
+                return self._send_error(400, str(exc))
+
+        # a valid query's body only changes with the version: answer
+        # revalidations before building it
+        etag = entity_tag(data['version'], fmt, key)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+        if_none_match = self.headers.get('If-None-Match', '')
+        if if_none_match == '*' or etag in [tag.strip() for tag in
+                                           if_none_match.split(',')]:
+            return self._send(304, headers=headers)
+
+        body, extra = body_cache(resource, fmt, key)
+        headers.update(extra)
+        self._send(200, body, ARROW_TYPE if fmt == 'arrow' else 'application/json',
+                   headers)
+
+    def log_message(self, format, *args):
+        pass  # no per-request logging on the hot path
+
+
+def make_server(host='127.0.0.1', port=8503, shared_dir=SHARED_DIR):
+    """ Function to create (not start) the aggregates HTTP server.
+        Parameters: host (str), port (int, 0 picks a free port)
+                    shared_dir (str, published datasets of one format)
+        Returns: ThreadingHTTPServer (call serve_forever())
+    """
+    server = ThreadingHTTPServer((host, port), AggregatesHandler)
+    server.daemon_threads = True
+    server.store = AggregateStore(shared_dir)
+
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Read-only aggregates API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8503)
+    parser.add_argument('--format', default=DEFAULT_FORMAT, choices=list(FORMATS))
+    parser.add_argument('--shared-dir', help='default: the format\'s shared dir')
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port,
+                         args.shared_dir or get_format(args.format).shared_dir)
+    print('serving {} aggregates on http://{}:{}/ ({})'.format(
+        args.format, args.host, args.port, ', '.join(RESOURCES)))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
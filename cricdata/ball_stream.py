@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/ball_stream.py
+# Description: Ball-by-ball match replay with incremental projections
+#
+# Replays Cricsheet ball-by-ball csv files (CSV2 format, one file per match)
+# one delivery at a time, standing in for a live feed. Every delivery
+# updates an InningsTracker in constant time:
+#   - current score, wickets and legal balls
+#   - projected final score (projection_service lookup table)
+#   - halfway delivery, as in the Half_Del column: the first delivery at
+#     which the running total reaches half the (projected) final total
+# The halfway delivery is found by a pointer into the innings' running
+# totals. It only moves as far as the projected half changes from one ball
+# to the next, so no update rescans the innings. Until the running total
+# reaches the projected half, the halfway ball is read off the projection
+# curve instead.
+#
+# An innings is complete at its ball or wicket limit, once a chase passes
+# its target, or when the stream reports its end (the next innings starts
+# or the match ends), e.g. for a declaration or a shortened match.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import math
+import os
+
+import pandas as pd
+
+from cricdata.distributions import ball_to_del
+from cricdata.projection_service import MAX_BALLS, load_table
+
+DATA_DIR = './data/'
+MATCH_DIR = DATA_DIR + 'matches/'
+
+MAX_WICKETS = 10
+
+STATE_COLUMNS = ['Match_ID', 'Inn_Num', 'Batting_Team', 'Bowling_Team', 'Del',
+                 'Balls', 'Runs', 'Wickets', 'Projected', 'Low', 'High',
+                 'Half_Del', 'Half_Ball', 'Half_Reached', 'Complete']
+
+
+# %% Part 2: Reading deliveries
+
+def read_deliveries(source):
+    """ Function to read a Cricsheet ball-by-ball csv file.
+        Parameters: source (path or file-like, CSV2 ball-by-ball format)
+        Returns: df_del (DataFrame: match_id, innings, ball, batting_team,
+                 bowling_team, runs, legal, wicket) in delivery order
+    """
+    df_raw = pd.read_csv(source, dtype={'ball': str}, low_memory=False)
+    df_raw = df_raw[df_raw['innings'] <= 2]  # drop super overs
+
+    extras = ['extras', 'wides', 'noballs']
+    df_raw[extras] = df_raw[extras].fillna(0)
+
+    return pd.DataFrame({
+        'match_id': df_raw['match_id'],
+        'innings': df_raw['innings'].astype(int),
+        'ball': df_raw['ball'],
+        'batting_team': df_raw['batting_team'],
+        'bowling_team': df_raw['bowling_team'],
+        'runs': (df_raw['runs_off_bat'] + df_raw['extras']).astype(int),
+        'legal': (df_raw['wides'] == 0) & (df_raw['noballs'] == 0),
+        'wicket': df_raw['player_dismissed'].notna(),
+        }).reset_index(drop=True)
+
+def match_files(match_dir=MATCH_DIR):
+    """ Function to list ball-by-ball files (Cricsheet *_info.csv skipped). """
+    if not os.path.isdir(match_dir):
+        return []
+    return sorted(os.path.join(match_dir, name) for name in os.listdir(match_dir)
+                  if name.endswith('.csv') and not name.endswith('_info.csv'))
+
+
+# %% Part 3: Incremental innings statistics
+
+class InningsTracker:
+    """ Running statistics of one innings, updated in O(1) per delivery. """
+
+    def __init__(self, table, match_id, inn_num, batting_team, bowling_team,
+                 max_balls=MAX_BALLS, target=None):
+        self.table = table
+        self.match_id = match_id
+        self.inn_num = inn_num
+        self.batting_team = batting_team
+        self.bowling_team = bowling_team
+        self.max_balls = max_balls
+        self.target = target    # runs to win (second innings), if known
+        self.ended = False      # the stream reported the end of the innings
+
+        self.runs = 0
+        self.wickets = 0
+        self.balls = 0          # legal deliveries
+        self.last_del = None
+        self._totals = []       # running total after each delivery
+        self._labels = []       # delivery label ('29.5') of each delivery
+        self._balls_at = []     # legal balls bowled after each delivery
+        self._half_idx = 0      # first delivery with running total >= target
+        self.history = []       # (Balls, Runs, Projected) per delivery
+
+    @property
+    def complete(self):
+        return (self.ended or self.balls >= self.max_balls
+                or self.wickets >= MAX_WICKETS
+                or (self.target is not None and self.runs >= self.target))
+
+    def update(self, label, runs, legal, wicket):
+        """ Function to add one delivery and refresh the projections.
+            Parameters: label (str, ball label e.g. '29.5'), runs (int, incl.
+                        extras), legal (bool), wicket (bool)
+        """
+        self.runs += runs
+        self.wickets += bool(wicket)
+        self.balls += bool(legal)
+        self.last_del = label
+        self._totals.append(self.runs)
+        self._labels.append(label)
+        self._balls_at.append(self.balls)
+
+        self.projected, self.low, self.high = self._project()
+        self._move_half_pointer(max(1, math.ceil(self.projected / 2)))
+        self.history.append((self.balls, self.runs, self.projected))
+
+    def finish(self):
+        """ Function to mark the innings over when the stream reports its end
+            before a limit was reached: the current score is final.
+        """
+        if self.ended:
+            return
+        self.ended = True
+        if self._totals:
+            self.projected, self.low, self.high = self._project()
+            self._move_half_pointer(max(1, math.ceil(self.projected / 2)))
+            self.history[-1] = (self.balls, self.runs, self.projected)
+
+    def _project(self):
+        if self.complete:
+            return float(self.runs), float(self.runs), float(self.runs)
+        if self.balls == 0:
+            return float('nan'), float('nan'), float('nan')
+        projected, low, high = self.table.project(self.runs, self.balls)
+        return float(projected), float(low), float(high)
+
+    def _move_half_pointer(self, target):
+        """ Moves the halfway pointer to the first delivery whose running total
+            reaches target. Totals never decrease, so the pointer only steps
+            over the deliveries between the previous and the new target.
+        """
+        if math.isnan(self.projected):
+            return
+        i, totals = self._half_idx, self._totals
+        while i > 0 and totals[i - 1] >= target:
+            i -= 1
+        while i < len(totals) and totals[i] < target:
+            i += 1
+        self._half_idx = i
+
+    def _curve_half_ball(self):
+        """ Halfway ball from the power curve through the current score:
+            runs / projected = (balls / max_balls) ** k.
+        """
+        if math.isnan(self.projected) or not 0 < self.runs < self.projected:
+            return float('nan')
+        k = math.log(self.runs / self.projected) / math.log(self.balls / self.max_balls)
+        return self.max_balls * 0.5 ** (1 / k)
+
+    def state(self):
+        """ Function to report the current statistics.
+            Returns: state (dict with the STATE_COLUMNS keys)
+        """
+        reached = self._half_idx < len(self._totals)
+        if reached:
+            half_del = float(self._labels[self._half_idx])
+            half_ball = self._balls_at[self._half_idx]
+        else:
+            half_ball = self._curve_half_ball()
+            half_del = float(ball_to_del(half_ball)) \
+                if not math.isnan(half_ball) else float('nan')
+
+        return {'Match_ID': self.match_id, 'Inn_Num': self.inn_num,
+                'Batting_Team': self.batting_team,
+                'Bowling_Team': self.bowling_team, 'Del': self.last_del,
+                'Balls': self.balls, 'Runs': self.runs, 'Wickets': self.wickets,
+                'Projected': self.projected, 'Low': self.low, 'High': self.high,
+                'Half_Del': half_del, 'Half_Ball': half_ball,
+                'Half_Reached': reached, 'Complete': self.complete}
+
+
+# %% Part 4: Replays
+
+class MatchReplay:
+    """ Feeds one match's deliveries to InningsTrackers, one per step. """
+
+    def __init__(self, df_del, table):
+        self.table = table
+        self._rows = df_del.itertuples(index=False)
+        self.trackers = {}      # innings number -> InningsTracker
+        self.finished = False
+
+    def step(self):
+        """ Function to replay the next delivery.
+            Returns: tracker (InningsTracker updated) or None when finished
+        """
+        row = next(self._rows, None)
+        if row is None:
+            for tracker in self.trackers.values():
+                tracker.finish()  # the match is over
+            self.finished = True
+            return None
+
+        tracker = self.trackers.get(row.innings)
+        if tracker is None:
+            # a new innings ends the previous one; the chase's target is
+            # one run more than the first innings (without DLS revisions)
+            for previous in self.trackers.values():
+                previous.finish()
+            first = self.trackers.get(1)
+            target = first.runs + 1 if row.innings == 2 and first else None
+            tracker = InningsTracker(self.table, row.match_id, row.innings,
+                                     row.batting_team, row.bowling_team,
+                                     target=target)
+            self.trackers[row.innings] = tracker
+        tracker.update(row.ball, row.runs, row.legal, row.wicket)
+
+        return tracker
+
+
+class ReplayHub:
+    """ Replays several matches side by side, one delivery each per tick. """
+
+    def __init__(self, table=None):
+        self.table = table if table is not None else load_table()
+        self.replays = {}       # match id -> MatchReplay
+
+    def add(self, df_del):
+        """ Function to add every match in a deliveries frame. """
+        for match_id, df_match in df_del.groupby('match_id', sort=False):
+            self.replays[match_id] = MatchReplay(df_match, self.table)
+
+    @property
+    def finished(self):
+        return all(replay.finished for replay in self.replays.values())
+
+    def tick(self, n=1):
+        """ Function to advance every unfinished match by n deliveries. """
+        for replay in self.replays.values():
+            for _ in range(n):
+                if replay.step() is None:
+                    break
+
+    def trackers(self):
+        return [tracker for replay in self.replays.values()
+                for tracker in replay.trackers.values()]
+
+    def frame(self):
+        """ Function to tabulate the current state of every innings.
+            Returns: df_live (DataFrame with STATE_COLUMNS)
+        """
+        return pd.DataFrame([tracker.state() for tracker in self.trackers()],
+                            columns=STATE_COLUMNS)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/bootstrap.py
+# Description: Vectorized bootstrap confidence intervals for season averages
+#
+# All groups of a batch are resampled together: the values of every group are
+# laid end to end, one uniform matrix draws resample indices for all of them,
+# and np.add.reduceat sums each group's slice. Batches of groups are
+# independent jobs, run in the jobs.py process pool so the Streamlit script
+# thread only submits and collects.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import numpy as np
+import pandas as pd
+
+N_RESAMPLES = 10000
+CI_LEVEL = 0.95
+CHUNK_SIZE = 500  # resamples drawn per vectorized step (bounds memory)
+
+
+# %% Part 2: Bootstrap
+
+def hist_values(hist):
+    """ Function to expand a ball histogram back into its values.
+        Parameters: hist (ndarray, counts per ball number)
+        Returns: values (ndarray of ball numbers, sorted)
+    """
+    return np.repeat(np.arange(len(hist)), hist)
+
+def bootstrap_ci(samples, n_resamples=N_RESAMPLES, level=CI_LEVEL, seed=0,
+                 chunk_size=CHUNK_SIZE, progress=None):
+    """ Function to calculate percentile bootstrap intervals for the mean of
+        every group in one vectorized batch.
+        Parameters: samples (dict of {label: 1d array of values})
+                    n_resamples (int), level (float, e.g. 0.95)
+                    seed (int or SeedSequence), chunk_size (int)
+                    progress (callable, called with the fraction done)
+        Returns: df_ci (DataFrame: Label, Mean, CI_Low, CI_High)
+    """
+    labels = [label for label in samples if len(samples[label])]
+    if not labels:
+        return pd.DataFrame(columns=['Label', 'Mean', 'CI_Low', 'CI_High'])
+
+    values = np.concatenate([np.asarray(samples[l], dtype=float) for l in labels])
+    sizes = np.array([len(samples[l]) for l in labels])
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+    # per column of the batch: its group's start offset and size
+    col_start = np.repeat(starts, sizes)
+    col_size = np.repeat(sizes, sizes)
+
+    rng = np.random.default_rng(seed)
+    means = np.empty((n_resamples, len(labels)))
+    for first in range(0, n_resamples, chunk_size):
+        rows = min(chunk_size, n_resamples - first)
+        idx = col_start + (rng.random((rows, len(values))) * col_size).astype(np.int64)
+        means[first:first + rows] = np.add.reduceat(values[idx], starts, axis=1) / sizes
+        if progress is not None:
+            progress((first + rows) / n_resamples)
+
+    alpha = (1 - level) / 2
+    ci_low, ci_high = np.quantile(means, [alpha, 1 - alpha], axis=0)
+
+    return pd.DataFrame({'Label': labels,
+                         'Mean': np.add.reduceat(values, starts) / sizes,
+                         'CI_Low': ci_low,
+                         'CI_High': ci_high})
+
+
+# %% Part 3: Batches
+
+def bootstrap_batches(samples, n_batches, seed=0):
+    """ Function to split groups into independent batches, each with its own
+        random stream, to run as separate jobs.
+        Parameters: samples (dict of {label: values}), n_batches (int)
+                    seed (int)
+        Returns: batches (list of (samples dict, SeedSequence))
+    """
+    labels = list(samples)
+    groups = [labels[i::n_batches] for i in range(min(n_batches, len(labels)))]
+    seeds = np.random.SeedSequence(seed).spawn(len(groups))
+
+    return [({label: samples[label] for label in group}, batch_seed)
+            for group, batch_seed in zip(groups, seeds)]
+
+def combine_bootstrap(frames):
+    """ Function to combine batch results.
+        Parameters: frames (list of DataFrames from bootstrap_ci())
+        Returns: df_ci (DataFrame, sorted by Label)
+    """
+    # batches of seasons without innings give empty frames
+    frames = [df_ci for df_ci in frames if len(df_ci)]
+    if not frames:
+        return pd.DataFrame(columns=['Label', 'Mean', 'CI_Low', 'CI_High'])
+
+    return pd.concat(frames, ignore_index=True).sort_values('Label',
+                                                            ignore_index=True)
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/bundle.py
+# Description: Static pre-rendered bundle of the app's landing view
+#
+# Renders the default view (top 9 teams, all seasons) and a set of popular
+# selections into static files that any web server or CDN can serve without
+# Python:
+#   index.html               the page, with the default view inlined
+#   manifest.json            dataset stats and the list of bundled views
+#   views/<report_name>.json  one view: selection info, summary and the
+#                            scatter (display_plot1) and season average
+#                            (display_plot2) Vega-Lite specs with their data
+#
+# Specs embed only the columns the charts encode. The page renders them with
+# vega-embed and links to the interactive app for any other selection.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import json
+import os
+
+import pandas as pd
+
+from cricdata.charts import SCATTER_COLUMNS, scatter_chart, season_avg_chart
+from cricdata.core import DATA_DIR, TEAMS_TOP9
+from cricdata.formats import get_format
+from cricdata.report import report_name, selection_report
+
+BUNDLE_DIR = DATA_DIR + 'bundle/'
+VIEW_DIR = 'views'
+MANIFEST_FILE = 'manifest.json'
+APP_URL = 'http://localhost:8501/'  # interactive app, for custom selections
+
+VEGA_SCRIPTS = ['https://cdn.jsdelivr.net/npm/vega@5',
+                'https://cdn.jsdelivr.net/npm/vega-lite@5',
+                'https://cdn.jsdelivr.net/npm/vega-embed@6']
+
+
+# %% Part 2: Views
+
+def view_label(selection, all_teams):
+    """ Function to describe a selection for the view menu.
+        Parameters: selection (tuple, canonical_selection())
+                    all_teams (list of team names in the data)
+        Returns: label (str)
+    """
+    teams, start_season, end_season = selection
+    if len(teams) == len(all_teams):
+        team_text = 'All teams'
+    elif set(teams) == set(TEAMS_TOP9):
+        team_text = 'Top 9 teams'
+    elif len(teams) <= 3:
+        team_text = ', '.join(teams)
+    else:
+        team_text = '{} teams'.format(len(teams))
+
+    return '{}: {} to {}'.format(team_text, start_season, end_season)
+
+def render_view(data, grp_state, selection):
+    """ Function to pre-render one selection's landing view (regimes shown
+        overall, season averages with bootstrap CIs).
+        Parameters: data (dict, core.load_dataset()), grp_state (GroupedAggState)
+                    selection (tuple, canonical_selection())
+        Returns: view (dict, JSON serialisable)
+    """
+    teams, start_season, end_season = selection
+    report = selection_report(data, grp_state, selection, ci=True)
+    df_sel, df_seg = report['innings'], report['regimes']
+    if df_seg is not None:
+        df_seg = df_seg[df_seg['Batting_Team'] == 'All']
+    dim_team = data['dims']['team']
+
+    scatter = scatter_chart(df_sel[SCATTER_COLUMNS], dim_team, df_seg)
+    season_avg = season_avg_chart(report['season_avg'], report['season_ci'],
+                                  get_format(data['format']).overs)
+
+    return {'name': report_name(selection),
+            'label': view_label(selection, data['teams']),
+            'teams': list(teams), 'start': start_season, 'end': end_season,
+            'innings': len(df_sel),
+            'avg_half_del': round(float(df_sel['Half_Del'].mean()), 1)
+                            if len(df_sel) else None,
+            'charts': {'scatter': scatter.to_dict(),
+                       'season_avg': season_avg.to_dict()}}
+
+def write_view(view, out_dir=BUNDLE_DIR):
+    """ Function to write a view as views/<name>.json (compact JSON).
+        Returns: path (str)
+    """
+    os.makedirs(os.path.join(out_dir, VIEW_DIR), exist_ok=True)
+    path = os.path.join(out_dir, VIEW_DIR, view['name'] + '.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(view, f, separators=(',', ':'))
+
+    return path
+
+
+# %% Part 3: Page
+
+def dataset_stats(data):
+    """ Function to collect the dataset-wide numbers of the landing page.
+        Returns: stats (dict: matches, avg_half_del, latest_match)
+    """
+    last_inn = data['last_inn']
+
+    return {'matches': int(data['fact']['Match_ID'].nunique()),
+            'avg_half_del': str(data['all_avg_ihd']),
+            'latest_match': {'batting_team': last_inn['Batting_Team'],
+                             'bowling_team': last_inn['Bowling_Team'],
+                             'venue': last_inn['Venue'],
+                             'date': last_inn['Date'].strftime('%b %d, %Y')}}
+
+def write_index(data, views, version, out_dir=BUNDLE_DIR, app_url=APP_URL):
+    """ Function to write manifest.json and index.html (the first view is the
+        default one and is inlined, so the first paint needs no extra fetch).
+        Parameters: data (dict, core.load_dataset())
+                    views (list of (name, label), default view first)
+                    version (str, dataset version), out_dir (str), app_url (str)
+        Returns: path (str, index.html)
+    """
+    match_format = get_format(data['format'])
+    manifest = {'format': match_format.name, 'dataset_version': version,
+                'generated': pd.Timestamp.now().isoformat(timespec='seconds'),
+                'stats': dataset_stats(data),
+                'views': [{'name': name, 'label': label} for name, label in views]}
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+    with open(os.path.join(out_dir, VIEW_DIR, views[0][0] + '.json'),
+              encoding='utf-8') as f:
+        default_view = f.read()
+    page = (INDEX_HTML
+            .replace('{{scripts}}', '\n'.join('<script src="{}"></script>'.format(src)
+                                              for src in VEGA_SCRIPTS))
+            .replace('{{format}}', match_format.name)
+            .replace('{{innings_label}}', match_format.innings_label)
+            .replace('{{app_url}}', app_url)
+            .replace('{{manifest}}', json.dumps(manifest).replace('</', '<\\/'))
+            .replace('{{default_view}}', default_view.replace('</', '<\\/')))
+    path = os.path.join(out_dir, 'index.html')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(page)
+
+    return path
+
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{{format}} Cricket Data Explorer</title>
+{{scripts}}
+<style>
+  body { background: #0e1117; color: #fafafa; font-family: sans-serif;
+         max-width: 1000px; margin: auto; padding: 1em; }
+  .stats { display: flex; gap: 3em; align-items: baseline; }
+  .stat { font-size: 2.5em; }
+  .info { background: #172d43; padding: 0.8em; border-radius: 0.5em; }
+  a { color: #60b4ff; }
+</style>
+</head>
+<body>
+<h1>{{format}} Cricket Data Explorer &#127951;</h1>
+<div class="stats">
+  <div>{{format}} COUNT<div class="stat" id="matches"></div></div>
+  <div><em>Avg Halfway Delivery</em><div class="stat" id="avg_half_del"></div></div>
+</div>
+<p>
+  <label for="view">Selection:</label> <select id="view"></select>
+  &nbsp; Other seasons or teams: <a href="{{app_url}}">open the interactive app</a>
+</p>
+<p class="info" id="info"></p>
+<h2>Average Delivery Number</h2>
+<p>Delivery Number at halfway point of a {{innings_label}} innings</p>
+<div id="scatter"></div>
+<h2>Season Averages</h2>
+<p>Average halfway delivery by season for the selected teams, with 95%
+   bootstrap confidence intervals (10,000 resamples)</p>
+<div id="season_avg"></div>
+<p><em>Data: <a href="https://cricsheet.org/">Cricsheet.org</a>
+   (<span id="version"></span>)</em></p>
+<script>
+const manifest = {{manifest}};
+const defaultView = {{default_view}};
+const stats = manifest.stats, latest = stats.latest_match;
+
+document.getElementById('matches').textContent = stats.matches;
+document.getElementById('avg_half_del').textContent = stats.avg_half_del;
+document.getElementById('version').textContent =
+    'dataset ' + manifest.dataset_version + ', built ' + manifest.generated;
+
+function show(view) {
+  document.getElementById('info').innerHTML =
+      '&#8505;&#65039; Latest available match: <b>' + latest.batting_team +
+      '</b> vs <b>' + latest.bowling_team + '</b> at <b>' + latest.venue +
+      '</b> on ' + latest.date + '<br>&#128197; Playing seasons between <b>' +
+      view.start + '</b> and <b>' + view.end + '</b>: ' + view.innings +
+      ' innings, average halfway delivery ' + view.avg_half_del;
+  for (const name of ['scatter', 'season_avg']) {
+    vegaEmbed('#' + name, view.charts[name], {theme: 'dark', actions: false});
+  }
+}
+
+const select = document.getElementById('view');
+for (const view of manifest.views) {
+  select.add(new Option(view.label, view.name));
+}
+select.addEventListener('change', () => {
+  if (select.value === defaultView.name) { return show(defaultView); }
+  fetch('views/' + select.value + '.json').then(r => r.json()).then(show);
+});
+show(defaultView);
+</script>
+</body>
+</html>
+"""
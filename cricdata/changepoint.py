@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/changepoint.py
+# Description: PELT change-point detection for the halfway delivery series
+#
+# Finds shifts in the mean Half_Ball of innings ordered by Date with PELT
+# (Killick, Fearnhead & Eckley, 2012). Segment costs are O(1) from cumulative
+# sums, and candidates that can no longer start the optimal last segment are
+# pruned, so run time is close to linear in the number of innings.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import numpy as np
+import pandas as pd
+
+MIN_SEGMENT = 30  # fewest innings allowed in a regime
+
+
+# %% Part 2: PELT
+
+def noise_scale(values):
+    """ Function to estimate the noise standard deviation, robust to mean
+        shifts (MAD of first differences).
+        Parameters: values (1d array)
+        Returns: sigma (float)
+    """
+    diffs = np.diff(values)
+    if not len(diffs):
+        return 1.0
+    mad = np.median(np.abs(diffs - np.median(diffs)))
+    sigma = mad / (0.6745 * np.sqrt(2))
+
+    return sigma if sigma > 0 else max(np.std(values), 1.0)
+
+def pelt(values, penalty=None, min_size=MIN_SEGMENT):
+    """ Function to find mean change points with PELT (normal mean-shift cost).
+        Parameters: values (1d array, series in time order)
+                    penalty (float, cost per extra segment, default 2 log n)
+                    min_size (int, fewest points per segment)
+        Returns: breaks (list of int, start index of each new segment)
+    """
+    x = np.asarray(values, dtype=float)
+    n = len(x)
+    if n < 2 * min_size:
+        return []
+
+    x = (x - x.mean()) / noise_scale(x)
+    if penalty is None:
+        penalty = 2 * np.log(n)
+
+    csum = np.concatenate([[0.0], np.cumsum(x)])
+    csum_sq = np.concatenate([[0.0], np.cumsum(x * x)])
+
+    def cost(s, t):
+        """ Sum of squared deviations from the mean of x[s:t] (vectorized s). """
+        seg_sum = csum[t] - csum[s]
+        return csum_sq[t] - csum_sq[s] - seg_sum * seg_sum / (t - s)
+
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    last = np.zeros(n + 1, dtype=np.int64)
+    candidates = np.array([0], dtype=np.int64)
+
+    for t in range(min_size, n + 1):
+        # t - min_size becomes a possible segment start once it is reachable
+        if t - min_size >= min_size:
+            candidates = np.append(candidates, t - min_size)
+
+        totals = best[candidates] + cost(candidates, t)
+        i_min = np.argmin(totals)
+        best[t], last[t] = totals[i_min] + penalty, candidates[i_min]
+
+        # prune starts that can never begin the optimal last segment again
+        candidates = candidates[totals <= best[t]]
+
+    breaks = []
+    t = n
+    while t > 0:
+        t = int(last[t])
+        if t > 0:
+            breaks.append(t)
+
+    return sorted(breaks)
+
+
+# %% Part 3: Regimes for innings data
+
+def segment_frame(df_in, breaks, label):
+    """ Function to describe the regimes between change points.
+        Parameters: df_in (DataFrame in Date order with Date, Half_Ball)
+                    breaks (list of int, from pelt()), label (str, group name)
+        Returns: df_seg (DataFrame: Batting_Team, Start, End, Half_Ball, Count;
+                 no rows when df_in is empty)
+    """
+    bounds = [0] + list(breaks) + [len(df_in)]
+    rows = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if start == end:  # an empty selection has no regimes
+            continue
+        seg = df_in.iloc[start:end]
+        rows.append([label, seg['Date'].iloc[0], seg['Date'].iloc[-1],
+                     seg['Half_Ball'].mean(), end - start])
+
+    return pd.DataFrame(rows, columns=['Batting_Team', 'Start', 'End',
+                                       'Half_Ball', 'Count'])
+
+def detect_regimes(df_in, per_team=True, min_size=MIN_SEGMENT):
+    """ Function to detect Half_Ball regimes overall and per batting team.
+        Parameters: df_in (DataFrame with Date, Match_ID, Inn_Num,
+                    Batting_Team, Half_Ball)
+                    per_team (bool, also run for each Batting_Team)
+                    min_size (int, fewest innings per regime)
+        Returns: df_seg (DataFrame, see segment_frame(); overall rows have
+                 Batting_Team 'All')
+    """
+    df_sorted = df_in.sort_values(['Date', 'Match_ID', 'Inn_Num'])
+    frames = [segment_frame(df_sorted, pelt(df_sorted['Half_Ball'].to_numpy(),
+                                            min_size=min_size), 'All')]
+    if per_team:
+        for team, df_team in df_sorted.groupby('Batting_Team', sort=True):
+            breaks = pelt(df_team['Half_Ball'].to_numpy(), min_size=min_size)
+            frames.append(segment_frame(df_team, breaks, team))
+
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/charts.py
+# Description: Altair chart builders of the cricdata app and reports
+#
+# Each function builds (and returns) a chart from the tables in cricdata.core;
+# the app pages display them with st.altair_chart(), the batch CLI saves
+# them as Vega-Lite JSON. altair (about 0.3 s to import) is only imported
+# when the first chart is built.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+from cricdata.distributions import ball_to_del
+
+# default season average axis, as a share of the innings' overs (26-32 overs
+# of an ODI), widened when a selection falls outside it
+AVG_AXIS_SHARE = (0.52, 0.64)
+
+# innings columns scatter_chart() encodes (the rest can be dropped before
+# the data is embedded in a spec)
+SCATTER_COLUMNS = ['Batting_Team', 'Bowling_Team', 'Date', 'Half_Del', 'Venue',
+                   'Winner']
+
+
+# %% Part 2: Selection charts
+
+def team_color_scale(dim_team):
+    """ Function to build the Batting_Team colour scale from the team dimension
+        (one domain/range entry per team in the data).
+        Parameters: dim_team (DataFrame, team dimension with colours)
+        Returns: alt.Scale
+    """
+    import altair as alt
+
+    return alt.Scale(domain=dim_team['Team'].tolist(),
+                     range=dim_team['Colour'].tolist())
+
+def scatter_chart(df_in2, dim_team, df_seg=None):
+    """ Function to build the Altair scatterplot with ruled line.
+        Parameters: df_in2 (DataFrame with innings info)
+                    dim_team (DataFrame, team dimension with colours)
+                    df_seg (DataFrame, regimes from selection_regimes(), optional)
+        Returns: alt.LayerChart
+    """
+    import altair as alt
+
+    base = alt.Chart(df_in2).properties(
+            width=900,
+            height=650,
+            # title='Delivery Number at halfway point',
+            # background='#aab7b8',
+            ) #.add_selection(selector)
+
+    color_scale = team_color_scale(dim_team)
+
+    scatterplot = base.mark_point(filled=True, size=100, opacity=0.7
+                                  ).encode(
+            x=alt.X('Date:T',
+                    title = 'Match Date'),
+                    # axis=alt.Axis(values=)),
+            y=alt.Y('Half_Del:Q',
+                    title = 'Halfway Delivery Over',
+                    scale=alt.Scale(zero=False)),
+                    # scale=alt.Scale(domain=[18,42])),
+                    # axis=alt.Axis(values=ticks)),
+
+            color=alt.Color('Batting_Team:N', scale=color_scale),
+            tooltip=['Batting_Team', 'Bowling_Team', 'Date', 'Half_Del',
+                     'Venue', 'Winner']
+    ).interactive()
+
+    rule = base.mark_rule(color='red', opacity=0.8).encode(
+        y='mean(Half_Del):Q',
+        size=alt.value(5),
+        tooltip=['mean(Half_Del)']
+    )
+
+    if df_seg is None or df_seg.empty:
+        return scatterplot + rule
+
+    # regime overlay: segment means, plus dashed rules at each change date
+    base_seg = alt.Chart(df_seg)
+    seg_tooltip = ['Batting_Team', 'Start:T', 'End:T',
+                   alt.Tooltip('Half_Del:Q', title='Regime Avg.'), 'Count']
+    segments = base_seg.mark_rule(size=4, opacity=0.9).encode(
+        x='Start:T',
+        x2='End:T',
+        y='Half_Del:Q',
+        color=alt.condition(alt.datum.Batting_Team == 'All',
+                            alt.value('white'),
+                            alt.Color('Batting_Team:N', scale=team_color_scale(dim_team),
+                                      legend=None)),
+        tooltip=seg_tooltip
+    )
+    df_changes = df_seg[df_seg['Batting_Team'].duplicated()]
+    if df_changes.empty:  # no change points: the regimes are one segment each
+        return scatterplot + rule + segments
+
+    changes = alt.Chart(df_changes).mark_rule(
+        strokeDash=[6, 4], opacity=0.6).encode(
+        x='Start:T',
+        color=alt.condition(alt.datum.Batting_Team == 'All',
+                            alt.value('white'),
+                            alt.Color('Batting_Team:N', scale=team_color_scale(dim_team),
+                                      legend=None)),
+        tooltip=seg_tooltip
+    )
+
+    return scatterplot + rule + segments + changes
+
+def season_avg_chart(df_in3, df_ci=None, overs=50):
+    """ Function to build the Altair line and bar graph plots.
+        Parameters: df_in3 (DataFrame with innings info grouped by season)
+                    df_ci (DataFrame, bootstrap CIs by season, optional)
+                    overs (int, over limit of the format; None: axis fits
+                    the data)
+        Returns: alt.LayerChart
+    """
+    import altair as alt
+
+    if df_ci is not None:
+        df_in3 = df_in3.merge(df_ci[['Label', 'CI_Low', 'CI_High']],
+                              left_on='Season', right_on='Label', how='left')
+        df_in3[['CI_Low', 'CI_High']] = ball_to_del(df_in3[['CI_Low', 'CI_High']])
+
+    y_cols = [col for col in ['Half_Del', 'CI_Low', 'CI_High'] if col in df_in3]
+    y_low, y_high = df_in3[y_cols].min().min(), df_in3[y_cols].max().max()
+    if overs:
+        y_low = min(overs * AVG_AXIS_SHARE[0], y_low)
+        y_high = max(overs * AVG_AXIS_SHARE[1], y_high)
+    elif not y_low <= y_high:  # no innings selected
+        y_low, y_high = 0, 1
+    y_min, y_max = int(y_low // 1), int(-(-y_high // 1))
+
+    base2 = alt.Chart(df_in3).properties(
+                width=800,
+                height=450)
+
+    plot1 = base2.mark_bar(size=15, opacity=0.6).encode(
+                x = alt.X('Season:O'),
+                y = alt.Y('Half_Del:Q',
+                          title = 'Avg. Halfway Delivery',
+                          # axis=alt.Axis(values=['168', '174', '185', '190']),
+                          axis=alt.Axis(values=list(range(y_min, y_max + 1))),
+                          scale=alt.Scale(domain=[y_min, y_max]),
+                          ),
+                color=alt.condition(
+                            alt.datum.Season == '2014-2015',
+                            alt.value('orange'),
+                            alt.value('steelblue')
+                ),
+                tooltip=['Season:O', 'Half_Del:Q'],
+                ).interactive()
+
+    plot2 = base2.mark_line(interpolate='monotone', size=5,
+                              opacity=0.5, color='yellow').encode(
+                x = alt.X('Season:O'),
+                y = alt.Y('Half_Del:Q',
+                          title = 'Avg. Halfway Delivery',
+                          )
+                )
+
+    if df_ci is None:
+        return plot1 + plot2
+
+    errorbars = base2.mark_rule(size=2, color='white', opacity=0.8).encode(
+                x = alt.X('Season:O'),
+                y = 'CI_Low:Q',
+                y2 = 'CI_High:Q',
+                tooltip=['Season:O', 'Half_Del:Q', 'Count:Q',
+                         alt.Tooltip('CI_Low:Q', title='95% CI low'),
+                         alt.Tooltip('CI_High:Q', title='95% CI high')],
+                )
+
+    return plot1 + plot2 + errorbars
+
+def season_dist_chart(df_in4):
+    """ Function to build the Altair box plot with percentile band by season.
+        Parameters: df_in4 (DataFrame, season selection_distributions() table)
+        Returns: alt.LayerChart
+    """
+    import altair as alt
+
+    base3 = alt.Chart(df_in4).properties(
+                width=800,
+                height=450).encode(x=alt.X('Season:O'))
+
+    band = base3.mark_area(opacity=0.15, color='yellow').encode(
+                y=alt.Y('P10:Q', title='Halfway Delivery Over',
+                        scale=alt.Scale(zero=False)),
+                y2='P90:Q')
+
+    whisker = base3.mark_rule(opacity=0.8).encode(y='Low:Q', y2='High:Q')
+
+    box = base3.mark_bar(size=15, opacity=0.6).encode(
+                y='Q1:Q',
+                y2='Q3:Q',
+                color=alt.condition(
+                            alt.datum.Season == '2014-2015',
+                            alt.value('orange'),
+                            alt.value('steelblue')
+                ),
+                tooltip=['Season:O', 'Count:Q', 'Low:Q', 'P10:Q', 'Q1:Q',
+                         'Median:Q', 'Q3:Q', 'P90:Q', 'High:Q'])
+
+    median = base3.mark_tick(color='white', size=15, thickness=2).encode(
+                y='Median:Q')
+
+    return band + whisker + box + median
+
+def team_violin_chart(df_in5, dim_team):
+    """ Function to build the Altair violin plots by batting team.
+        Parameters: df_in5 (DataFrame, team density table from
+                    selection_distributions())
+                    dim_team (DataFrame, team dimension with colours)
+        Returns: alt.FacetChart
+    """
+    import altair as alt
+
+    return alt.Chart(df_in5).mark_area(orient='horizontal', opacity=0.7
+                                      ).encode(
+                y=alt.Y('Over:Q', title='Halfway Delivery Over',
+                        scale=alt.Scale(zero=False)),
+                x=alt.X('Density:Q', stack='center', impute=None, title=None,
+                        axis=alt.Axis(labels=False, values=[0], grid=False)),
+                color=alt.Color('Batting_Team:N', scale=team_color_scale(dim_team),
+                                legend=None),
+                column=alt.Column('Batting_Team:N', title=None,
+                                  header=alt.Header(labelOrient='bottom',
+                                                    labelAngle=-45,
+                                                    labelAlign='right')),
+                tooltip=['Batting_Team', 'Over', alt.Tooltip('Density:Q', format='.1%')]
+                ).properties(width=60, height=400
+                ).configure_facet(spacing=0
+                ).configure_view(stroke=None)
+
+def matchup_chart(df_pairs):
+    """ Function to build the Altair head to head heatmap: mean halfway
+        delivery of each batting team against each bowling team, with the
+        innings count in the cell.
+        Parameters: df_pairs (DataFrame, core.selection_matchups())
+        Returns: alt.LayerChart
+    """
+    import altair as alt
+
+    # dark text on the light (upper) half of the colour scale
+    light = float(df_pairs['Half_Del'].median()) if len(df_pairs) else 0.0
+    base = alt.Chart(df_pairs).encode(
+                x=alt.X('Bowling_Team:N', title='Bowling team',
+                        axis=alt.Axis(orient='top', labelAngle=-45)),
+                y=alt.Y('Batting_Team:N', title='Batting team'))
+
+    cells = base.mark_rect().encode(
+                color=alt.Color('Half_Del:Q', title='Avg Halfway Delivery',
+                                scale=alt.Scale(scheme='viridis', zero=False)),
+                tooltip=['Batting_Team', 'Bowling_Team',
+                         alt.Tooltip('Half_Del:Q', title='Avg Halfway Delivery'),
+                         alt.Tooltip('Count:Q', title='Innings')])
+
+    counts = base.mark_text(fontSize=10).encode(
+                text='Count:Q',
+                color=alt.condition(alt.datum.Half_Del > light,
+                                    alt.value('black'), alt.value('white')))
+
+    return (cells + counts).properties(width=alt.Step(32), height=alt.Step(26))
+
+def trend_chart(df_trend, dim_team, x='Start', tooltip=('Period', 'Count')):
+    """ Function to build the Altair halfway delivery trend lines by team
+        (a combined 'All' series is drawn in white).
+        Parameters: df_trend (DataFrame, core.selection_trend() or
+                    core.selection_rolling() table)
+                    dim_team (DataFrame, team dimension with colours)
+                    x (str, date column), tooltip (extra tooltip columns)
+        Returns: alt.LayerChart
+    """
+    import altair as alt
+
+    color_scale = alt.Scale(domain=dim_team['Team'].tolist() + ['All'],
+                            range=dim_team['Colour'].tolist() + ['white'])
+    base = alt.Chart(df_trend).encode(
+                x=alt.X(x + ':T', title='Match Date'),
+                y=alt.Y('Half_Del:Q', title='Halfway Delivery Over',
+                        scale=alt.Scale(zero=False)),
+                color=alt.Color('Batting_Team:N', scale=color_scale,
+                                legend=alt.Legend(orient='bottom', columns=5)))
+
+    lines = base.mark_line(opacity=0.8)
+    points = base.mark_point(filled=True, size=30).encode(
+                tooltip=['Batting_Team', *tooltip,
+                         alt.Tooltip('Half_Del:Q', title='Avg Halfway Delivery')])
+
+    return (lines + points).properties(width=800, height=400).interactive()
+
+
+# %% Part 3: Innings charts
+
+def projection_chart(df_hist, max_balls=300):
+    """ Function to build the running and projected totals of replayed innings.
+        Parameters: df_hist (DataFrame: Innings, Balls, Runs, Projected)
+                    max_balls (int, balls in a full innings of the format)
+        Returns: alt.LayerChart
+    """
+    import altair as alt
+
+    base = alt.Chart(df_hist).encode(
+        x=alt.X('Balls:Q', title='Legal deliveries',
+                scale=alt.Scale(domain=[0, max_balls])),
+        color=alt.Color('Innings:N', legend=alt.Legend(orient='bottom')))
+    runs = base.mark_line(strokeDash=[4, 2]).encode(
+        y=alt.Y('Runs:Q', title='Runs'))
+    projected = base.mark_line().encode(
+        y='Projected:Q', tooltip=['Innings', 'Balls', 'Runs',
+                                  alt.Tooltip('Projected:Q', format='.0f')])
+
+    return (runs + projected).properties(height=350)
+
+def curve_chart(df_curves):
+    """ Function to build the scoring curve of an innings and its neighbours.
+        Parameters: df_curves (DataFrame: Innings, Balls, Runs, Selected)
+        Returns: alt.Chart
+    """
+    import altair as alt
+
+    curves = alt.Chart(df_curves).mark_line().encode(
+        x=alt.X('Balls:Q', title='Legal deliveries'),
+        y=alt.Y('Runs:Q', title='Cumulative runs'),
+        color=alt.Color('Innings:N', legend=alt.Legend(orient='bottom',
+                                                       columns=2)),
+        strokeWidth=alt.condition('datum.Selected', alt.value(4), alt.value(1.5)),
+        tooltip=['Innings', 'Balls', alt.Tooltip('Runs:Q', format='.0f')])
+
+    return curves.properties(height=350)
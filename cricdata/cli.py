@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/cli.py
+# Description: Batch command line of the cricdata package (no Streamlit)
+#
+# Offline precomputation for the app, run from the repo root:
+#   build    builds the app's artifacts from a data file: the published
+#            shared dataset, the projection table, the match archive (when
+#            ball-by-ball files exist) and the final score model
+#   report   writes the reports (cricdata.report) of many selections: the
+#            ones logged by the app, optionally every team on its own, and
+#            all teams over all seasons
+#   bundle   pre-renders the landing view of the default selection and the
+#            most popular logged ones as static HTML + JSON (cricdata.bundle)
+#
+# Every command works on one match format (--format, cricdata.formats): its
+# data file, shared dir and, for reports and bundles, an output subdirectory
+# named after it. The projection table, match archive and model feed the
+# replay and prediction features, which are ODI only.
+#
+# All run their work in a process pool (spawn, as jobs.py and
+# train_model.py). Report workers load the dataset once each; when the data
+# file is the published version it is memory-mapped, so the workers share
+# one copy through the page cache.
+#
+# Usage:
+#   python -m cricdata build [--artifacts dataset projection archive model]
+#   python -m cricdata report [--log FILE] [--top N] [--per-team] [--no-ci]
+#                             [--no-charts] [--out DIR]
+#   python -m cricdata bundle [--log FILE] [--top N] [--out DIR] [--app-url URL]
+#   (all also take --format ODI|T20|Test, --data-file FILE, --shared-dir DIR
+#    and --workers N)
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import os
+import time
+
+from cricdata.bundle import APP_URL, BUNDLE_DIR, render_view, write_index, write_view
+from cricdata.core import TEAMS_TOP9, load_dataset, mapped_dataset, season_grp_state
+from cricdata.formats import DEFAULT_FORMAT, FORMATS, get_format
+from cricdata.report import REPORT_DIR, selection_report, write_report
+from cricdata.selection_log import LOG_FILE, TOP_N, SelectionLog, canonical_selection
+from cricdata.shared_dataset import SharedData, publish
+from cricdata.snapshot_store import file_version
+
+WORKERS = os.cpu_count() or 1
+
+
+# %% Part 2: Building artifacts
+
+def build_dataset(data_file, shared_dir, fmt):
+    """ Publishes the data file to the shared dataset (see shared_dataset.py). """
+    return 'published ' + publish(data_file, shared_dir, fmt)
+
+def build_projection(data_file, shared_dir, fmt):
+    """ Precomputes the projection table (see projection_service.py). """
+    from cricdata.projection_service import PROJECTION_FILE, ProjectionTable
+
+    table = ProjectionTable.from_csv(data_file)
+    table.save()
+    return 'projection table from {} innings -> {}'.format(table.n_innings,
+                                                         PROJECTION_FILE)
+
+def build_match_archive(data_file, shared_dir, fmt):
+    """ Archives the ball-by-ball files in MATCH_DIR (see match_archive.py). """
+    from cricdata.match_archive import ARCHIVE_FILE, MATCH_DIR, build_archive, match_files
+
+    files = match_files()
+    if not files:
+        return 'skipped: no ball-by-ball files in ' + MATCH_DIR
+    return 'archived {} matches -> {}'.format(build_archive(files), ARCHIVE_FILE)
+
+def build_model(data_file, shared_dir, fmt):
+    """ Trains the final score model (see train_model.py). """
+    from cricdata.train_model import train
+
+    path, df_cv = train(data_file)
+    return 'saved {} ({} MAE {:.1f})'.format(path, df_cv.index[0],
+                                             df_cv['mae'].iloc[0])
+
+ARTIFACTS = {'dataset': build_dataset, 'projection': build_projection,
+             'archive': build_match_archive, 'model': build_model}
+ODI_ARTIFACTS = ('projection', 'archive', 'model')  # replays and predictions
+
+def _build_one(name, data_file, shared_dir, fmt):
+    """ Builds one artifact in a worker process. """
+    if name in ODI_ARTIFACTS and fmt != 'ODI':
+        return 'skipped: ODI only'
+    return ARTIFACTS[name](data_file, shared_dir, fmt)
+
+
+# %% Part 3: Reports
+
+_data, _grp_state, _version = None, None, None
+
+def open_dataset(data_file, shared_dir, version, fmt=DEFAULT_FORMAT):
+    """ Function to load a data file, mapping the published copy when it is
+        the same version.
+        Parameters: data_file (str), shared_dir (str)
+                    version (str, file_version() of data_file)
+                    fmt (str, format name)
+        Returns: data (dict, core.load_dataset())
+    """
+    shared = SharedData(shared_dir).current()
+    if shared is not None and shared.version == version:
+        return mapped_dataset(shared)
+
+    return load_dataset(data_file, fmt=fmt)
+
+def _init_report_worker(data_file, shared_dir, version, fmt):
+    global _data, _grp_state, _version
+    _data = open_dataset(data_file, shared_dir, version, fmt)
+    _grp_state = season_grp_state(_data['full'], _data['dims'], fmt=fmt)
+    _version = version
+
+def _run_report(selection, out_dir, ci, charts):
+    """ Writes one selection's report in a worker process. """
+    start = time.perf_counter()
+    report = selection_report(_data, _grp_state, selection, ci)
+    path = write_report(report, selection, _version, out_dir,
+                        _data['dims']['team'] if charts else None, _data['format'])
+
+    return path, len(report['innings']), time.perf_counter() - start
+
+def _render_view(selection, out_dir):
+    """ Pre-renders one bundle view in a worker process. """
+    start = time.perf_counter()
+    view = render_view(_data, _grp_state, selection)
+
+    return (view['name'], view['label'], write_view(view, out_dir), view['innings'],
+            time.perf_counter() - start)
+
+def valid_selections(data, selections):
+    """ Function to drop selections this dataset cannot show (no teams,
+        unknown seasons, as app_data.warm_caches) and duplicates.
+        Returns: selections (list, in the given order)
+    """
+    seasons = data['seasons']
+    valid = [(teams, start, end) for teams, start, end in selections
+             if teams and start in seasons and end in seasons
+             and seasons.index(start) <= seasons.index(end)]
+
+    return list(dict.fromkeys(valid))
+
+def report_selections(data, log_file=LOG_FILE, top=None, per_team=False):
+    """ Function to collect the selections to report on.
+        Parameters: data (dict, core.load_dataset())
+                    log_file (str, JSON lines as written by SelectionLog)
+                    top (int, most popular logged selections, None: all)
+                    per_team (bool, add every team on its own)
+        Returns: selections (list of canonical selections, no duplicates)
+    """
+    seasons, teams = data['seasons'], data['teams']
+    selections = [canonical_selection(teams, seasons[0], seasons[-1])]
+    selections += [selection for selection, _ in SelectionLog(log_file).popular(top)]
+    if per_team:
+        selections += [canonical_selection([team], seasons[0], seasons[-1])
+                       for team in teams]
+
+    return valid_selections(data, selections)
+
+def bundle_selections(data, log_file=LOG_FILE, top=TOP_N):
+    """ Function to collect the bundle's views: the app's default selection
+        (top 9 teams, all seasons) first, then the most popular logged ones.
+        Returns: selections (list of canonical selections, no duplicates)
+    """
+    seasons = data['seasons']
+    default = canonical_selection([team for team in TEAMS_TOP9 if team in data['teams']],
+                                  seasons[0], seasons[-1])
+
+    return valid_selections(data, [default] + [selection for selection, _ in
+                                               SelectionLog(log_file).popular(top)])
+
+
+# %% Part 4: Command line
+
+def run_pool(fn, tasks, workers, initializer=None, initargs=()):
+    """ Function to run fn over tasks in a process pool (in this process when
+        workers is 1), yielding (task, result or exception) as they finish.
+        Parameters: fn (picklable callable), tasks (list of argument tuples)
+                    workers (int), initializer, initargs (as ProcessPoolExecutor)
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for task in tasks:
+            try:
+                yield task, fn(*task)
+            except Exception as exc:
+                yield task, exc
+        return
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=initializer, initargs=initargs) as pool:
+        futures = {pool.submit(fn, *task): task for task in tasks}
+        for future in as_completed(futures):
+            exc = future.exception()
+            yield futures[future], exc if exc is not None else future.result()
+
+def main(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--format', default=DEFAULT_FORMAT, choices=list(FORMATS))
+    common.add_argument('--data-file', help='default: the format\'s data file')
+    common.add_argument('--shared-dir', help='default: the format\'s shared dir')
+    common.add_argument('--workers', type=int, default=WORKERS,
+                        help='worker processes (1: run in this process)')
+    parser = argparse.ArgumentParser(prog='python -m cricdata',
+                                     description='Batch jobs of the cricdata app')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_build = sub.add_parser('build', parents=[common],
+                             help='build the app artifacts in parallel')
+    p_build.add_argument('--artifacts', nargs='+', choices=list(ARTIFACTS),
+                         default=list(ARTIFACTS))
+    p_report = sub.add_parser('report', parents=[common],
+                              help='write reports for many selections')
+    p_report.add_argument('--log', default=LOG_FILE,
+                          help='selections logged by the app (JSON lines)')
+    p_report.add_argument('--top', type=int, help='most popular logged selections only')
+    p_report.add_argument('--per-team', action='store_true',
+                          help='also report every team over all seasons')
+    p_report.add_argument('--no-ci', action='store_true',
+                          help='skip the bootstrap confidence intervals')
+    p_report.add_argument('--no-charts', action='store_true',
+                          help='skip the Vega-Lite chart specs')
+    p_report.add_argument('--out', help='default: {}<format>/'.format(REPORT_DIR))
+    p_bundle = sub.add_parser('bundle', parents=[common],
+                              help='pre-render popular views as static HTML + JSON')
+    p_bundle.add_argument('--log', default=LOG_FILE,
+                          help='selections logged by the app (JSON lines)')
+    p_bundle.add_argument('--top', type=int, default=TOP_N,
+                          help='most popular logged selections to pre-render')
+    p_bundle.add_argument('--out', help='default: {}<format>/'.format(BUNDLE_DIR))
+    p_bundle.add_argument('--app-url', default=APP_URL,
+                          help='interactive app linked for custom selections')
+    args = parser.parse_args(argv)
+    match_format = get_format(args.format)
+    data_file = args.data_file or match_format.data_file
+    shared_dir = args.shared_dir or match_format.shared_dir
+
+    if args.command == 'build':
+        fn, tasks = _build_one, [(name, data_file, shared_dir, args.format)
+                                 for name in args.artifacts]
+        init, initargs = None, ()
+    else:
+        version = file_version(data_file)
+        data = open_dataset(data_file, shared_dir, version, args.format)
+        init, initargs = _init_report_worker, (data_file, shared_dir, version,
+                                               args.format)
+        args.out = args.out or (REPORT_DIR if args.command == 'report'
+                                else BUNDLE_DIR) + args.format + '/'
+        if args.command == 'report':
+            fn = _run_report
+            tasks = [(selection, args.out, not args.no_ci, not args.no_charts)
+                     for selection in report_selections(data, args.log, args.top,
+                                                        args.per_team)]
+        else:
+            fn = _render_view
+            tasks = [(selection, args.out)
+                     for selection in bundle_selections(data, args.log, args.top)]
+    workers = max(1, min(args.workers, len(tasks)))
+
+    start, failures, results = time.perf_counter(), 0, {}
+    for task, result in run_pool(fn, tasks, workers, init, initargs):
+        if isinstance(result, Exception):
+            failures += 1
+            print('FAILED {}: {!r}'.format(task[0], result))
+        elif args.command == 'build':
+            print('{:<11} {}'.format(task[0], result))
+        else:
+            results[task[0]] = result
+            path, n_innings, seconds = result[-3:]
+            print('{:>6} innings {:6.2f}s  {}'.format(n_innings, seconds, path))
+    if args.command == 'bundle' and tasks[0][0] in results:
+        # the default view first, then the popular ones in order
+        views = [results[task[0]][:2] for task in tasks if task[0] in results]
+        print('wrote', write_index(data, views, version, args.out, args.app_url))
+    print('{} {} in {:.1f}s ({} workers, {} failed)'.format(
+        len(tasks), {'build': 'artifacts', 'report': 'reports',
+                     'bundle': 'views'}[args.command],
+        time.perf_counter() - start, workers, failures))
+
+    return 1 if failures else 0
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/core.py
+# Description: Dataset loading and per-selection calculations
+#
+# The compute layer shared by the Streamlit app (app_data.py wraps these
+# functions in its caches), the batch CLI (cricdata.cli runs them in worker
+# processes) and the benchmarks. Nothing here imports Streamlit.
+#
+# A dataset is a dict of tables of one match format (version, format, dims,
+# fact, full, season_avg, all_avg_ihd) plus the ranges the sidebar offers
+# (seasons, teams) and the latest innings. `full` holds the format's full
+# innings (cricdata.formats). A selection is canonical_selection(): (teams,
+# start season, end season).
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import pandas as pd
+
+from cricdata.agg_state import GroupedAggState, season_averages
+from cricdata.bootstrap import bootstrap_batches, hist_values
+from cricdata.changepoint import detect_regimes
+from cricdata.dimensions import build_star_schema, denormalise, season_id, team_ids
+from cricdata.distributions import (ball_to_del, density_frame, distribution_frame,
+                                    select_states)
+from cricdata.formats import DATA_DIR, DEFAULT_FORMAT, get_format
+from cricdata.matchups import MatchupCube, matchup_frame
+from cricdata.time_pyramid import TimePyramid, rolling_frame, trend_frame
+
+# default team selection (sidebar and pre-rendered bundle)
+TEAMS_TOP9 = ['Australia', 'Bangladesh', 'England', 'India',
+              'New Zealand', 'Pakistan', 'South Africa', 'Sri Lanka', 'West Indies']
+
+AGG_BY = ('Season', 'Batting_Team')  # group keys of the aggregate state
+BOOTSTRAP_BATCHES = 2  # independent season batches (background jobs in the app)
+
+
+# %% Part 2: Loading data
+
+def csv2df(data_file):
+    """ Function to fetch cricdata all summary data from a .csv file """
+    df_cs2 = pd.read_csv(data_file)
+    df_cs2['Date'] = pd.to_datetime(df_cs2['Date'])
+
+    return df_cs2
+
+def read_cric_csv(df_cs1, fmt=DEFAULT_FORMAT):
+    """ Functon to read cricsheet_stdata_<format>
+        Parameters: df_cs1 (df, cricsheet fact table)
+                    fmt (str, format name, see cricdata.formats)
+        Returns: df_full (fact DataFrame of the format's full innings)
+    """
+    # calc df for full innings (season names live in dims['season'])
+    match_format = get_format(fmt)
+    df_full = df_cs1[match_format.full_innings(df_cs1)]
+    df_full = df_full.reset_index(drop=True)
+    df_full = df_full.drop(columns=[col for col in ['Final_Del', match_format.flag_column]
+                                    if col in df_full])
+
+    return df_full
+
+def agg_frame(df_in1, dims):
+    """ Function to select the aggregate state's input columns, with season
+        and team names as the state's group keys (stable across data files).
+        Parameters: df_in1 (DataFrame, df returned by read_cric_csv())
+                    dims (dict of DataFrames, dimension tables)
+        Returns: df_sahd (DataFrame: Match_ID, Inn_Num, Half_Ball, Season,
+                 Batting_Team)
+    """
+    df_sahd = df_in1.loc[:, ['Match_ID', 'Inn_Num', 'Half_Ball']]
+    df_sahd['Season'] = dims['season']['Season'].to_numpy()[df_in1['Season_ID']]
+    df_sahd['Batting_Team'] = dims['team']['Team'].to_numpy()[df_in1['Batting_Team_ID']]
+
+    return df_sahd
+
+def season_grp_state(df_in1, dims, state=None, fmt=DEFAULT_FORMAT):
+    """ Function to aggregate innings into (Season, Batting_Team) states.
+        Parameters: df_in1 (DataFrame, df returned by read_cric_csv())
+                    dims (dict of DataFrames, dimension tables)
+                    state (IncrementalAggregates, optional: merge only
+                    added/corrected innings into it)
+                    fmt (str, format name: histogram size of a new state)
+        Returns: grp_state (GroupedAggState)
+    """
+    if state is not None:
+        return state.sync(agg_frame(df_in1, dims))
+
+    return GroupedAggState.from_frame(agg_frame(df_in1, dims), list(AGG_BY),
+                                      size=get_format(fmt).max_balls + 1)
+
+def season_grp_calc(df_in1, dims, state=None, fmt=DEFAULT_FORMAT):
+    """ Function to calculate season average delivery number at which half of
+        total runs is reached.
+        Parameters: df_in1 (DataFrame, df returned by read_cric_csv())
+                    dims (dict of DataFrames, dimension tables)
+                    state (IncrementalAggregates, optional, see season_grp_state())
+                    fmt (str, format name)
+        Returns: season_grp_AHB (DataFrame), all_AHD (string of delivery numbers)
+    """
+    return season_averages(season_grp_state(df_in1, dims, state, fmt))
+
+def dataset_ranges(df_fact, df_full, dims):
+    """ Function to find the sidebar ranges and the latest innings of a dataset.
+        Parameters: df_fact (DataFrame, all innings), df_full (DataFrame)
+                    dims (dict of DataFrames, dimension tables)
+        Returns: ranges (dict: seasons, teams (lists of names with full
+                 innings), last_inn (Series, latest innings))
+    """
+    season_names = dims['season'].set_index('Season_ID')['Season']
+    # dimension tables are sorted by name, so id order == name order
+    teams = list(dims['team'].loc[dims['team']['Team_ID']
+                                  .isin(df_full['Batting_Team_ID']), 'Team'])
+
+    return {'seasons': list(season_names[sorted(df_full['Season_ID'].unique())]),
+            'teams': teams,
+            'last_inn': denormalise(df_fact.tail(1), dims).iloc[0]}
+
+def load_dataset(data_file=None, state=None, fmt=DEFAULT_FORMAT):
+    """ Function to load a data file into the tables of a dataset.
+        Parameters: data_file (str, path of .csv file, default: the format's)
+                    state (IncrementalAggregates, optional, see season_grp_state())
+                    fmt (str, format name, see cricdata.formats)
+        Returns: data (dict: version (None), format, dims, fact, full,
+                 season_avg, all_avg_ihd and the dataset_ranges())
+    """
+    df_cs = csv2df(data_file or get_format(fmt).data_file)
+    dims, df_fact = build_star_schema(df_cs)
+    df_full = read_cric_csv(df_fact, fmt)
+    df_ssn, all_avg_ihd = season_grp_calc(df_full, dims, state, fmt)
+
+    return dict(version=None, format=fmt, dims=dims, fact=df_fact, full=df_full,
+                season_avg=df_ssn, all_avg_ihd=all_avg_ihd,
+                **dataset_ranges(df_fact, df_full, dims))
+
+def mapped_dataset(mapped, state=None):
+    """ Function to collect the tables of a published version (no copies of
+        the mapped numeric columns).
+        Parameters: mapped (MappedDataset, from shared_dataset.SharedData)
+                    state (IncrementalAggregates, optional: synced with it)
+        Returns: data (dict, as load_dataset())
+    """
+    dims, df_fact = mapped.dims, mapped.frames['fact']
+    df_full = mapped.frames['full']
+    if state is not None:
+        state.sync(agg_frame(df_full, dims))
+
+    return dict(version=mapped.version, format=mapped.meta['format'], dims=dims,
+                fact=df_fact, full=df_full, season_avg=mapped.frames['season_avg'],
+                all_avg_ihd=mapped.meta['all_avg_ihd'],
+                **dataset_ranges(df_fact, df_full, dims))
+
+
+# %% Part 3: Selections
+
+def season_range(seasons, start_season, end_season):
+    """ Returns the season names from start_season to end_season (inclusive). """
+    return tuple(seasons[seasons.index(start_season):seasons.index(end_season) + 1])
+
+def filter_selection(df_full, dims, teams, start_season, end_season):
+    """ Function to filter full innings for a selection (on integer keys,
+        then join names for display).
+        Parameters: df_full (fact DataFrame), dims (dict of DataFrames)
+                    teams (tuple of team names), start_season, end_season (str)
+        Returns: selection_df (DataFrame, denormalised)
+    """
+    selection_fact = df_full[
+              (df_full['Batting_Team_ID'].isin(team_ids(dims['team'], teams)))
+              & (df_full['Season_ID'] >= season_id(dims['season'], start_season))
+              & (df_full['Season_ID'] <= season_id(dims['season'], end_season))]
+
+    return denormalise(selection_fact, dims)
+
+def selection_regimes(df_in):
+    """ Function to detect halfway delivery regime changes (PELT) overall and
+        per team.
+        Parameters: df_in (DataFrame, selected innings)
+        Returns: df_seg (DataFrame of regimes: Batting_Team, Start, End,
+                 Half_Ball, Count, Half_Del)
+    """
+    df_seg = detect_regimes(df_in)
+    df_seg['Half_Del'] = ball_to_del(df_seg['Half_Ball'])
+
+    return df_seg
+
+def selection_distributions(grp_state, seasons, teams):
+    """ Function to merge (Season, Team) sketches into distribution tables for
+        the selected seasons and teams (no sorting of innings rows).
+        Parameters: grp_state (GroupedAggState)
+                    seasons, teams (tuples of selected names)
+        Returns: df_ssn_dist, df_team_dist, df_team_dens (DataFrames)
+    """
+    season_states = select_states(grp_state, seasons, teams, 0)
+    team_states = select_states(grp_state, seasons, teams, 1)
+
+    return (distribution_frame(season_states, 'Season'),
+            distribution_frame(team_states, 'Batting_Team'),
+            density_frame(team_states, 'Batting_Team'))
+
+def matchup_cube(df_full, dims):
+    """ Function to aggregate full innings into (Season, Batting_Team,
+        Bowling_Team) counts and sums (see cricdata.matchups).
+        Parameters: df_full (fact DataFrame), dims (dict of DataFrames)
+        Returns: cube (MatchupCube)
+    """
+    return MatchupCube.from_frame(df_full, len(dims['season']), len(dims['team']))
+
+def selection_matchups(cube, dims, teams, start_season, end_season):
+    """ Function to total the head to head pairs of the selected batting
+        teams over a season range (from the cube, no innings rows).
+        Parameters: cube (MatchupCube), dims (dict of DataFrames)
+                    teams (tuple of team names), start_season, end_season (str)
+        Returns: df_pairs (DataFrame, see matchups.matchup_frame())
+    """
+    return matchup_frame(cube, dims['team'], season_id(dims['season'], start_season),
+                         season_id(dims['season'], end_season),
+                         team_ids(dims['team'], teams))
+
+def time_pyramid(df_full, dims):
+    """ Function to aggregate full innings into Month, Season and Year buckets
+        per team, with running sums for rolling windows (see
+        cricdata.time_pyramid).
+        Parameters: df_full (fact DataFrame), dims (dict of DataFrames)
+        Returns: pyramid (TimePyramid)
+    """
+    return TimePyramid.from_frame(df_full, len(dims['season']), len(dims['team']))
+
+def selection_trend(pyramid, dims, level, teams, start_season, end_season,
+                    combine=False):
+    """ Function to get the average halfway delivery of the selected teams
+        per time bucket of one granularity (from the pyramid, no innings rows).
+        Parameters: pyramid (TimePyramid), dims (dict of DataFrames)
+                    level (str, 'Month', 'Season' or 'Year')
+                    teams (tuple of team names), start_season, end_season (str)
+                    combine (bool, one 'All' series for the selected teams)
+        Returns: df_trend (DataFrame, see time_pyramid.trend_frame())
+    """
+    return trend_frame(pyramid, dims, level, team_ids(dims['team'], teams),
+                       season_id(dims['season'], start_season),
+                       season_id(dims['season'], end_season), combine)
+
+def selection_rolling(pyramid, dims, window, teams, start_season, end_season):
+    """ Function to get the selected teams' average halfway delivery over
+        their trailing `window` innings, for innings in the season range.
+        Parameters: pyramid (TimePyramid), dims (dict of DataFrames)
+                    window (int), teams (tuple of team names)
+                    start_season, end_season (str)
+        Returns: df_rolling (DataFrame, see time_pyramid.rolling_frame())
+    """
+    return rolling_frame(pyramid, dims, window, team_ids(dims['team'], teams),
+                         season_id(dims['season'], start_season),
+                         season_id(dims['season'], end_season))
+
+def season_ci_batches(grp_state, seasons, teams, n_batches):
+    """ Function to split the bootstrap of season means into independent
+        batches (see bootstrap_ci()). Resamples are drawn from the merged
+        season sketches, so every caller gets the same intervals.
+        Parameters: grp_state (GroupedAggState)
+                    seasons, teams (tuples of selected names)
+                    n_batches (int)
+        Returns: batches (list of (samples dict, SeedSequence))
+    """
+    states = select_states(grp_state, seasons, teams, 0)
+    samples = {season: hist_values(states[season].hist) if season in states else []
+               for season in seasons}
+
+    return bootstrap_batches(samples, n_batches)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/curve_index.py
+# Description: Nearest-neighbour index over innings scoring curves
+#
+# Each innings has three points of its cumulative scoring curve: the start,
+# the halfway delivery (Half_Ball, Half_Total) and the end (Final_Del,
+# Final_Total). The curve through them is sampled every CURVE_STEP balls
+# (flat after an all-out finish) and scaled to z-scores per sample, so early
+# and late balls weigh the same. Queries are answered in batches with one
+# matrix product: |q - x|^2 = |q|^2 + |x|^2 - 2 q.x
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import numpy as np
+import pandas as pd
+
+MAX_BALLS = 300
+CURVE_STEP = 12         # balls between curve samples (2 overs)
+TOP_K = 5
+QUERY_BATCH = 1024      # query curves per distance matrix
+
+
+# %% Part 2: Scoring curves
+
+def del_to_ball(dels):
+    """ Function to convert delivery notation (43.4) to legal ball numbers.
+        Parameters: dels (array-like of float, over.ball)
+        Returns: balls (ndarray of int; wides and no-balls past the 6th
+                 delivery of an over count as the 6th)
+    """
+    dels = np.asarray(dels, dtype=float)
+    overs = np.floor(dels + 1e-9)
+    return (overs * 6 + np.minimum(np.rint((dels - overs) * 10), 6)).astype(np.int64)
+
+def scoring_curves(df_in, step=CURVE_STEP, max_balls=MAX_BALLS):
+    """ Function to sample the piecewise-linear cumulative scoring curve of
+        every innings.
+        Parameters: df_in (DataFrame with Half_Ball, Half_Total, Final_Del,
+                    Final_Total), step (int, balls between samples)
+        Returns: curves (ndarray, innings x samples, runs), balls (ndarray)
+    """
+    balls = np.arange(step, max_balls + 1, step, dtype=float)
+    half_ball = df_in['Half_Ball'].to_numpy(dtype=float)[:, None]
+    half_total = df_in['Half_Total'].to_numpy(dtype=float)[:, None]
+    final_ball = np.maximum(del_to_ball(df_in['Final_Del'])[:, None], half_ball)
+    final_total = df_in['Final_Total'].to_numpy(dtype=float)[:, None]
+
+    first = half_total * balls / np.maximum(half_ball, 1)
+    span = np.maximum(final_ball - half_ball, 1)
+    second = half_total + (final_total - half_total) \
+        * np.minimum(balls - half_ball, span) / span
+    curves = np.where(balls <= half_ball, first, second)
+
+    return curves, balls.astype(np.int64)
+
+
+# %% Part 3: Index
+
+class CurveIndex:
+    """ Flat (exact) nearest-neighbour index over standardised curves. """
+
+    def __init__(self, df_in, step=CURVE_STEP, max_balls=MAX_BALLS):
+        """ Builds the index.
+            Parameters: df_in (DataFrame of innings with Match_ID, Inn_Num
+                        and the scoring_curves() columns), step (int)
+                        max_balls (int, curve length, the format's innings)
+        """
+        curves, self.balls = scoring_curves(df_in, step, max_balls)
+        self.keys = df_in[['Match_ID', 'Inn_Num']].reset_index(drop=True)
+        self.curves = curves
+        self.mean = curves.mean(axis=0)
+        self.scale = np.where(curves.std(axis=0) > 0, curves.std(axis=0), 1.0)
+        self.vectors = self._standardise(curves)
+        self.sq_norms = np.einsum('ij,ij->i', self.vectors, self.vectors)
+        self._positions = pd.Series(np.arange(len(self.keys)),
+                                    index=pd.MultiIndex.from_frame(self.keys))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _standardise(self, curves):
+        return ((curves - self.mean) / self.scale).astype(np.float32)
+
+    def query(self, curves, k=TOP_K, batch_size=QUERY_BATCH, exclude=None):
+        """ Function to find the k nearest innings of each query curve.
+            Parameters: curves (ndarray, queries x samples, runs)
+                        k (int), batch_size (int, queries per matrix product)
+                        exclude (array of int, index position per query to
+                        leave out, e.g. the query innings itself; -1 for none)
+            Returns: positions (ndarray, queries x k), distances (ndarray)
+        """
+        queries = self._standardise(np.atleast_2d(curves))
+        k = min(k, len(self) - (exclude is not None))
+        positions = np.empty((len(queries), k), dtype=np.int64)
+        distances = np.empty((len(queries), k))
+
+        for first in range(0, len(queries), batch_size):
+            q = queries[first:first + batch_size]
+            d2 = self.sq_norms[None, :] - 2.0 * (q @ self.vectors.T) \
+                + np.einsum('ij,ij->i', q, q)[:, None]
+            if exclude is not None:
+                rows = np.flatnonzero(exclude[first:first + batch_size] >= 0)
+                d2[rows, exclude[first:first + batch_size][rows]] = np.inf
+            top = np.argpartition(d2, k - 1, axis=1)[:, :k]
+            top_d2 = np.take_along_axis(d2, top, axis=1)
+            order = np.argsort(top_d2, axis=1)
+            positions[first:first + len(q)] = np.take_along_axis(top, order, axis=1)
+            distances[first:first + len(q)] = np.sqrt(np.maximum(
+                np.take_along_axis(top_d2, order, axis=1), 0))
+
+        return positions, distances
+
+    def position(self, match_id, inn_num):
+        return int(self._positions[(match_id, inn_num)])
+
+    def similar(self, match_id, inn_num, k=TOP_K):
+        """ Function to find the innings most similar to an indexed innings.
+            Parameters: match_id (int), inn_num (int), k (int)
+            Returns: df_sim (DataFrame: Match_ID, Inn_Num, Distance), closest
+                     first, without the innings itself
+        """
+        pos = self.position(match_id, inn_num)
+        positions, distances = self.query(self.curves[pos], k,
+                                          exclude=np.array([pos]))
+        df_sim = self.keys.iloc[positions[0]].reset_index(drop=True)
+        df_sim['Distance'] = distances[0]
+
+        return df_sim
+
+    def curve_frame(self, positions, label_col='Innings', labels=None):
+        """ Function to tabulate indexed curves for plotting.
+            Parameters: positions (list of int), labels (list of str)
+            Returns: df_curves (DataFrame: Innings, Balls, Runs)
+        """
+        labels = labels if labels is not None else [str(p) for p in positions]
+        balls = np.r_[0, self.balls]
+        return pd.DataFrame({
+            label_col: np.repeat(labels, len(balls)),
+            'Balls': np.tile(balls, len(positions)),
+            'Runs': np.hstack([np.r_[0.0, self.curves[p]] for p in positions])})
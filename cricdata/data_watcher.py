@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sun Oct 19, 2025
+# Script Name: cricdata/data_watcher.py
+# Description: Hot reload of new data files (stale-while-revalidate)
+#
+# A background thread polls the data file every POLL_INTERVAL seconds. When
+# its size or modification time changes, and stays the same for one more
+# poll (so a file still being copied is not read), the watcher publishes
+# the new content with shared_dataset.publish(). That builds the derived
+# tables in a new version directory while CURRENT still points at the old
+# one, then flips the pointer. Until the flip, every session keeps being
+# served the previous version.
+#
+# Content that hashes to the already published version is not rebuilt, so
+# touching the file or several processes watching the same file is cheap.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import os
+import threading
+import time
+
+from cricdata.formats import DEFAULT_FORMAT
+from cricdata.shared_dataset import SHARED_DIR, current_version, publish
+from cricdata.snapshot_store import file_version
+
+POLL_INTERVAL = 5  # seconds between checks of the data file
+
+
+# %% Part 2: Watcher
+
+class DataWatcher:
+    """ Republishes a data file to the shared dataset whenever it changes. """
+
+    def __init__(self, data_file, shared_dir=SHARED_DIR, interval=POLL_INTERVAL,
+                 on_publish=(), fmt=DEFAULT_FORMAT):
+        """ Parameters: data_file (str, watched .csv file)
+                        shared_dir (str), interval (float, seconds)
+                        on_publish (callables, called with the new version)
+                        fmt (str, match format of the file)
+        """
+        self.data_file = data_file
+        self.shared_dir = shared_dir
+        self.fmt = fmt
+        self.interval = interval
+        self.on_publish = list(on_publish)
+        self.last_check = None
+        self.last_published = None
+        self.error = None
+        self._signature = None      # (size, mtime) of the last checked file
+        self._pending = None        # changed signature waiting to settle
+
+    def _stat(self):
+        try:
+            st = os.stat(self.data_file)
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def check(self):
+        """ Function to publish the data file if it changed since the last
+            check and has since settled.
+            Returns: version (str, newly published) or None
+        """
+        self.last_check = time.time()
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            self._pending = None
+            return None
+        if self._signature is not None and signature != self._pending:
+            self._pending = signature  # wait one poll for writes to finish
+            return None
+
+        try:
+            version = file_version(self.data_file)
+            if version == current_version(self.shared_dir):
+                published = None
+            else:
+                published = publish(self.data_file, self.shared_dir, self.fmt)
+                self.last_published = published
+                for callback in self.on_publish:
+                    callback(published)
+        except Exception as err:  # e.g. a malformed file: retry on next change
+            self.error, published = err, None
+        else:
+            self.error = None
+
+        self._signature, self._pending = signature, None
+        return published
+
+    def start(self):
+        """ Function to check now and then every interval in a daemon thread. """
+        def watch():
+            while True:
+                self.check()
+                time.sleep(self.interval)
+
+        threading.Thread(target=watch, daemon=True, name='data-watcher').start()
+        return self
+
+    def status(self):
+        return {'data_file': self.data_file, 'format': self.fmt,
+                'published': current_version(self.shared_dir),
+                'last_check': self.last_check,
+                'error': repr(self.error) if self.error else None}
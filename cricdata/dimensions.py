@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/dimensions.py
+# Description: Star-schema dimension tables for cricsheet_stdata_ODI data
+#
+# Team, venue and season names are moved out of the innings rows into small
+# dimension tables and replaced in the fact table by integer surrogate keys.
+# Keys are assigned in sorted name order, so a range of Season_ID values
+# selects the same rows as the equivalent range of Season strings.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import numpy as np
+import pandas as pd
+
+# team colours used by chart encodings (teams not listed use DEFAULT_COLOUR)
+TEAM_COLOURS = {
+    'Africa XI': 'DarkGreen', 'Asia XI': 'LightBlue', 'Australia': 'Gold',
+    'Bangladesh': '#006747', 'Bermuda': 'Blue', 'Canada': 'Red',
+    'Denmark': 'Red', 'England': 'Navy', 'Hong Kong': 'Green',
+    'India': 'SkyBlue', 'Ireland': '#169b62', 'Italy': 'Blue',
+    'Kenya': 'DarkGreen', 'Malaysia': 'Yellow', 'Namibia': 'Blue',
+    'Nepal': 'Blue', 'Netherlands': 'OrangeRed', 'New Zealand': 'Black',
+    'Oman': 'Red', 'P.N.G.': 'Black', 'Pakistan': 'Lime', 'Scotland': 'Blue',
+    'South Africa': '#007a4d', 'Sri Lanka': 'DarkBlue', 'U.A.E.': 'Grey',
+    'U.S.A.': 'Blue', 'Uganda': 'Yellow', 'West Indies': '#7b0041',
+    'Zimbabwe': 'Red',
+    }
+DEFAULT_COLOUR = 'LightGrey'
+
+# fact table columns holding team names -> surrogate key column
+TEAM_KEYS = {'Batting_Team': 'Batting_Team_ID',
+             'Bowling_Team': 'Bowling_Team_ID',
+             'Toss_Winner': 'Toss_Winner_ID',
+             'Winner': 'Winner_ID',
+             'Home_Team': 'Home_Team_ID'}
+
+NO_KEY = -1  # key used for missing values (e.g. no result -> no Winner)
+
+# column order of the source csv, restored by denormalise()
+INNINGS_COLUMNS = ['Match_ID', 'Batting_Team', 'Bowling_Team', 'Inn_Num',
+                   'Final_Del', 'Final_Total', 'Final_Wickets', 'Half_Del',
+                   'Half_Ball', 'Half_Total', 'Full_50', 'Season', 'Date',
+                   'Venue', 'City', 'Toss_Winner', 'Toss_Decision', 'Winner',
+                   'Home_Team']
+
+
+# %% Part 2: Dimension tables
+
+def _key_dtype(size):
+    return np.int8 if size < 127 else np.int16 if size < 32767 else np.int32
+
+def _venue_city(venue):
+    """ Returns the city suffix of a venue name ('McLean Park, Napier'). """
+    return venue.rsplit(', ', 1)[1] if ', ' in venue else ''
+
+def build_dim_team(df_cs):
+    """ Function to build the team dimension.
+        Parameters: df_cs (DataFrame, cricsheet innings data)
+        Returns: dim_team (DataFrame: Team_ID, Team, Colour)
+    """
+    names = pd.concat([df_cs[col] for col in TEAM_KEYS if col in df_cs])
+    teams = sorted(names.dropna().unique())
+    dim_team = pd.DataFrame({'Team': teams})
+    dim_team.insert(0, 'Team_ID', np.arange(len(teams),
+                                            dtype=_key_dtype(len(teams))))
+    dim_team['Colour'] = dim_team['Team'].map(TEAM_COLOURS).fillna(DEFAULT_COLOUR)
+
+    return dim_team
+
+def build_dim_venue(df_cs):
+    """ Function to build the venue dimension. City falls back to the suffix
+        of the venue name; Country is the most common Home_Team at the venue
+        when the source provides one.
+        Parameters: df_cs (DataFrame, cricsheet innings data)
+        Returns: dim_venue (DataFrame: Venue_ID, Venue, City, Country)
+    """
+    cols = [col for col in ['Venue', 'City', 'Home_Team'] if col in df_cs]
+    df_v = df_cs[cols].copy()
+    for col in ['City', 'Home_Team']:
+        if col not in df_v:
+            df_v[col] = np.nan
+
+    def first_mode(values):
+        values = values.dropna()
+        return values.mode().iloc[0] if len(values) else ''
+
+    dim_venue = df_v.groupby('Venue', sort=True).agg(
+        City=('City', first_mode), Country=('Home_Team', first_mode))
+    dim_venue = dim_venue.reset_index()
+
+    missing_city = dim_venue['City'] == ''
+    dim_venue.loc[missing_city, 'City'] = \
+        dim_venue.loc[missing_city, 'Venue'].map(_venue_city)
+    dim_venue.insert(0, 'Venue_ID', np.arange(len(dim_venue),
+                                              dtype=_key_dtype(len(dim_venue))))
+
+    return dim_venue
+
+def build_dim_season(df_cs):
+    """ Function to build the season dimension.
+        Parameters: df_cs (DataFrame, cricsheet innings data)
+        Returns: dim_season (DataFrame: Season_ID, Season, Start_Year)
+    """
+    seasons = sorted(df_cs['Season'].astype(str).unique())
+    dim_season = pd.DataFrame({'Season': seasons})
+    dim_season.insert(0, 'Season_ID', np.arange(len(seasons),
+                                                dtype=_key_dtype(len(seasons))))
+    dim_season['Start_Year'] = dim_season['Season'].str[:4].astype(np.int16)
+
+    return dim_season
+
+
+# %% Part 3: Fact table
+
+def _encode(values, dim, name_col, key_col):
+    """ Maps names to surrogate keys (NO_KEY for missing names). """
+    lookup = pd.Series(dim[key_col].to_numpy(), index=dim[name_col])
+    keys = values.map(lookup).fillna(NO_KEY)
+
+    return keys.astype(dim[key_col].dtype)
+
+def build_star_schema(df_cs):
+    """ Function to split innings data into dimension tables and an integer
+        keyed fact table.
+        Parameters: df_cs (DataFrame, returned by csv2df())
+        Returns: dims (dict of DataFrames: team, venue, season),
+                 df_fact (DataFrame, innings rows with surrogate keys)
+    """
+    dims = {'team': build_dim_team(df_cs),
+            'venue': build_dim_venue(df_cs),
+            'season': build_dim_season(df_cs)}
+
+    df_fact = df_cs.drop(columns=[col for col in ['Venue', 'City', 'Home_Team',
+                                                  'Season', *TEAM_KEYS]
+                                  if col in df_cs])
+    for name_col, key_col in TEAM_KEYS.items():
+        if name_col in df_cs:
+            df_fact[key_col] = _encode(df_cs[name_col], dims['team'],
+                                       'Team', 'Team_ID')
+    df_fact['Venue_ID'] = _encode(df_cs['Venue'], dims['venue'],
+                                  'Venue', 'Venue_ID')
+    df_fact['Season_ID'] = _encode(df_cs['Season'].astype(str), dims['season'],
+                                   'Season', 'Season_ID')
+    df_fact['Toss_Decision'] = df_fact['Toss_Decision'].astype('category')
+
+    return dims, df_fact
+
+def team_ids(dim_team, teams):
+    """ Function to look up surrogate keys for a list of team names.
+        Parameters: dim_team (DataFrame), teams (list of str)
+        Returns: ids (list of int)
+    """
+    return dim_team.loc[dim_team['Team'].isin(teams), 'Team_ID'].tolist()
+
+def season_id(dim_season, season):
+    """ Function to look up the surrogate key of a season name. """
+    return int(dim_season.loc[dim_season['Season'] == season,
+                              'Season_ID'].iloc[0])
+
+def denormalise(df_fact, dims, columns=None):
+    """ Function to join dimension names back onto (a slice of) the fact
+        table, e.g. for display.
+        Parameters: df_fact (DataFrame, fact rows), dims (dict of DataFrames)
+                    columns (list, output column order, default: csv order)
+        Returns: df_out (DataFrame with Team, Venue and Season names)
+    """
+    df_out = df_fact.copy()
+    team_names = dims['team']['Team'].to_numpy(dtype=object)
+    for name_col, key_col in TEAM_KEYS.items():
+        if key_col in df_out:
+            keys = df_out.pop(key_col).to_numpy()
+            df_out[name_col] = np.where(keys == NO_KEY, None,
+                                        team_names[np.clip(keys, 0, None)])
+
+    venue = dims['venue'].set_index('Venue_ID')
+    venue_ids = df_out.pop('Venue_ID')
+    df_out['Venue'] = venue_ids.map(venue['Venue']).to_numpy()
+    df_out['City'] = venue_ids.map(venue['City']).to_numpy()
+
+    season = dims['season'].set_index('Season_ID')['Season']
+    df_out['Season'] = df_out.pop('Season_ID').map(season).to_numpy()
+    df_out['Toss_Decision'] = df_out['Toss_Decision'].astype(object)
+
+    if columns is None:
+        columns = INNINGS_COLUMNS
+
+    return df_out[[col for col in columns if col in df_out]]
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/distributions.py
+# Description: Half_Del distribution summaries from mergeable ball sketches
+#
+# Distributions for any sidebar selection are built by merging the
+# (Season, Batting_Team) AggState sketches from agg_state.py, never by
+# sorting raw innings rows.
+#
+# Error bound: a sketch is a histogram with one counter per ball number
+# (0..300, 301 int32 counters = 1.2 KB per group). Half_Ball is an integer,
+# so every quantile is exact (rank error 0, value error 0) and matches
+# numpy.quantile(). Only values outside 0..300 would be clamped to the
+# nearest end bin. Violin densities are binned per over (6 balls).
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import numpy as np
+import pandas as pd
+
+PERCENTILES = [0.10, 0.25, 0.50, 0.75, 0.90]
+WHISKER_IQR = 1.5  # Tukey whiskers at 1.5 x IQR
+
+
+# %% Part 2: Merging sketches for a selection
+
+def ball_to_del(balls):
+    """ Function to convert ball numbers to Half_Del over notation (29.5).
+        Parameters: balls (float or array-like, ball numbers)
+        Returns: deliveries (ndarray of over.ball values)
+    """
+    balls = np.rint(np.asarray(balls, dtype=float))
+    return balls // 6 + (balls % 6) / 10
+
+def select_states(grp_state, seasons, teams, level):
+    """ Function to merge (Season, Team) sketches for a selection.
+        Parameters: grp_state (GroupedAggState keyed by (Season, Team))
+                    seasons, teams (iterables of selected names)
+                    level (int, 0 = per season, 1 = per team)
+        Returns: states (dict of {season or team: AggState})
+    """
+    seasons, teams = set(seasons), set(teams)
+    states = {}
+    for (season, team), state in grp_state.groups.items():
+        if season in seasons and team in teams:
+            label = (season, team)[level]
+            if label in states:
+                states[label].merge(state)
+            else:
+                states[label] = state.copy()
+
+    return states
+
+
+# %% Part 3: Summary frames
+
+def distribution_frame(states, name):
+    """ Function to tabulate box-plot and percentile band statistics.
+        Parameters: states (dict of {label: AggState}), name (str, label col)
+        Returns: df_dist (DataFrame: label, Count, Mean, Low, P10, Q1, Median,
+                 Q3, P90, High, all in Half_Del over notation)
+    """
+    rows = []
+    for label in sorted(states):
+        state = states[label]
+        p10, q1, med, q3, p90 = state.quantile(PERCENTILES)
+
+        # whiskers: most extreme observed balls within 1.5 x IQR of the box
+        balls = np.flatnonzero(state.hist)
+        iqr = q3 - q1
+        low = balls[balls >= q1 - WHISKER_IQR * iqr].min()
+        high = balls[balls <= q3 + WHISKER_IQR * iqr].max()
+
+        rows.append([label, state.count, state.mean(),
+                     low, p10, q1, med, q3, p90, high])
+
+    df_dist = pd.DataFrame(rows, columns=[name, 'Count', 'Mean', 'Low', 'P10',
+                                          'Q1', 'Median', 'Q3', 'P90', 'High'])
+    stat_cols = ['Mean', 'Low', 'P10', 'Q1', 'Median', 'Q3', 'P90', 'High']
+    df_dist[stat_cols] = ball_to_del(df_dist[stat_cols].to_numpy())
+
+    return df_dist
+
+def density_frame(states, name, bin_balls=6):
+    """ Function to tabulate per-over densities for violin plots.
+        Parameters: states (dict of {label: AggState}), name (str, label col)
+                    bin_balls (int, histogram bins merged per density bin)
+        Returns: df_dens (DataFrame: label, Over, Density)
+    """
+    frames = []
+    for label in sorted(states):
+        hist = states[label].hist
+        pad = (-len(hist)) % bin_balls
+        binned = np.pad(hist, (0, pad)).reshape(-1, bin_balls).sum(axis=1)
+        density = binned / max(binned.sum(), 1)
+
+        keep = np.flatnonzero(density)
+        frames.append(pd.DataFrame({name: label,
+                                    'Over': keep * bin_balls / 6,
+                                    'Density': density[keep]}))
+
+    if not frames:
+        return pd.DataFrame(columns=[name, 'Over', 'Density'])
+    return pd.concat(frames, ignore_index=True)
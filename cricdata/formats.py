@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/formats.py
+# Description: Registry of the match formats the app can analyse
+#
+# Each format describes its over limit, where its data lives (the innings
+# csv and the shared dataset directory it is published to) and which
+# innings count as full innings (the ones the halfway delivery is measured
+# on):
+#   ODI, T20  limited overs: every legal ball of the innings was bowled.
+#             The exporter's Full_<overs> flag column is used when the file
+#             has one, otherwise the last delivery (Final_Del) decides.
+#   Test      no over limit: innings that ended all out
+#
+# max_balls bounds the ball numbers the aggregate histograms hold (the
+# innings length for limited overs formats).
+#
+# Formats are passed around by name ('ODI'), so cache keys and worker
+# process arguments stay plain strings. Nothing is loaded here: a format's
+# data is only read when it is selected (core.load_dataset()).
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import os
+
+DATA_DIR = './data/'
+SHARED_ROOT = DATA_DIR + 'shared/'
+DEFAULT_FORMAT = 'ODI'
+TEST_MAX_BALLS = 1200   # histogram cap for Test innings (200 overs to halfway)
+
+
+# %% Part 2: Formats
+
+class MatchFormat:
+    """ One match format: over limit, data locations and full innings rule. """
+
+    def __init__(self, name, title, overs=None, max_balls=None):
+        """ Parameters: name (str, registry key and file suffix)
+                        title (str, for display)
+                        overs (int, over limit; None: unlimited)
+                        max_balls (int, histogram cap, default: overs * 6)
+        """
+        self.name = name
+        self.title = title
+        self.overs = overs
+        self.max_balls = max_balls if max_balls is not None else overs * 6
+        self.data_file = DATA_DIR + 'cricsheet_stdata_{}.csv'.format(name)
+        self.shared_dir = SHARED_ROOT + name + '/'
+        self.flag_column = 'Full_{}'.format(overs) if overs else None
+
+    def __repr__(self):
+        return 'MatchFormat({!r})'.format(self.name)
+
+    @property
+    def innings_label(self):
+        """ Returns the display name of a full innings ('completed 50 over ODI'). """
+        if self.overs:
+            return 'completed {} over {}'.format(self.overs, self.name)
+        return 'all out {}'.format(self.name)
+
+    @property
+    def definition(self):
+        """ Returns the display definition of a full innings. """
+        if self.overs:
+            return 'A {} innings where all {} legal deliveries were bowled.'.format(
+                self.innings_label, self.max_balls)
+        return 'A {} innings: the batting side was bowled out.'.format(self.name)
+
+    def full_innings(self, df_in):
+        """ Function to flag the full innings of this format.
+            Parameters: df_in (DataFrame of innings rows)
+            Returns: is_full (boolean Series)
+        """
+        if self.overs is None:
+            return df_in['Final_Wickets'] >= 10
+        if self.flag_column in df_in:
+            return df_in[self.flag_column] == 'Y'
+        # last legal delivery of the innings: (overs - 1).6, e.g. 49.6
+        return df_in['Final_Del'] >= self.overs - 1 + 0.6 - 1e-9
+
+
+FORMATS = {fmt.name: fmt for fmt in [
+    MatchFormat('ODI', 'One Day International', overs=50),
+    MatchFormat('T20', 'Twenty20 International', overs=20),
+    MatchFormat('Test', 'Test match', max_balls=TEST_MAX_BALLS),
+    ]}
+
+
+def get_format(name=DEFAULT_FORMAT):
+    """ Function to look up a format by name.
+        Parameters: name (str, key of FORMATS)
+        Returns: fmt (MatchFormat)
+        Raises: ValueError (unknown format)
+    """
+    try:
+        return FORMATS[name]
+    except KeyError:
+        raise ValueError('unknown format {!r}, expected one of {}'.format(
+            name, ', '.join(FORMATS))) from None
+
+def available_formats():
+    """ Returns the names of the formats whose data file exists (in registry
+        order, so the default format comes first).
+    """
+    return [name for name, fmt in FORMATS.items() if os.path.exists(fmt.data_file)]
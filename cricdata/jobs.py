@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/jobs.py
+# Description: Background job executor for heavy analyses
+#
+# Jobs run in a process pool so they neither block the Streamlit script
+# thread nor hold the GIL of the server process. Each job has a key: a key
+# that is already queued, running or cached is never submitted twice. Pages
+# poll status() on later reruns and pick up result() when the job is done.
+#
+# Workers report start, progress and end through a queue that a listener
+# thread drains. That gives per-job wait and run timings for metrics().
+#
+# A failed job keeps its error under its key. The key is only run again
+# after a backoff (RETRY_BACKOFF seconds, doubled per attempt) and at most
+# MAX_ATTEMPTS times, so pages can show the error and stop polling instead
+# of resubmitting the job on every rerun.
+#
+# Workers are spawned, so they import the parent's __main__ script as
+# __mp_main__ (under Streamlit: the app script). A script that submits jobs
+# keeps its body under `if __name__ == '__main__':`, as app.py does.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import threading
+import time
+
+import pandas as pd
+
+MAX_WORKERS = 2
+MAX_PENDING = 16    # queued + running jobs accepted at once
+CACHE_SIZE = 64     # finished job results kept (LRU)
+REAP_INTERVAL = 10  # seconds between checks for ended sessions
+MAX_ATTEMPTS = 3    # runs of a failing key, first run included
+RETRY_BACKOFF = 30  # seconds before a failed key may run again (doubled per attempt)
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = \
+    'queued', 'running', 'done', 'failed', 'cancelled'
+
+
+class QueueFull(RuntimeError):
+    """ Raised when MAX_PENDING jobs are already queued or running. """
+
+
+# %% Part 2: Worker side
+
+_progress_queue = None
+_current_key = None
+
+def _init_worker(progress_queue):
+    global _progress_queue
+    _progress_queue = progress_queue
+
+def _run_job(key, fn, args, kwargs):
+    """ Runs fn in a worker process, reporting start and end times. """
+    global _current_key
+    _current_key = key
+    _progress_queue.put(('start', key, time.time()))
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _progress_queue.put(('end', key, time.time()))
+        _current_key = None
+
+def report_progress(fraction):
+    """ Function for job code to report progress (0-1) from a worker.
+        Does nothing outside a job, so job functions also run inline.
+    """
+    if _progress_queue is not None and _current_key is not None:
+        _progress_queue.put(('progress', _current_key, float(fraction)))
+
+
+# %% Part 3: Job manager
+
+class Job:
+    """ Book-keeping for one submitted job. """
+
+    def __init__(self, key, name, owner, attempt=1):
+        self.key = key
+        self.name = name
+        self.owners = {owner} if owner is not None else set()
+        self.attempt = attempt
+        self.future = None
+        self.state = QUEUED
+        self.progress = 0.0
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+
+    def timings(self):
+        now = time.time()
+        started = self.started or (self.finished or now)
+        return {'key': str(self.key), 'name': self.name, 'state': self.state,
+                'attempt': self.attempt, 'progress': self.progress,
+                'wait_s': started - self.submitted,
+                'run_s': ((self.finished or now) - self.started)
+                         if self.started else 0.0}
+
+
+class JobManager:
+    """ Process pool with a bounded queue, de-duplication by key, an LRU
+        result cache, limited retries of failed keys and cancellation of jobs
+        whose sessions have ended.
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS, max_pending=MAX_PENDING,
+                 cache_size=CACHE_SIZE, max_attempts=MAX_ATTEMPTS,
+                 retry_backoff=RETRY_BACKOFF):
+        context = multiprocessing.get_context('spawn')
+        self._progress_queue = context.Queue()
+        self._executor = ProcessPoolExecutor(max_workers=max_workers,
+                                             mp_context=context,
+                                             initializer=_init_worker,
+                                             initargs=(self._progress_queue,))
+        self.max_pending = max_pending
+        self.cache_size = cache_size
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._jobs = OrderedDict()      # key -> Job (pending and finished)
+        self._results = OrderedDict()   # key -> result (LRU)
+        self._lock = threading.Lock()
+
+        threading.Thread(target=self._listen, daemon=True,
+                         name='job-progress').start()
+
+    # ---- submit / poll -------------------------------------------------------
+
+    def submit(self, key, fn, *args, name=None, owner=None, **kwargs):
+        """ Function to submit fn(*args, **kwargs) unless the key is already
+            queued, running or cached, or failed and may not be retried yet.
+            Parameters: key (hashable, identifies the inputs)
+                        fn (module-level function, must be picklable)
+                        name (str, label for metrics), owner (session id)
+            Returns: state (str)
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and (job.state in (QUEUED, RUNNING)
+                                    or key in self._results
+                                    or not self._may_retry(job)):
+                if owner is not None:
+                    job.owners.add(owner)
+                if key in self._results:
+                    self._results.move_to_end(key)
+                return job.state
+
+            pending = sum(j.state in (QUEUED, RUNNING) for j in self._jobs.values())
+            if pending >= self.max_pending:
+                raise QueueFull('{} jobs already pending'.format(pending))
+
+            attempt = job.attempt + 1 if job is not None and job.state == FAILED else 1
+            job = Job(key, name or getattr(fn, '__name__', 'job'), owner, attempt)
+            job.future = self._executor.submit(_run_job, key, fn, args, kwargs)
+            self._jobs[key] = job
+            self._jobs.move_to_end(key)
+
+        job.future.add_done_callback(lambda future, job=job: self._finish(job))
+
+        return job.state
+
+    def status(self, key):
+        """ Returns (state, progress) of a job, or (None, 0) if unknown. """
+        job = self._jobs.get(key)
+        return (job.state, job.progress) if job else (None, 0.0)
+
+    def error(self, key):
+        """ Returns the exception of a failed job, or None. """
+        job = self._jobs.get(key)
+        return job.error if job is not None and job.state == FAILED else None
+
+    def errors(self, keys):
+        """ Returns the exceptions of the failed jobs among keys. """
+        return [err for err in map(self.error, keys) if err is not None]
+
+    def result(self, key, default=None):
+        """ Returns a finished job's result without blocking. """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        return default
+
+    def results(self, keys):
+        """ Returns the results of all keys, or None while any is pending. """
+        with self._lock:
+            if all(key in self._results for key in keys):
+                return [self._results[key] for key in keys]
+        return None
+
+    # ---- cancellation --------------------------------------------------------
+
+    def cancel(self, key):
+        """ Function to cancel a job. Queued jobs never start; a running job
+            finishes in its worker but its result is discarded.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.state not in (QUEUED, RUNNING):
+                return
+            job.state = CANCELLED
+            job.finished = time.time()
+            future = job.future
+        if future is not None:
+            future.cancel()
+
+    def release(self, owner):
+        """ Drops an owner from its jobs and cancels jobs left unowned. """
+        with self._lock:
+            orphaned = [job.key for job in self._jobs.values()
+                        if owner in job.owners and job.state in (QUEUED, RUNNING)
+                        and not job.owners - {owner}]
+            for job in self._jobs.values():
+                job.owners.discard(owner)
+        for key in orphaned:
+            self.cancel(key)
+
+    def start_reaper(self, is_active, interval=REAP_INTERVAL):
+        """ Function to cancel jobs of ended sessions in the background.
+            Parameters: is_active (callable, owner -> bool)
+                        interval (float, seconds between checks)
+        """
+        def reap():
+            while True:
+                time.sleep(interval)
+                with self._lock:
+                    owners = {owner for job in self._jobs.values()
+                              if job.state in (QUEUED, RUNNING)
+                              for owner in job.owners}
+                for owner in owners:
+                    if not is_active(owner):
+                        self.release(owner)
+
+        threading.Thread(target=reap, daemon=True, name='job-reaper').start()
+
+    # ---- metrics -------------------------------------------------------------
+
+    def metrics(self):
+        """ Function to tabulate per-job timings.
+            Returns: df_metrics (DataFrame: key, name, state, attempt,
+                     progress, wait_s, run_s)
+        """
+        with self._lock:
+            rows = [job.timings() for job in self._jobs.values()]
+        return pd.DataFrame(rows, columns=['key', 'name', 'state', 'attempt',
+                                           'progress', 'wait_s', 'run_s'])
+
+    # ---- internals -----------------------------------------------------------
+
+    def _may_retry(self, job):
+        """ Whether a failed job's key may be submitted again: after the
+            backoff of its attempt, and only while attempts are left.
+        """
+        if job.state != FAILED:
+            return True
+        backoff = self.retry_backoff * 2 ** (job.attempt - 1)
+        return (job.attempt < self.max_attempts
+                and time.time() - job.finished >= backoff)
+
+    def _finish(self, job):
+        with self._lock:
+            job.finished = job.finished or time.time()
+            if job.state == CANCELLED or job.future.cancelled():
+                job.state = CANCELLED
+            elif job.future.exception() is not None:
+                job.state, job.error = FAILED, job.future.exception()
+            else:
+                job.state, job.progress = DONE, 1.0
+                self._results[job.key] = job.future.result()
+                self._results.move_to_end(job.key)
+            job.future = None
+
+            # keep book-keeping bounded: evict results, then finished jobs
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+            finished = [key for key, j in self._jobs.items()
+                        if j.state in (FAILED, CANCELLED)
+                        or (j.state == DONE and key not in self._results)]
+            for key in finished[:max(0, len(self._jobs) - self.cache_size)]:
+                del self._jobs[key]
+
+    def _listen(self):
+        while True:
+            event, key, value = self._progress_queue.get()
+            job = self._jobs.get(key)
+            if job is None:
+                continue
+            if event == 'start':
+                job.started = job.started or value
+                if job.state == QUEUED:
+                    job.state = RUNNING
+            elif event == 'progress':
+                job.progress = value
+            elif event == 'end':
+                job.finished = value
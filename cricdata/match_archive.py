@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/match_archive.py
+# Description: Compressed, randomly accessible archive of ball-by-ball data
+#
+# One file holds every match's Cricsheet ball-by-ball rows (CSV2 format) as
+# its own zlib member, followed by an offset index keyed by Match_ID:
+#
+#   MAGIC | member 1 | member 2 | ... | zlib(json index) | footer
+#   footer = index offset, index length (2 x uint64 little-endian) + MAGIC
+#
+# Opening an archive reads only the footer and the index. Loading a match
+# reads and decompresses its own member, so a drill-down costs the same for
+# any archive size. Recently viewed matches are kept in an LRU cache.
+#
+# Usage:
+#   python -m cricdata.match_archive build [--match-dir data/matches/] [--out FILE]
+#   python -m cricdata.match_archive show MATCH_ID
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+from collections import OrderedDict
+import io
+import json
+import os
+import struct
+import threading
+import zlib
+
+import pandas as pd
+
+from cricdata.ball_stream import MATCH_DIR, match_files
+
+DATA_DIR = './data/'
+ARCHIVE_FILE = DATA_DIR + 'matches.arc'
+
+MAGIC = b'CRICARC1'
+FOOTER = struct.Struct('<QQ')
+CACHE_SIZE = 32          # matches kept decompressed (LRU)
+COMPRESS_LEVEL = 9
+
+
+# %% Part 2: Building
+
+def build_archive(sources, path=ARCHIVE_FILE):
+    """ Function to write ball-by-ball files into one indexed archive.
+        Parameters: sources (list of paths, Cricsheet CSV2 ball-by-ball files,
+                    one or more matches each), path (str, archive file)
+        Returns: n_matches (int)
+    """
+    index = {}
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        for source in sources:
+            df_raw = pd.read_csv(source, dtype={'ball': str}, low_memory=False)
+            for match_id, df_match in df_raw.groupby('match_id', sort=False):
+                member = zlib.compress(df_match.to_csv(index=False).encode('utf-8'),
+                                       COMPRESS_LEVEL)
+                index[str(match_id)] = [f.tell(), len(member), len(df_match)]
+                f.write(member)
+
+        index_offset = f.tell()
+        packed = zlib.compress(json.dumps(index).encode('utf-8'))
+        f.write(packed)
+        f.write(FOOTER.pack(index_offset, len(packed)) + MAGIC)
+    os.replace(tmp_path, path)
+
+    return len(index)
+
+
+# %% Part 3: Reading
+
+class MatchArchive:
+    """ Read side of an archive: index in memory, members read on demand. """
+
+    def __init__(self, path=ARCHIVE_FILE, cache_size=CACHE_SIZE):
+        self.path = path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()     # match id -> DataFrame (LRU)
+        self._lock = threading.Lock()
+        self._file = open(path, 'rb')
+
+        self._file.seek(-(FOOTER.size + len(MAGIC)), os.SEEK_END)
+        tail = self._file.read()
+        if tail[FOOTER.size:] != MAGIC:
+            raise ValueError('{} is not a match archive'.format(path))
+        index_offset, index_len = FOOTER.unpack(tail[:FOOTER.size])
+        self.index = {int(key): value for key, value in json.loads(zlib.decompress(
+            self._read(index_offset, index_len))).items()}
+
+    def _read(self, offset, length):
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def __contains__(self, match_id):
+        return int(match_id) in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def load(self, match_id):
+        """ Function to load one match's ball-by-ball rows.
+            Parameters: match_id (int)
+            Returns: df_match (DataFrame, Cricsheet CSV2 columns)
+        """
+        match_id = int(match_id)
+        with self._lock:
+            if match_id in self._cache:
+                self._cache.move_to_end(match_id)
+                return self._cache[match_id]
+
+        offset, length, _ = self.index[match_id]
+        df_match = pd.read_csv(io.BytesIO(zlib.decompress(self._read(offset, length))),
+                               dtype={'ball': str})
+
+        with self._lock:
+            self._cache[match_id] = df_match
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return df_match
+
+    def close(self):
+        self._file.close()
+
+
+# %% Part 4: Scorecards
+
+def scorecard(df_match, inn_num):
+    """ Function to summarise one innings of ball-by-ball rows.
+        Parameters: df_match (DataFrame from MatchArchive.load()), inn_num (int)
+        Returns: df_bat (DataFrame: Batter, Runs, Balls, 4s, 6s, Out)
+                 df_bowl (DataFrame: Bowler, Overs, Runs, Wickets)
+                 df_overs (DataFrame: Over, Runs, Total, Wickets)
+    """
+    df_inn = df_match[df_match['innings'] == inn_num].copy()
+    extras = ['extras', 'wides', 'noballs', 'byes', 'legbyes']
+    df_inn[extras] = df_inn[extras].fillna(0)
+    df_inn['legal'] = (df_inn['wides'] == 0) & (df_inn['noballs'] == 0)
+    df_inn['total_runs'] = df_inn['runs_off_bat'] + df_inn['extras']
+    df_inn['over'] = df_inn['ball'].str.split('.').str[0].astype(int) + 1
+
+    faced = df_inn[df_inn['wides'] == 0]
+    df_bat = df_inn.groupby('striker', sort=False).agg(
+        Runs=('runs_off_bat', 'sum')).join(faced.groupby('striker').agg(
+            Balls=('ball', 'size'),
+            Fours=('runs_off_bat', lambda runs: (runs == 4).sum()),
+            Sixes=('runs_off_bat', lambda runs: (runs == 6).sum()))).fillna(0)
+    df_bat['Out'] = df_bat.index.isin(df_inn['player_dismissed'].dropna())
+    df_bat = df_bat.astype({'Balls': int, 'Fours': int, 'Sixes': int}) \
+                   .rename(columns={'Fours': '4s', 'Sixes': '6s'}) \
+                   .rename_axis('Batter').reset_index()
+
+    # bowlers are not charged byes and leg byes
+    df_inn['bowler_runs'] = df_inn['total_runs'] - df_inn['byes'] - df_inn['legbyes']
+    df_inn['bowler_wkt'] = df_inn['wicket_type'].notna() \
+        & ~df_inn['wicket_type'].isin(['run out', 'retired hurt', 'retired out',
+                                       'obstructing the field'])
+    df_bowl = df_inn.groupby('bowler', sort=False).agg(
+        Balls=('legal', 'sum'), Runs=('bowler_runs', 'sum'),
+        Wickets=('bowler_wkt', 'sum'))
+    balls = df_bowl.pop('Balls')
+    df_bowl.insert(0, 'Overs', balls // 6 + balls % 6 / 10)
+    df_bowl = df_bowl.astype({'Runs': int, 'Wickets': int}) \
+                     .rename_axis('Bowler').reset_index()
+
+    df_overs = df_inn.groupby('over').agg(
+        Runs=('total_runs', 'sum'),
+        Wickets=('player_dismissed', 'count')).rename_axis('Over').reset_index()
+    df_overs['Total'] = df_overs['Runs'].cumsum()
+
+    return df_bat, df_bowl, df_overs[['Over', 'Runs', 'Total', 'Wickets']]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Indexed ball-by-ball match archive')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_build = sub.add_parser('build', help='archive Cricsheet ball-by-ball files')
+    p_build.add_argument('--match-dir', default=MATCH_DIR)
+    p_build.add_argument('--out', default=ARCHIVE_FILE)
+    p_show = sub.add_parser('show', help='print one match scorecard')
+    p_show.add_argument('match_id', type=int)
+    p_show.add_argument('--archive', default=ARCHIVE_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        n = build_archive(match_files(args.match_dir), args.out)
+        print('archived {} matches -> {} ({:,} bytes)'.format(
+            n, args.out, os.path.getsize(args.out)))
+    else:
+        df_match = MatchArchive(args.archive).load(args.match_id)
+        for inn_num in sorted(df_match['innings'].unique()):
+            df_bat, df_bowl, _ = scorecard(df_match, inn_num)
+            print('\nInnings {}'.format(inn_num))
+            print(df_bat.to_string(index=False))
+            print(df_bowl.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/projection_service.py
+# Description: Batched projection service for in-match final score queries
+#
+# Answers "X runs after N balls -> projected total" from a lookup table that
+# is precomputed from the innings data. A power curve runs/final = (b/300)^k
+# is fitted to every full innings through its halfway point (Half_Ball,
+# 50%). The table holds, for every ball b, the median and 10th/90th
+# percentiles of the multiplier final/runs = (300/b)^k over all innings. A
+# query is then one table lookup and one multiply, vectorized over batches.
+#
+# Usage:
+#   python -m cricdata.projection_service build   (write PROJECTION_FILE)
+#   python -m cricdata.projection_service serve [--port 8502]
+#   GET  /project?runs=150&balls=180
+#   POST /project   {"queries": [[150, 180], [90, 120], ...]}
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import math
+import queue
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from cricdata.formats import DATA_DIR, get_format
+
+PROJECTION_FORMAT = get_format('ODI')  # projections of full ODI innings
+DATA_FILE = PROJECTION_FORMAT.data_file
+PROJECTION_FILE = DATA_DIR + 'projection_table.json'
+
+MAX_BALLS = PROJECTION_FORMAT.max_balls
+BATCH_SIZE = 256        # most queries evaluated together by the batcher
+BATCH_WINDOW = 0.0      # seconds the batcher waits to fill a batch (0: take
+                        # whatever queued up while the last batch ran)
+
+
+# %% Part 2: Lookup table
+
+class ProjectionTable:
+    """ Per-ball multipliers (median, 10th and 90th percentile) from runs
+        scored so far to the final total.
+    """
+
+    def __init__(self, median, low, high, n_innings=0):
+        self.median = np.asarray(median, dtype=float)
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+        self.n_innings = n_innings
+
+    @classmethod
+    def from_innings(cls, half_balls, max_balls=MAX_BALLS):
+        """ Function to fit the table from halfway ball numbers of full
+            innings.
+            Parameters: half_balls (array-like of int, Half_Ball values)
+                        max_balls (int, balls in a full innings)
+            Returns: ProjectionTable
+        """
+        half = np.asarray(half_balls, dtype=float)
+        half = half[(half > 0) & (half < max_balls)]
+        # exponent of each innings' curve: (half / max_balls) ** k == 0.5
+        k = np.log(0.5) / np.log(half / max_balls)
+
+        balls = np.arange(1, max_balls + 1, dtype=float)
+        multipliers = (max_balls / balls[:, None]) ** k[None, :]
+        low, median, high = np.quantile(multipliers, [0.1, 0.5, 0.9], axis=1)
+
+        # ball 0 has no runs to scale: leave it undefined
+        pad = np.array([np.nan])
+        return cls(np.r_[pad, median], np.r_[pad, low], np.r_[pad, high],
+                   len(half))
+
+    @classmethod
+    def from_csv(cls, data_file=DATA_FILE):
+        import pandas as pd
+
+        df_cs = pd.read_csv(data_file)
+        return cls.from_innings(df_cs.loc[PROJECTION_FORMAT.full_innings(df_cs),
+                                          'Half_Ball'])
+
+    def save(self, path=PROJECTION_FILE):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'n_innings': self.n_innings,
+                       'median': self.median[1:].tolist(),
+                       'low': self.low[1:].tolist(),
+                       'high': self.high[1:].tolist()}, f)
+
+    @classmethod
+    def load(cls, path=PROJECTION_FILE):
+        with open(path, encoding='utf-8') as f:
+            record = json.load(f)
+        pad = [np.nan]
+        return cls(pad + record['median'], pad + record['low'],
+                   pad + record['high'], record['n_innings'])
+
+    def project(self, runs, balls):
+        """ Function to project final totals (vectorized).
+            Parameters: runs, balls (scalars or arrays: runs after N balls)
+            Returns: projected, low, high (ndarrays of final totals)
+        """
+        runs = np.asarray(runs, dtype=float)
+        idx = np.clip(np.asarray(balls, dtype=np.int64), 1, len(self.median) - 1)
+
+        return runs * self.median[idx], runs * self.low[idx], runs * self.high[idx]
+
+
+def load_table(path=PROJECTION_FILE, data_file=DATA_FILE):
+    """ Function to load the precomputed table, building it if missing. """
+    try:
+        return ProjectionTable.load(path)
+    except FileNotFoundError:
+        return ProjectionTable.from_csv(data_file)
+
+
+# %% Part 3: Micro-batching
+
+class MicroBatcher:
+    """ Collects concurrent single queries and evaluates them as one
+        vectorized batch (up to BATCH_SIZE, waiting at most BATCH_WINDOW).
+    """
+
+    def __init__(self, table, batch_size=BATCH_SIZE, window=BATCH_WINDOW):
+        self.table = table
+        self.batch_size = batch_size
+        self.window = window
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True,
+                         name='projection-batcher').start()
+
+    def project(self, runs, balls):
+        """ Returns (projected, low, high) for one query, batched with others.
+            Raises the batch's exception if evaluating it failed.
+        """
+        future = Future()
+        self._queue.put((runs, balls, future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get(timeout=self.window)
+                                 if self.window else self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            # a failed batch fails its own queries, never the batcher thread
+            try:
+                runs = np.array([runs for runs, _, _ in batch], dtype=float)
+                balls = np.array([balls for _, balls, _ in batch])
+                projected, low, high = self.table.project(runs, balls)
+            except Exception as err:
+                for _, _, future in batch:
+                    future.set_exception(err)
+                continue
+            for i, (_, _, future) in enumerate(batch):
+                future.set_result((projected[i], low[i], high[i]))
+
+
+# %% Part 4: HTTP service
+
+class ProjectionHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive for load tests and clients
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path != '/project':
+            return self._send_json(404, {'error': 'not found'})
+        try:
+            params = parse_qs(url.query)
+            runs, balls = float(params['runs'][0]), int(params['balls'][0])
+            if not math.isfinite(runs):
+                raise ValueError(runs)
+        except (KeyError, ValueError):
+            return self._send_json(400, {'error': 'finite runs and integer balls are required'})
+
+        try:
+            projected, low, high = self.server.batcher.project(runs, balls)
+        except Exception as err:
+            return self._send_json(500, {'error': repr(err)})
+        self._send_json(200, {'runs': runs, 'balls': balls,
+                              'projected': round(projected, 1),
+                              'low': round(low, 1), 'high': round(high, 1)})
+
+    def do_POST(self):
+        if urlsplit(self.path).path != '/project':
+            return self._send_json(404, {'error': 'not found'})
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            queries = np.asarray(json.loads(self.rfile.read(length))['queries'],
+                                 dtype=float).reshape(-1, 2)
+            if not np.isfinite(queries).all():
+                raise ValueError('non-finite query')
+        except (KeyError, ValueError, TypeError):
+            return self._send_json(400, {'error': 'expected {"queries": [[runs, balls], ...]}'})
+
+        projected, low, high = self.server.table.project(queries[:, 0], queries[:, 1])
+        self._send_json(200, {'projected': np.round(projected, 1).tolist(),
+                              'low': np.round(low, 1).tolist(),
+                              'high': np.round(high, 1).tolist()})
+
+    def log_message(self, format, *args):
+        pass  # no per-request logging on the hot path
+
+
+def make_server(host='127.0.0.1', port=8502, table=None):
+    """ Function to create (not start) the projection HTTP server.
+        Parameters: host (str), port (int, 0 picks a free port)
+                    table (ProjectionTable, default: load_table())
+        Returns: ThreadingHTTPServer (call serve_forever())
+    """
+    server = ThreadingHTTPServer((host, port), ProjectionHandler)
+    server.daemon_threads = True
+    server.table = table if table is not None else load_table()
+    server.batcher = MicroBatcher(server.table)
+
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Final score projection service')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_build = sub.add_parser('build', help='precompute the projection table')
+    p_build.add_argument('--data-file', default=DATA_FILE)
+    p_serve = sub.add_parser('serve', help='run the HTTP service')
+    p_serve.add_argument('--host', default='127.0.0.1')
+    p_serve.add_argument('--port', type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        table = ProjectionTable.from_csv(args.data_file)
+        table.save()
+        print('projection table from {} innings -> {}'.format(table.n_innings,
+                                                              PROJECTION_FILE))
+    else:
+        server = make_server(args.host, args.port)
+        print('serving projections on http://{}:{}/project'.format(args.host,
+                                                                  args.port))
+        server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/report.py
+# Description: Per-selection reports of the cricdata app's views
+#
+# A report holds the tables the app shows for one sidebar selection
+# (filtered innings, regimes, distributions, season averages with bootstrap
+# CIs), computed with cricdata.core, so batch runs give the same numbers as
+# the app. write_report() saves it to REPORT_DIR/<report_name()>/ as csv
+# tables, Vega-Lite chart specs (cricdata.charts) and a summary.json.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from cricdata.bootstrap import bootstrap_ci, combine_bootstrap
+from cricdata.core import (BOOTSTRAP_BATCHES, DATA_DIR, filter_selection,
+                           season_ci_batches, season_range, selection_distributions,
+                           selection_regimes)
+from cricdata.formats import DEFAULT_FORMAT, get_format
+
+REPORT_DIR = DATA_DIR + 'reports/'
+
+
+# %% Part 2: Building reports
+
+def report_name(selection):
+    """ Function to name a selection's report directory: its season range,
+        number of teams and a hash of the canonical selection.
+        Parameters: selection (tuple, canonical_selection())
+        Returns: name (str)
+    """
+    teams, start_season, end_season = selection
+    digest = hashlib.sha1(json.dumps([list(teams), start_season, end_season])
+                          .encode('utf-8')).hexdigest()[:8]
+
+    return '{}_{}_{}teams_{}'.format(start_season, end_season, len(teams), digest)
+
+def selection_report(data, grp_state, selection, ci=True):
+    """ Function to compute the tables of one selection.
+        Parameters: data (dict, core.load_dataset() or core.mapped_dataset())
+                    grp_state (GroupedAggState of data)
+                    selection (tuple, canonical_selection())
+                    ci (bool, bootstrap the season means)
+        Returns: report (dict of DataFrames: innings, regimes, season_dist,
+                 team_dist, team_density, season_avg, season_ci (or None))
+    """
+    teams, start_season, end_season = selection
+    seasons = season_range(data['seasons'], start_season, end_season)
+    selection_df = filter_selection(data['full'], data['dims'], teams,
+                                    start_season, end_season)
+    df_seg = selection_regimes(selection_df) if len(selection_df) else None
+    df_ssn_dist, df_team_dist, df_team_dens = selection_distributions(
+        grp_state, seasons, teams)
+
+    df_ci = None
+    if ci:
+        batches = season_ci_batches(grp_state, seasons, teams,
+                                    min(BOOTSTRAP_BATCHES, len(seasons)))
+        df_ci = combine_bootstrap([bootstrap_ci(batch, seed=seed)
+                                   for batch, seed in batches])
+
+    return {'innings': selection_df, 'regimes': df_seg,
+            'season_dist': df_ssn_dist, 'team_dist': df_team_dist,
+            'team_density': df_team_dens,
+            'season_avg': df_ssn_dist[['Season', 'Mean', 'Count']]
+                          .rename(columns={'Mean': 'Half_Del'}),
+            'season_ci': df_ci}
+
+def report_charts(report, dim_team, fmt=DEFAULT_FORMAT):
+    """ Function to build the app's charts of a report.
+        Parameters: report (dict, selection_report()), dim_team (DataFrame)
+                    fmt (str, format name of the report's data)
+        Returns: charts (dict of name: Altair chart)
+    """
+    from cricdata.charts import (scatter_chart, season_avg_chart, season_dist_chart,
+                                 team_violin_chart)
+
+    return {'scatter': scatter_chart(report['innings'], dim_team, report['regimes']),
+            'season_avg': season_avg_chart(report['season_avg'], report['season_ci'],
+                                           get_format(fmt).overs),
+            'season_dist': season_dist_chart(report['season_dist']),
+            'team_violin': team_violin_chart(report['team_density'], dim_team)}
+
+
+# %% Part 3: Writing reports
+
+def write_report(report, selection, version, out_dir=REPORT_DIR, dim_team=None,
+                 fmt=DEFAULT_FORMAT):
+    """ Function to save a report as csv tables, chart specs and a summary.
+        Parameters: report (dict, selection_report())
+                    selection (tuple, canonical_selection())
+                    version (str or None, dataset version)
+                    out_dir (str), dim_team (DataFrame, charts are only
+                    written when given), fmt (str, format name)
+        Returns: path (str, the report's directory)
+    """
+    path = os.path.join(out_dir, report_name(selection))
+    os.makedirs(path, exist_ok=True)
+    for name, df_out in report.items():
+        if df_out is not None:
+            df_out.to_csv(os.path.join(path, name + '.csv'), index=False)
+    if dim_team is not None:
+        for name, chart in report_charts(report, dim_team, fmt).items():
+            with open(os.path.join(path, name + '.vl.json'), 'w',
+                      encoding='utf-8') as f:
+                f.write(chart.to_json())
+
+    teams, start_season, end_season = selection
+    df_sel = report['innings']
+    summary = {'teams': list(teams), 'start': start_season, 'end': end_season,
+               'format': fmt, 'dataset_version': version, 'innings': len(df_sel),
+               'avg_half_del': round(float(df_sel['Half_Del'].mean()), 2)
+                               if len(df_sel) else None,
+               'generated': pd.Timestamp.now().isoformat(timespec='seconds')}
+    with open(os.path.join(path, 'summary.json'), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=1)
+
+    return path
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sun Oct 19, 2025
+# Script Name: cricdata/selection_log.py
+# Description: Sidebar selection keys, selection log and selection cache
+#
+# Each session's sidebar selection (batting team set and season range) is
+# canonicalised, so the same choice in any order is one key. Together with
+# the data version it is the selection descriptor that keys the app's
+# per-selection caches: a tuple of a few strings, so a cache lookup hashes
+# microseconds of data rather than a DataFrame.
+#
+# Selections are appended to a JSON lines file. popular() counts the most
+# recent MAX_RECORDS entries, kept in memory with their counts, so it does
+# not read the file (only again when another process has written to it).
+# Once the file grows past MAX_BYTES it is compacted to those entries. The
+# app uses the top selections to warm its caches at start up and after
+# every data refresh.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+from collections import Counter, OrderedDict, deque
+import json
+import os
+import threading
+import time
+
+DATA_DIR = './data/'
+LOG_FILE = DATA_DIR + 'selection_log.jsonl'
+
+MAX_RECORDS = 10000  # most recent log entries counted for popularity
+MAX_BYTES = 4 << 20  # log size that triggers compaction to MAX_RECORDS
+TOP_N = 5            # selections warmed
+CACHE_SIZE = 64      # values kept by a SelectionCache (LRU)
+
+
+# %% Part 2: Selection log
+
+def canonical_selection(teams, start_season, end_season):
+    """ Function to build the canonical key of a sidebar selection.
+        Parameters: teams (iterable of team names), start_season, end_season (str)
+        Returns: selection (tuple: sorted team tuple, start, end)
+    """
+    return tuple(sorted(set(teams))), str(start_season), str(end_season)
+
+def selection_key(version, teams, start_season, end_season):
+    """ Function to build the descriptor of a selection on a data version.
+        Parameters: version (int or str, data version)
+                    teams (iterable of team names), start_season, end_season (str)
+        Returns: key (tuple: version, sorted team tuple, start, end)
+    """
+    return (version,) + canonical_selection(teams, start_season, end_season)
+
+
+class SelectionLog:
+    """ JSON lines log of canonical selections, compacted to its most recent
+        max_records entries once the file grows past max_bytes.
+    """
+
+    def __init__(self, path=LOG_FILE, max_records=MAX_RECORDS, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self._recent = None         # (line, selection) of the latest entries
+        self._counts = Counter()    # selection -> count in _recent
+        self._size = 0              # file size as last read or written
+        self._lock = threading.Lock()
+
+    def _file_size(self):
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def _load(self):
+        """ Reads the latest entries on first use, or again when the file has
+            changed since this log last read or wrote it.
+        """
+        size = self._file_size()
+        if self._recent is not None and size == self._size:
+            return
+        self._recent, self._counts, self._size = deque(), Counter(), size
+        if not size:
+            return
+        with open(self.path, encoding='utf-8') as f:
+            lines = deque(f, maxlen=self.max_records)
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # a line cut short by a crash
+            self._count(line, canonical_selection(record['teams'], record['start'],
+                                                  record['end']))
+
+    def _count(self, line, selection):
+        if len(self._recent) == self.max_records:
+            _, oldest = self._recent.popleft()
+            self._counts[oldest] -= 1
+            if not self._counts[oldest]:
+                del self._counts[oldest]
+        self._recent.append((line, selection))
+        self._counts[selection] += 1
+
+    def _compact(self):
+        """ Rewrites the file with the entries popular() counts. """
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(line for line, _ in self._recent)
+        os.replace(tmp_path, self.path)
+        self._size = self._file_size()
+
+    def append(self, selection):
+        """ Function to log one selection (from canonical_selection()). """
+        teams, start_season, end_season = selection
+        line = json.dumps({'time': round(time.time()), 'teams': list(teams),
+                           'start': start_season, 'end': end_season}) + '\n'
+        with self._lock:
+            self._load()
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+            self._size += len(line.encode('utf-8'))
+            self._count(line, canonical_selection(teams, start_season, end_season))
+            if self._size > self.max_bytes:
+                self._compact()
+
+    def popular(self, n=TOP_N):
+        """ Function to find the most often logged selections.
+            Parameters: n (int, None: all)
+            Returns: popular (list of (selection, count)), most popular first
+        """
+        with self._lock:
+            self._load()
+            return self._counts.most_common(n)
+
+
+# %% Part 3: Selection cache
+
+class SelectionCache:
+    """ Bounded LRU of values computed per selection descriptor, shared by
+        all sessions of a process. Hits return the stored object itself (no
+        copy), so callers must not modify it.
+    """
+
+    def __init__(self, max_entries=CACHE_SIZE):
+        self.max_entries = max_entries
+        self._values = OrderedDict()    # (name, key) -> value (LRU)
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, name, key, compute):
+        """ Function to look up a value, computing it on a miss.
+            Parameters: name (str, kind of value), key (tuple, selection_key())
+                        compute (callable without arguments)
+            Returns: value
+        """
+        with self._lock:
+            if (name, key) in self._values:
+                self._values.move_to_end((name, key))
+                self.hits += 1
+                return self._values[(name, key)]
+            self.misses += 1
+
+        # computed outside the lock: a concurrent miss computes it twice
+        value = compute()
+        with self._lock:
+            self._values[(name, key)] = value
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+
+        return value
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sun Oct 19, 2025
+# Script Name: cricdata/shared_dataset.py
+# Description: Memory-mapped Arrow IPC dataset shared by app processes
+#
+# `publish` writes the canonical innings data of one match format (star
+# schema fact and dimension tables, full innings) and its precomputed season
+# aggregates as Arrow IPC files into <shared dir>/<version>/, then flips the
+# CURRENT pointer file to that version with an atomic rename. Every format
+# has its own shared dir (cricdata.formats, SHARED_DIR is the default
+# format's). The version is the data file's content hash
+# (snapshot_store.file_version()).
+#
+# Each Streamlit process maps the files read-only. Numeric columns come back
+# as pandas views onto the map, so every process shares one copy through
+# the OS page cache. Only string columns (small dimension tables and flag
+# columns) are copied. A process reading CURRENT after a flip maps the new
+# version on its next rerun. The previous version is kept for processes
+# still using it.
+#
+# Usage:
+#   python -m cricdata.shared_dataset publish [--format ODI] [--data-file FILE]
+#   python -m cricdata.shared_dataset current [--format ODI]
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+import json
+import os
+import shutil
+import threading
+
+import pandas as pd
+import pyarrow as pa
+
+from cricdata.core import load_dataset
+from cricdata.formats import DEFAULT_FORMAT, FORMATS, get_format
+from cricdata.snapshot_store import file_version
+
+SHARED_DIR = get_format(DEFAULT_FORMAT).shared_dir
+POINTER_FILE = 'CURRENT'
+META_FILE = 'meta.json'
+KEEP_VERSIONS = 2       # current + previous (may still be mapped)
+
+
+# %% Part 2: Arrow IPC files
+
+def write_table(df_in, path):
+    """ Function to write a DataFrame as an Arrow IPC file. """
+    table = pa.Table.from_pandas(df_in, preserve_index=False)
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+def map_table(path):
+    """ Function to map an Arrow IPC file read-only.
+        Parameters: path (str)
+        Returns: df_out (DataFrame, numeric columns are views onto the map)
+    """
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+# %% Part 3: Publishing
+
+def shared_frames(data_file, fmt=DEFAULT_FORMAT):
+    """ Function to compute the tables a published version holds.
+        Parameters: data_file (str, path of .csv file)
+                    fmt (str, format name, see cricdata.formats)
+        Returns: frames (dict of DataFrames), meta (dict)
+    """
+    data = load_dataset(data_file, fmt=fmt)
+    dims = data['dims']
+
+    frames = {'fact': data['fact'], 'full': data['full'],
+              'season_avg': data['season_avg'],
+              'dim_team': dims['team'], 'dim_venue': dims['venue'],
+              'dim_season': dims['season']}
+    return frames, {'format': fmt, 'all_avg_ihd': data['all_avg_ihd']}
+
+def current_version(shared_dir=SHARED_DIR):
+    """ Returns the version CURRENT points at, or None if none is published. """
+    try:
+        with open(os.path.join(shared_dir, POINTER_FILE), encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+def publish(data_file=None, shared_dir=None, fmt=DEFAULT_FORMAT):
+    """ Function to publish a data file and flip CURRENT to it.
+        Parameters: data_file (str), shared_dir (str) (default: the format's)
+                    fmt (str, format name)
+        Returns: version (str)
+    """
+    data_file = data_file or get_format(fmt).data_file
+    shared_dir = shared_dir or get_format(fmt).shared_dir
+    version = file_version(data_file)
+    target = os.path.join(shared_dir, version)
+    if not os.path.isdir(target):
+        tmp_dir = target + '.tmp{}'.format(os.getpid())
+        os.makedirs(tmp_dir)
+        frames, meta = shared_frames(data_file, fmt)
+        for name, df_out in frames.items():
+            write_table(df_out, os.path.join(tmp_dir, name + '.arrow'))
+        meta.update(version=version, data_file=os.path.basename(data_file),
+                    published=pd.Timestamp.now().isoformat(timespec='seconds'))
+        with open(os.path.join(tmp_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=1)
+        try:
+            os.replace(tmp_dir, target)
+        except OSError:
+            # another process published the same version first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # the pointer flip: readers see either the old or the new version
+    pointer = os.path.join(shared_dir, POINTER_FILE)
+    with open(pointer + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(pointer + '.tmp', pointer)
+    prune(shared_dir)
+
+    return version
+
+def prune(shared_dir=SHARED_DIR, keep=KEEP_VERSIONS):
+    """ Function to delete all but the newest `keep` published versions. """
+    current = current_version(shared_dir)
+    versions = sorted((entry for entry in os.scandir(shared_dir)
+                       if entry.is_dir() and '.tmp' not in entry.name),
+                      key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in versions[keep:]:
+        if entry.name != current:
+            # files still mapped by a process cannot be removed on Windows
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+# %% Part 4: Reading
+
+class MappedDataset:
+    """ One published version, mapped read-only. """
+
+    def __init__(self, path):
+        with open(os.path.join(path, META_FILE), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.version = self.meta['version']
+        self.frames = {name[:-len('.arrow')]: map_table(os.path.join(path, name))
+                       for name in os.listdir(path) if name.endswith('.arrow')}
+        self.frames['fact']['Toss_Decision'] = \
+            self.frames['fact']['Toss_Decision'].astype('category')
+
+    @property
+    def dims(self):
+        return {'team': self.frames['dim_team'], 'venue': self.frames['dim_venue'],
+                'season': self.frames['dim_season']}
+
+
+class SharedData:
+    """ Follows the CURRENT pointer, mapping a version when it changes. """
+
+    def __init__(self, shared_dir=SHARED_DIR):
+        self.shared_dir = shared_dir
+        self._dataset = None
+        self._lock = threading.Lock()
+
+    def current(self):
+        """ Function to get the currently published dataset.
+            Returns: dataset (MappedDataset) or None if none is published
+        """
+        version = current_version(self.shared_dir)
+        if version is None:
+            return None
+        with self._lock:
+            if self._dataset is None or self._dataset.version != version:
+                self._dataset = MappedDataset(os.path.join(self.shared_dir, version))
+            return self._dataset
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Shared memory-mapped dataset')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_publish = sub.add_parser('publish', help='publish a data file and flip CURRENT')
+    p_publish.add_argument('--data-file', help='default: the format\'s data file')
+    sub.add_parser('current', help='print the published version')
+    parser.add_argument('--format', default=DEFAULT_FORMAT, choices=list(FORMATS))
+    parser.add_argument('--shared-dir', help='default: the format\'s shared dir')
+    args = parser.parse_args(argv)
+    shared_dir = args.shared_dir or get_format(args.format).shared_dir
+
+    if args.command == 'publish':
+        print('published', publish(args.data_file, shared_dir, args.format))
+    else:
+        print(current_version(shared_dir) or 'nothing published')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/snapshot_store.py
+# Description: Delta snapshot store for cricsheet_stdata_ODI files
+#
+# Each snapshot is stored as the fields that changed since the previous
+# snapshot: rows are matched on (Match_ID, Inn_Num), and for every column
+# only the cells whose value differs (or whose innings is new) are written.
+# A monthly file that adds a few innings and corrects one column costs
+# those rows plus that column, so storage grows with changes and not with
+# the number of monthly copies kept.
+#
+# Layout (under SNAPSHOT_DIR):
+#   index.json             list of snapshots (name, source, columns, parent)
+#   deltas/<name>.npz      match_id, inn_num   keys in file order (omitted
+#                                              when unchanged since parent)
+#                          rows_<col>          positions of changed cells
+#                          text_<col>          their values, utf-8 encoded
+#
+# A snapshot is rebuilt by applying the deltas of its chain from the first
+# snapshot (cached per store). Diffs match the rebuilt keys with a sorted
+# search and compare the columns as arrays, so no csv is parsed (a few ms
+# for a month's changes).
+#
+# Usage:
+#   python -m cricdata.snapshot_store add "data/cricsheet_stdata_ODI - Feb2025.csv"
+#   python -m cricdata.snapshot_store list
+#   python -m cricdata.snapshot_store diff <old_name> <new_name>
+#   python -m cricdata.snapshot_store export <name> <out_file>
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+from datetime import datetime
+import hashlib
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = './data/'
+SNAPSHOT_DIR = DATA_DIR + 'snapshots/'
+
+KEY_COLUMNS = ['Match_ID', 'Inn_Num']
+
+# canonical column order used for hashing (union of all file versions)
+CANON_COLUMNS = ['Match_ID', 'Batting_Team', 'Bowling_Team', 'Inn_Num',
+                 'Final_Del', 'Final_Total', 'Final_Wickets', 'Half_Del',
+                 'Half_Ball', 'Half_Total', 'Full_50', 'Season', 'Date',
+                 'Venue', 'City', 'Toss_Winner', 'Toss_Decision', 'Winner',
+                 'Home_Team']
+
+FIELD_SEP = '\x1f'
+INN_STRIDE = 100   # row key: Match_ID * INN_STRIDE + Inn_Num
+
+
+# %% Part 2: Hashing
+
+def read_raw_csv(data_file):
+    """ Function to read a cricsheet csv file as raw text fields.
+        Dates are normalised to ISO format (older files used '/' separators)
+        and missing canonical columns are filled with empty strings.
+        Parameters: data_file (str, path or buffer of a .csv file)
+        Returns: df_raw (DataFrame of str), columns (list, original columns)
+    """
+    df_raw = pd.read_csv(data_file, dtype=str, keep_default_na=False)
+    columns = list(df_raw.columns)
+
+    df_raw['Date'] = pd.to_datetime(df_raw['Date'].str.replace('/', '-'),
+                                    format='%Y-%m-%d').dt.strftime('%Y-%m-%d')
+    for col in CANON_COLUMNS:
+        if col not in df_raw.columns:
+            df_raw[col] = ''
+
+    return df_raw[CANON_COLUMNS], columns
+
+def row_hashes(df_raw):
+    """ Function to calculate a content hash for every row.
+        Parameters: df_raw (DataFrame of str, from read_raw_csv())
+        Returns: hashes (Series of 16 char hex digests)
+    """
+    joined = df_raw[CANON_COLUMNS].agg(FIELD_SEP.join, axis=1)
+
+    return joined.map(lambda s: hashlib.blake2b(s.encode('utf-8'),
+                                                digest_size=8).hexdigest())
+
+def frame_version(hashes):
+    """ Function to derive a dataset version from its ordered row hashes.
+        Parameters: hashes (iterable of hex row hashes)
+        Returns: version (str, 16 char hex digest)
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for row_hash in hashes:
+        h.update(row_hash.encode('ascii'))
+
+    return h.hexdigest()
+
+def file_version(data_file):
+    """ Function to derive the dataset version of a csv file from its
+        content (same value as the 'version' of a snapshot of that file).
+        Parameters: data_file (str, path of .csv file)
+        Returns: version (str, 16 char hex digest)
+    """
+    return frame_version(row_hashes(read_raw_csv(data_file)[0]))
+
+def row_keys(match_id, inn_num):
+    """ Function to combine Match_ID and Inn_Num into one int64 row key.
+        Parameters: match_id, inn_num (array-like of int or str)
+        Returns: keys (int64 ndarray)
+    """
+    return (np.asarray(match_id).astype(np.int64) * INN_STRIDE
+            + np.asarray(inn_num).astype(np.int64))
+
+def match_keys(old_keys, new_keys):
+    """ Function to find every new row key among the old ones (sorted search).
+        Parameters: old_keys, new_keys (int64 ndarrays, from row_keys())
+        Returns: match (ndarray, position of each new key in old_keys)
+                 found (bool ndarray, new keys that are in old_keys)
+    """
+    if not len(old_keys):
+        return (np.zeros(len(new_keys), dtype=np.int64),
+                np.zeros(len(new_keys), dtype=bool))
+    order = np.argsort(old_keys, kind='stable')
+    match = order[np.minimum(np.searchsorted(old_keys[order], new_keys),
+                             len(order) - 1)]
+
+    return match, old_keys[match] == new_keys
+
+def pack_text(values):
+    """ Encodes str values as one utf-8 byte array (and unpack_text() back). """
+    return np.frombuffer(FIELD_SEP.join(values).encode('utf-8'), dtype=np.uint8)
+
+def unpack_text(data):
+    return np.array(data.tobytes().decode('utf-8').split(FIELD_SEP), dtype=object)
+
+def changed_labels(changed):
+    """ Function to list the changed column names of every corrected row.
+        Parameters: changed (bool ndarray, rows x CANON_COLUMNS)
+        Returns: labels (object ndarray of comma separated column names)
+    """
+    # one label per distinct pattern (bit mask) of changed columns
+    bits = changed.astype(np.int64) @ (1 << np.arange(len(CANON_COLUMNS)))
+    patterns, inverse = np.unique(bits, return_inverse=True)
+    labels = np.array([','.join(col for i, col in enumerate(CANON_COLUMNS)
+                                if pattern >> i & 1) for pattern in patterns],
+                      dtype=object)
+
+    return labels[inverse]
+
+
+# %% Part 3: Store
+
+class SnapshotStore:
+    """ Store of cricsheet_stdata_ODI snapshots as column level deltas. """
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self.delta_dir = os.path.join(root, 'deltas')
+        self.index_file = os.path.join(root, 'index.json')
+        self._fields = {}   # name -> (row keys, dict of column arrays)
+
+    # ---- index --------------------------------------------------------------
+
+    def snapshots(self):
+        """ Returns the list of snapshot records, oldest first. """
+        if not os.path.exists(self.index_file):
+            return []
+        with open(self.index_file, encoding='utf-8') as f:
+            return json.load(f)['snapshots']
+
+    def names(self):
+        return [snap['name'] for snap in self.snapshots()]
+
+    def _record(self, name):
+        for snap in self.snapshots():
+            if snap['name'] == name:
+                return snap
+        raise KeyError('unknown snapshot: ' + str(name))
+
+    def _write_index(self, snapshots):
+        tmp_file = self.index_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'snapshots': snapshots}, f, indent=1)
+        os.replace(tmp_file, self.index_file)
+
+    def delta_file(self, name):
+        return os.path.join(self.delta_dir, name + '.npz')
+
+    # ---- write --------------------------------------------------------------
+
+    def add(self, data_file, name=None):
+        """ Function to add a csv file to the store as a new snapshot.
+            Only the cells that differ from the latest snapshot are written.
+            Parameters: data_file (str, path of .csv file)
+                        name (str, snapshot name, default: file name)
+            Returns: record (dict, the new snapshot's index entry)
+        """
+        if name is None:
+            name = os.path.splitext(os.path.basename(data_file))[0]
+        snapshots = self.snapshots()
+        if name in [snap['name'] for snap in snapshots]:
+            raise ValueError('snapshot already exists: ' + name)
+
+        os.makedirs(self.delta_dir, exist_ok=True)
+
+        df_raw, columns = read_raw_csv(data_file)
+        match_id = df_raw['Match_ID'].to_numpy().astype(np.int64)
+        inn_num = df_raw['Inn_Num'].to_numpy().astype(np.int64)
+        keys = row_keys(match_id, inn_num)
+
+        parent = snapshots[-1]['name'] if snapshots else None
+        prev_keys, prev_fields = self.fields(parent)
+        previous, found = self._carry(prev_keys, prev_fields, keys)
+
+        delta = {}
+        if parent is None or not np.array_equal(keys, prev_keys):
+            delta.update(match_id=match_id, inn_num=inn_num)
+        fields = {}
+        cells = 0
+        for col in CANON_COLUMNS:
+            values = df_raw[col].to_numpy(dtype=object)
+            rows = np.flatnonzero(values != previous[col])
+            if len(rows):
+                delta['rows_' + col] = rows.astype(np.int32)
+                delta['text_' + col] = pack_text(values[rows])
+                cells += len(rows)
+            fields[col] = values
+        np.savez_compressed(self.delta_file(name), **delta)
+        self._fields[name] = keys, fields
+
+        record = {'name': name,
+                  'source': os.path.basename(data_file),
+                  'created': datetime.now().isoformat(timespec='seconds'),
+                  'version': frame_version(row_hashes(df_raw)),
+                  'columns': columns,
+                  'parent': parent,
+                  'row_count': int(len(keys)),
+                  'new_rows': int((~found).sum()),
+                  'stored_cells': int(cells)}
+        snapshots.append(record)
+        self._write_index(snapshots)
+
+        return record
+
+    # ---- read ---------------------------------------------------------------
+
+    @staticmethod
+    def _carry(prev_keys, prev_fields, keys):
+        """ Lines up the previous snapshot's fields with the rows of `keys`
+            ('' for rows it does not have). Returns (fields, found).
+        """
+        match, found = match_keys(prev_keys, keys)
+        fields = {}
+        for col in CANON_COLUMNS:
+            values = np.full(len(keys), '', dtype=object)
+            values[found] = prev_fields[col][match[found]]
+            fields[col] = values
+
+        return fields, found
+
+    def fields(self, name):
+        """ Function to rebuild a snapshot by applying the deltas of its
+            chain (cached per store).
+            Parameters: name (str, snapshot name, None for the empty store)
+            Returns: keys (int64 ndarray, row keys in file order)
+                     fields (dict: column -> object ndarray of str)
+        """
+        if name is None:
+            return (np.zeros(0, dtype=np.int64),
+                    {col: np.zeros(0, dtype=object) for col in CANON_COLUMNS})
+
+        if name not in self._fields:
+            prev_keys, prev_fields = self.fields(self._record(name)['parent'])
+            with np.load(self.delta_file(name)) as npz:
+                delta = {key: npz[key] for key in npz.files}
+
+            if 'match_id' in delta:
+                keys = row_keys(delta['match_id'], delta['inn_num'])
+            else:
+                keys = prev_keys
+            fields, _ = self._carry(prev_keys, prev_fields, keys)
+            for col in CANON_COLUMNS:
+                if 'rows_' + col in delta:
+                    fields[col][delta['rows_' + col]] = unpack_text(delta['text_' + col])
+            self._fields[name] = keys, fields
+
+        return self._fields[name]
+
+    def load_raw(self, name):
+        """ Function to load a snapshot as raw text fields in file order.
+            Parameters: name (str, snapshot name)
+            Returns: df_raw (DataFrame of str, snapshot's original columns)
+        """
+        columns = self._record(name)['columns']
+        fields = self.fields(name)[1]
+
+        return pd.DataFrame({col: fields[col] for col in columns})
+
+    def as_of(self, name):
+        """ Function to load the dataset as it was at a snapshot, with the
+            same dtypes as reading the original csv file.
+            Parameters: name (str, snapshot name)
+            Returns: df_snap (DataFrame)
+        """
+        buffer = io.StringIO()
+        self.load_raw(name).to_csv(buffer, index=False)
+        buffer.seek(0)
+
+        return pd.read_csv(buffer)
+
+    # ---- diff ---------------------------------------------------------------
+
+    def diff(self, old_name, new_name, detail=True):
+        """ Function to compare two snapshots by matching their rows on
+            Match_ID and Inn_Num and comparing the matched fields.
+            Parameters: old_name, new_name (str, snapshot names)
+                        detail (bool, list the changed columns of each row)
+            Returns: report (dict of DataFrames: added, removed, corrected)
+        """
+        old_keys, old_fields = self.fields(old_name)
+        new_keys, new_fields = self.fields(new_name)
+
+        match, found = match_keys(old_keys, new_keys)
+        kept = np.zeros(len(old_keys), dtype=bool)
+        kept[match[found]] = True
+
+        both = np.flatnonzero(found)
+        changed = np.column_stack([old_fields[col][match[both]] != new_fields[col][both]
+                                   for col in CANON_COLUMNS])
+        corrected_mask = changed.any(axis=1)
+
+        def rows(keys, index):
+            return pd.DataFrame({'Match_ID': keys[index] // INN_STRIDE,
+                                 'Inn_Num': keys[index] % INN_STRIDE})
+
+        report = {'added': rows(new_keys, np.flatnonzero(~found)),
+                  'removed': rows(old_keys, np.flatnonzero(~kept)),
+                  'corrected': rows(new_keys, both[corrected_mask])}
+
+        if detail and corrected_mask.any():
+            report['corrected']['Changed'] = changed_labels(changed[corrected_mask])
+
+        return report
+
+
+# %% Part 4: Command line
+
+def diff_summary(report):
+    """ Function to format a diff report as text.
+        Parameters: report (dict, returned by SnapshotStore.diff())
+        Returns: summary (str)
+    """
+    lines = ['added:     {}'.format(len(report['added'])),
+             'removed:   {}'.format(len(report['removed'])),
+             'corrected: {}'.format(len(report['corrected']))]
+    if len(report['corrected']) and 'Changed' in report['corrected']:
+        counts = report['corrected']['Changed'].str.split(',').explode()
+        for col, count in counts.value_counts().items():
+            lines.append('    {:<14} {}'.format(col, count))
+
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Delta snapshot store for cricsheet csv files')
+    parser.add_argument('--root', default=SNAPSHOT_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_add = sub.add_parser('add', help='add a csv file as a snapshot')
+    p_add.add_argument('data_file')
+    p_add.add_argument('--name')
+
+    sub.add_parser('list', help='list snapshots')
+
+    p_diff = sub.add_parser('diff', help='diff two snapshots')
+    p_diff.add_argument('old_name')
+    p_diff.add_argument('new_name')
+
+    p_export = sub.add_parser('export', help='write a snapshot as csv')
+    p_export.add_argument('name')
+    p_export.add_argument('out_file')
+
+    args = parser.parse_args(argv)
+    store = SnapshotStore(args.root)
+
+    if args.command == 'add':
+        record = store.add(args.data_file, args.name)
+        print('{name}: {row_count} rows, {new_rows} new, '
+              '{stored_cells} cells stored'.format(**record))
+    elif args.command == 'list':
+        for snap in store.snapshots():
+            print('{name:<32} {created}  {row_count:>6} rows  {new_rows:>6} new  '
+                  '{stored_cells:>7} cells  {version}'.format(**snap))
+    elif args.command == 'diff':
+        print(diff_summary(store.diff(args.old_name, args.new_name)))
+    elif args.command == 'export':
+        store.load_raw(args.name).to_csv(args.out_file, index=False)
+
+
+if __name__ == '__main__':
+    main()
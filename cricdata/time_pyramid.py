@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: cricdata/time_pyramid.py
+# Description: Multi-resolution time aggregates of the halfway delivery
+#
+# A TimePyramid holds mergeable aggregates (innings count and Half_Ball sum)
+# per time bucket, season and batting team at several granularities, built
+# once per dataset version:
+#   Month    calendar months from the first to the last innings
+#   Year     calendar years
+#   Season   cricket seasons (Season_ID of dimensions.py)
+# plus every team's innings in date order with a running Half_Ball sum, so
+# the mean of any trailing window of N innings is one difference of two
+# running sums (rolling_frame()).
+#
+# A month or year can hold innings of two or three seasons, so every bucket
+# keeps its aggregates per season with innings in it (buckets x seasons per
+# bucket x teams, one bincount pass over the innings). The buckets at the
+# ends of a season range then count only the innings of the selected
+# seasons, and the totals of every level match the selection.
+#
+# Switching granularity picks a precomputed level: the work is a slice of a
+# small array, whatever the number of innings, and the innings table is
+# never regrouped.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import numpy as np
+import pandas as pd
+
+from cricdata.distributions import ball_to_del
+
+LEVELS = ('Month', 'Season', 'Year')
+ROLLING_WINDOWS = (10, 25, 50)  # innings per rolling window offered by the app
+
+
+# %% Part 2: Time pyramid
+
+class TimeLevel:
+    """ Count and Half_Ball sum per (bucket, season, team) of one
+        granularity, for the seasons with innings in each bucket.
+    """
+    __slots__ = ('labels', 'starts', 'seasons', 'count', 'total')
+
+    def __init__(self, labels, starts, seasons, count, total):
+        """ Parameters: labels (ndarray of str, bucket names)
+                        starts (ndarray of datetime64, first day of a bucket)
+                        seasons (ndarray, buckets x k, Season_IDs of each
+                        bucket's innings, -1 pads)
+                        count, total (ndarrays, buckets x k x teams)
+        """
+        self.labels = labels
+        self.starts = starts
+        self.seasons = seasons
+        self.count = count
+        self.total = total
+
+    def select(self, lo, hi, team_ids, start_id, end_id):
+        """ Returns (count, total) of buckets lo:hi (buckets x teams), for
+            the innings of seasons start_id to end_id only.
+        """
+        seasons = self.seasons[lo:hi]
+        in_range = ((seasons >= start_id) & (seasons <= end_id))[:, :, None]
+
+        return ((self.count[lo:hi][:, :, team_ids] * in_range).sum(axis=1),
+                (self.total[lo:hi][:, :, team_ids] * in_range).sum(axis=1))
+
+
+class TimePyramid:
+    """ Month, Season and Year aggregates per batting team, and running sums
+        of every team's innings in date order.
+    """
+
+    def __init__(self, levels, first_year, season_span, rolling):
+        self.levels = levels            # {level name: TimeLevel}
+        self.first_year = first_year    # calendar year of Month bucket 0
+        self.season_span = season_span  # (first, last) date per Season_ID
+        self.rolling = rolling          # (dates, teams, seasons, running sums,
+                                        #  offsets)
+
+    @classmethod
+    def from_frame(cls, df_full, n_seasons, n_teams, value_col='Half_Ball'):
+        """ Function to build the pyramid from full innings.
+            Parameters: df_full (fact DataFrame with Date, Season_ID and
+                        Batting_Team_ID)
+                        n_seasons, n_teams (int, dimension table sizes)
+                        value_col (str, integer ball column)
+            Returns: pyramid (TimePyramid)
+        """
+        dates = df_full['Date'].to_numpy(dtype='datetime64[D]')
+        team = df_full['Batting_Team_ID'].to_numpy(dtype=np.int64)
+        season = df_full['Season_ID'].to_numpy(dtype=np.int64)
+        values = df_full[value_col].to_numpy(dtype=np.int64)
+
+        def buckets(bucket, n_buckets):
+            # the k-th season with innings in a bucket gets slot k
+            pairs = np.unique(bucket * n_seasons + season)
+            pair_bucket = pairs // n_seasons
+            slot = np.arange(len(pairs)) - np.searchsorted(pair_bucket, pair_bucket)
+            n_slots = int(slot.max()) + 1 if len(pairs) else 1
+            seasons = np.full((n_buckets, n_slots), -1, dtype=np.int64)
+            seasons[pair_bucket, slot] = pairs % n_seasons
+
+            inn_slot = slot[np.searchsorted(pairs, bucket * n_seasons + season)]
+            cell = (bucket * n_slots + inn_slot) * n_teams + team
+            shape, size = (n_buckets, n_slots, n_teams), n_buckets * n_slots * n_teams
+            count = np.bincount(cell, minlength=size).reshape(shape)
+            total = np.bincount(cell, weights=values, minlength=size)
+            return seasons, count, total.round().astype(np.int64).reshape(shape)
+
+        # months from January of the first year, so years are months // 12
+        months = dates.astype('datetime64[M]')
+        years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+        first_year, n_years = int(years.min()), int(years.max() - years.min()) + 1
+        month_starts = np.datetime64(str(first_year), 'M') + np.arange(12 * n_years)
+        month_id = (months - month_starts[0]).astype(np.int64)
+
+        # seasons: first innings date as the bucket start
+        days = dates.astype(np.int64)
+        first_day = np.full(n_seasons, days.max(), dtype=np.int64)
+        last_day = np.full(n_seasons, days.min(), dtype=np.int64)
+        np.minimum.at(first_day, season, days)
+        np.maximum.at(last_day, season, days)
+        empty = np.bincount(season, minlength=n_seasons) == 0
+        no_date = np.datetime64('NaT', 'D')
+        season_first = np.where(empty, no_date, first_day.astype('datetime64[D]'))
+        season_last = np.where(empty, no_date, last_day.astype('datetime64[D]'))
+
+        levels = {
+            'Month': TimeLevel(np.datetime_as_string(month_starts, unit='M'),
+                               month_starts.astype('datetime64[D]'),
+                               *buckets(month_id, 12 * n_years)),
+            'Season': TimeLevel(None, season_first, *buckets(season, n_seasons)),
+            'Year': TimeLevel(np.datetime_as_string(month_starts[::12], unit='Y'),
+                              month_starts[::12].astype('datetime64[D]'),
+                              *buckets(month_id // 12, n_years))}
+
+        # each team's innings in date order, with running sums for windows
+        by_team = np.lexsort((dates, team))
+        cum_total = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(values[by_team], out=cum_total[1:])
+        offsets = np.searchsorted(team[by_team], np.arange(n_teams + 1))
+        rolling = (dates[by_team], team[by_team], season[by_team], cum_total, offsets)
+
+        return cls(levels, first_year, (season_first, season_last), rolling)
+
+    def date_range(self, start_id, end_id):
+        """ Returns the first and last innings dates of a season range, or
+            (None, None) if its seasons have no innings.
+        """
+        first, last = (span[start_id:end_id + 1] for span in self.season_span)
+        if np.isnat(first).all():
+            return None, None
+
+        return first[~np.isnat(first)].min(), last[~np.isnat(last)].max()
+
+    def bucket_range(self, level, start_id, end_id):
+        """ Function to find the buckets of a level covering a season range
+            (the buckets at its ends may also hold innings of other seasons).
+            Parameters: level (str, one of LEVELS)
+                        start_id, end_id (int, Season_ID range, inclusive)
+            Returns: lo, hi (int, bucket slice)
+        """
+        if level == 'Season':
+            return start_id, end_id + 1
+        first, last = self.date_range(start_id, end_id)
+        if first is None:
+            return 0, 0
+        first, last = first.astype('datetime64[M]'), last.astype('datetime64[M]')
+        start = np.datetime64(str(self.first_year), 'M')
+        lo = int((first - start).astype(np.int64))
+        hi = int((last - start).astype(np.int64)) + 1
+        if level == 'Year':
+            lo, hi = lo // 12, (hi - 1) // 12 + 1
+
+        return lo, hi
+
+
+# %% Part 3: Summary frames
+
+def trend_frame(pyramid, dims, level, team_ids, start_id, end_id, combine=False):
+    """ Function to tabulate the average halfway delivery per time bucket.
+        Parameters: pyramid (TimePyramid), dims (dict of DataFrames)
+                    level (str, one of LEVELS)
+                    team_ids (list of Team_IDs)
+                    start_id, end_id (int, Season_ID range, inclusive)
+                    combine (bool, merge the teams into one 'All' series)
+        Returns: df_trend (DataFrame: Period, Start, Batting_Team, Count,
+                 Half_Ball, Half_Del), buckets with innings of the season
+                 range only
+    """
+    if level not in LEVELS:
+        raise ValueError('level must be one of ' + ', '.join(LEVELS))
+    time_level = pyramid.levels[level]
+    lo, hi = pyramid.bucket_range(level, start_id, end_id)
+    team_ids = np.asarray(sorted(team_ids), dtype=np.int64)
+    count, total = time_level.select(lo, hi, team_ids, start_id, end_id)
+    team_names = dims['team']['Team'].to_numpy(dtype=object)[team_ids]
+    if combine:
+        count, total = count.sum(axis=1, keepdims=True), total.sum(axis=1, keepdims=True)
+        team_names = np.array(['All'], dtype=object)
+    labels = time_level.labels if time_level.labels is not None \
+        else dims['season']['Season'].to_numpy(dtype=object)
+
+    bucket, col = np.nonzero(count)
+    n_bucket = count[bucket, col]
+    mean_ball = total[bucket, col] / n_bucket
+
+    return pd.DataFrame({'Period': labels[lo + bucket],
+                         'Start': pd.to_datetime(time_level.starts[lo + bucket]),
+                         'Batting_Team': team_names[col],
+                         'Count': n_bucket,
+                         'Half_Ball': mean_ball,
+                         'Half_Del': ball_to_del(mean_ball)})
+
+def rolling_frame(pyramid, dims, window, team_ids, start_id, end_id):
+    """ Function to tabulate each team's mean halfway delivery over trailing
+        windows of `window` innings of the season range, from the running
+        sums (windows may reach back before the season range, innings with
+        fewer than `window` predecessors of their team are left out).
+        Parameters: pyramid (TimePyramid), dims (dict of DataFrames)
+                    window (int, innings per window)
+                    team_ids (list of Team_IDs)
+                    start_id, end_id (int, Season_ID range, inclusive)
+        Returns: df_rolling (DataFrame: Date, Batting_Team, Innings (number
+                 of the team's innings), Half_Ball, Half_Del)
+    """
+    dates, team, season, cum_total, offsets = pyramid.rolling
+    first, last = pyramid.date_range(start_id, end_id)
+
+    # the selected teams' slices of the date ordered innings
+    rows = []
+    for team_id in sorted(team_ids) if first is not None else []:
+        lo, hi = offsets[team_id], offsets[team_id + 1]
+        lo = max(lo + window - 1, lo + np.searchsorted(dates[lo:hi], first))
+        hi = lo + np.searchsorted(dates[lo:hi], last, side='right')
+        rows.append(np.arange(lo, hi, dtype=np.int64))
+    rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+    # other seasons can have innings between the range's first and last days
+    rows = rows[(season[rows] >= start_id) & (season[rows] <= end_id)]
+
+    mean_ball = (cum_total[rows + 1] - cum_total[rows + 1 - window]) / window
+    team_names = dims['team']['Team'].to_numpy(dtype=object)
+
+    return pd.DataFrame({'Date': pd.to_datetime(dates[rows]),
+                         'Batting_Team': team_names[team[rows]],
+                         'Innings': rows - offsets[team[rows]] + 1,
+                         'Half_Ball': mean_ball,
+                         'Half_Del': ball_to_del(mean_ball)})
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Sat Oct 18, 2025
+# Script Name: cricdata/train_model.py
+# Description: Final score prediction model training pipeline
+#
+# Fits several linear regressors of Final_Total on what is known at the
+# halfway point of an innings (MID_BALL, 25 overs): score and wickets at
+# that ball, venue, season and innings number. Each is scored with
+# season-blocked k-fold cross-validation: a fold holds out a contiguous
+# block of whole seasons. (model, fold) fits run in a process pool. The best
+# model is saved as JSON under MODEL_DIR, keyed by the dataset version
+# (content hash from snapshot_store.file_version()).
+#
+# The halfway score and wickets come from the ball-by-ball files in
+# MATCH_DIR (ball_stream.py). The innings table's Final_Wickets and Half_*
+# columns are not features: they are only known once the innings is over
+# (Half_Total is half the final score by definition). Without ball-by-ball
+# files only the venue, season and innings model can be trained.
+#
+# Usage:
+#   python -m cricdata.train_model [--data-file FILE] [--match-dir DIR]
+#                                  [--folds 5] [--workers 2]
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from cricdata.ball_stream import MATCH_DIR, match_files, read_deliveries
+from cricdata.formats import DATA_DIR, get_format
+from cricdata.snapshot_store import file_version
+
+MODEL_FORMAT = get_format('ODI')  # the model predicts full ODI innings
+DATA_FILE = MODEL_FORMAT.data_file
+MODEL_DIR = DATA_DIR + 'models/'
+MID_BALL = MODEL_FORMAT.max_balls // 2  # legal balls bowled at halfway
+
+TARGET = 'Final_Total'
+MID_COLUMNS = ['Mid_Runs', 'Mid_Wickets']  # score and wickets after MID_BALL
+
+# model name -> feature spec (numeric cols, one-hot cols, ridge alpha)
+MODEL_SPECS = {
+    'double_mid': None,  # baseline: Final_Total = 2 x Mid_Runs
+    'venue_season': {'numeric': ['Inn_Num'], 'categorical': ['Venue', 'Season'],
+                     'alpha': 10.0, 'intercept': True},
+    'linear': {'numeric': MID_COLUMNS + ['Inn_Num'],
+               'categorical': [], 'alpha': 0.0, 'intercept': True},
+    'ridge_venue_season': {'numeric': MID_COLUMNS + ['Inn_Num'],
+                           'categorical': ['Venue', 'Season'],
+                           'alpha': 10.0, 'intercept': True},
+    }
+
+
+# %% Part 2: Linear model
+
+class LinearModel:
+    """ Linear regression on numeric and one-hot features. Only the one-hot
+        coefficients are penalised (ridge) when alpha > 0.
+    """
+
+    def __init__(self, name, numeric, categorical=(), alpha=0.0, intercept=True):
+        self.name = name
+        self.numeric = list(numeric)
+        self.categorical = list(categorical)
+        self.alpha = alpha
+        self.intercept = intercept
+        self.levels = {}
+        self.coef = None
+
+    def _design(self, df_in):
+        blocks = [df_in[self.numeric].to_numpy(dtype=float)]
+        if self.intercept:
+            blocks.insert(0, np.ones((len(df_in), 1)))
+        for col in self.categorical:
+            codes = pd.Categorical(df_in[col].astype(str),
+                                   categories=self.levels[col]).codes
+            onehot = np.zeros((len(df_in), len(self.levels[col])))
+            known = codes >= 0  # unseen levels get the baseline (all zeros)
+            onehot[np.flatnonzero(known), codes[known]] = 1.0
+            blocks.append(onehot)
+
+        return np.hstack(blocks)
+
+    def fit(self, df_in, target=TARGET):
+        """ Function to fit coefficients by solving the normal equations.
+            Parameters: df_in (DataFrame of innings), target (str)
+            Returns: self
+        """
+        self.levels = {col: sorted(df_in[col].astype(str).unique())
+                       for col in self.categorical}
+        X = self._design(df_in)
+        y = df_in[target].to_numpy(dtype=float)
+
+        n_plain = len(self.numeric) + int(self.intercept)
+        penalty = np.r_[np.zeros(n_plain), np.full(X.shape[1] - n_plain, self.alpha)]
+        self.coef = np.linalg.lstsq(X.T @ X + np.diag(penalty), X.T @ y,
+                                    rcond=None)[0]
+        return self
+
+    def predict(self, df_in):
+        return self._design(df_in) @ self.coef
+
+    def to_dict(self):
+        return {'name': self.name, 'numeric': self.numeric,
+                'categorical': self.categorical, 'alpha': self.alpha,
+                'intercept': self.intercept, 'levels': self.levels,
+                'coef': self.coef.tolist()}
+
+    @classmethod
+    def from_dict(cls, spec):
+        model = cls(spec['name'], spec['numeric'], spec['categorical'],
+                    spec['alpha'], spec['intercept'])
+        model.levels = spec['levels']
+        model.coef = np.asarray(spec['coef'])
+        return model
+
+
+def build_model(name):
+    """ Function to create an unfitted model from MODEL_SPECS. """
+    spec = MODEL_SPECS[name]
+    if spec is None:
+        # the rule of thumb: double the score at halfway
+        model = LinearModel(name, ['Mid_Runs'], intercept=False)
+        model.coef = np.array([2.0])
+        return model
+
+    return LinearModel(name, spec['numeric'], spec['categorical'],
+                       spec['alpha'], spec['intercept'])
+
+
+# %% Part 3: Cross-validation
+
+def halfway_frame(match_dir=MATCH_DIR):
+    """ Function to read the score and wickets after MID_BALL legal balls of
+        every innings from ball-by-ball files.
+        Parameters: match_dir (str, Cricsheet ball-by-ball csv files)
+        Returns: df_mid (DataFrame: Match_ID, Inn_Num, Mid_Runs, Mid_Wickets),
+                 innings that lasted MID_BALL balls only
+    """
+    frames = []
+    for path in match_files(match_dir):
+        df_del = read_deliveries(path)
+        legal = df_del.groupby('innings')['legal'].cumsum()
+        # deliveries up to the MID_BALL-th legal ball (wides after it excluded)
+        df_del['before_mid'] = (legal - df_del['legal']) < MID_BALL
+        df_del['legal_balls'] = legal
+        df_mid = df_del[df_del['before_mid']].groupby(['match_id', 'innings']).agg(
+            Mid_Runs=('runs', 'sum'), Mid_Wickets=('wicket', 'sum'),
+            Balls=('legal_balls', 'max'))
+        frames.append(df_mid[df_mid['Balls'] == MID_BALL].reset_index())
+
+    if not frames:
+        return pd.DataFrame(columns=['Match_ID', 'Inn_Num'] + MID_COLUMNS)
+    df_mid = pd.concat(frames, ignore_index=True)
+    df_mid = df_mid.rename(columns={'match_id': 'Match_ID', 'innings': 'Inn_Num'})
+
+    return df_mid[['Match_ID', 'Inn_Num'] + MID_COLUMNS]
+
+def training_frame(df_cs, df_mid=None):
+    """ Function to select full ODI innings and the model columns.
+        Parameters: df_cs (DataFrame, cricsheet innings data)
+                    df_mid (DataFrame, from halfway_frame(), optional: keep
+                    the innings with a halfway state and add its columns)
+        Returns: df_train (DataFrame)
+    """
+    df_train = df_cs[MODEL_FORMAT.full_innings(df_cs)].copy()
+    df_train['Season'] = df_train['Season'].astype(str)
+    columns = ['Inn_Num', 'Venue', 'Season', TARGET]
+    if df_mid is not None and len(df_mid):
+        df_train = df_train.merge(df_mid.astype({'Match_ID': df_train['Match_ID'].dtype}),
+                                  on=['Match_ID', 'Inn_Num'])
+        columns = MID_COLUMNS + columns
+
+    return df_train[columns].reset_index(drop=True)
+
+def model_features(name):
+    """ Returns the input columns of a MODEL_SPECS model. """
+    spec = MODEL_SPECS[name]
+    if spec is None:
+        return ['Mid_Runs']
+    return spec['numeric'] + spec['categorical']
+
+def season_folds(seasons, k):
+    """ Function to assign whole seasons to k contiguous folds.
+        Parameters: seasons (Series of season names), k (int)
+        Returns: folds (ndarray of fold number per row)
+    """
+    ordered = sorted(seasons.unique())
+    block = {season: i * k // len(ordered) for i, season in enumerate(ordered)}
+
+    return seasons.map(block).to_numpy()
+
+def fit_fold(name, df_train, folds, fold):
+    """ Function to fit one model on all but one fold and score it.
+        Parameters: name (str, MODEL_SPECS key), df_train (DataFrame)
+                    folds (ndarray), fold (int, held-out fold)
+        Returns: scores (dict: model, fold, n, mae, rmse)
+    """
+    train, test = df_train[folds != fold], df_train[folds == fold]
+    model = build_model(name)
+    if MODEL_SPECS[name] is not None:
+        model.fit(train)
+    err = model.predict(test) - test[TARGET].to_numpy()
+
+    return {'model': name, 'fold': fold, 'n': len(test),
+            'mae': float(np.abs(err).mean()),
+            'rmse': float(np.sqrt((err ** 2).mean()))}
+
+def cross_validate(df_train, k=5, workers=2):
+    """ Function to run season-blocked k-fold CV in parallel, of every model
+        whose features are in df_train.
+        Parameters: df_train (DataFrame), k (int), workers (int, processes)
+        Returns: df_cv (DataFrame, per model mean MAE/RMSE over folds)
+    """
+    folds = season_folds(df_train['Season'], k)
+    names = [name for name in MODEL_SPECS
+             if set(model_features(name)) <= set(df_train.columns)]
+    tasks = [(name, fold) for name in names for fold in range(k)]
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(fit_fold, name, df_train, folds, fold)
+                   for name, fold in tasks]
+        scores = pd.DataFrame([future.result() for future in futures])
+
+    # weight folds by their size so every innings counts once
+    scores['abs_err'] = scores['mae'] * scores['n']
+    scores['sq_err'] = scores['rmse'] ** 2 * scores['n']
+    df_cv = scores.groupby('model')[['n', 'abs_err', 'sq_err']].sum()
+    df_cv['mae'] = df_cv['abs_err'] / df_cv['n']
+    df_cv['rmse'] = np.sqrt(df_cv['sq_err'] / df_cv['n'])
+
+    return df_cv[['mae', 'rmse']].sort_values(['mae', 'rmse'])
+
+
+# %% Part 4: Persisting models
+
+def model_path(version, model_dir=MODEL_DIR):
+    # halfway (MID_BALL) models get their own name, so files of the older
+    # models on end of innings columns (final_total_<version>.json) are not loaded
+    return os.path.join(model_dir, 'final_total_mid_{}.json'.format(version))
+
+def save_model(model, version, df_cv, model_dir=MODEL_DIR):
+    """ Function to save a fitted model and its CV scores as JSON.
+        Parameters: model (LinearModel), version (str, dataset version)
+                    df_cv (DataFrame, from cross_validate())
+        Returns: path (str)
+    """
+    os.makedirs(model_dir, exist_ok=True)
+    path = model_path(version, model_dir)
+    record = {'dataset_version': version,
+              'trained': pd.Timestamp.now().isoformat(timespec='seconds'),
+              'model': model.to_dict(),
+              'cv': df_cv.reset_index().to_dict(orient='records')}
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(record, f, indent=1)
+    os.replace(tmp_path, path)
+
+    return path
+
+def load_model(version, model_dir=MODEL_DIR):
+    """ Function to load the model trained on a dataset version.
+        Parameters: version (str, dataset version)
+        Returns: model (LinearModel), df_cv (DataFrame) or (None, None)
+    """
+    path = model_path(version, model_dir)
+    if not os.path.exists(path):
+        return None, None
+    with open(path, encoding='utf-8') as f:
+        record = json.load(f)
+
+    return (LinearModel.from_dict(record['model']),
+            pd.DataFrame(record['cv']).set_index('model'))
+
+def train(data_file=DATA_FILE, k=5, workers=2, model_dir=MODEL_DIR,
+          match_dir=MATCH_DIR):
+    """ Function to cross-validate all models, refit the best one on the full
+        history and save it for the file's dataset version.
+        Returns: path (str), df_cv (DataFrame)
+    """
+    df_train = training_frame(pd.read_csv(data_file), halfway_frame(match_dir))
+    df_cv = cross_validate(df_train, k, workers)
+
+    best = build_model(df_cv.index[0])
+    if MODEL_SPECS[best.name] is not None:
+        best.fit(df_train)
+
+    return save_model(best, file_version(data_file), df_cv, model_dir), df_cv
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Train the final score model with season-blocked CV')
+    parser.add_argument('--data-file', default=DATA_FILE)
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--model-dir', default=MODEL_DIR)
+    parser.add_argument('--match-dir', default=MATCH_DIR)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    path, df_cv = train(args.data_file, args.folds, args.workers, args.model_dir,
+                        args.match_dir)
+    print(df_cv.round(2).to_string())
+    print('saved {} ({:.1f}s)'.format(path, time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
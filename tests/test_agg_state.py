@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_agg_state.py
+# Description: Tests of the mergeable aggregate state (cricdata/agg_state.py)
+#
+# Merged, subtracted and incrementally synced states are checked against a
+# full pandas groupby of the real data files.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cricdata.agg_state import AggState, GroupedAggState, IncrementalAggregates
+from cricdata.core import agg_frame, build_star_schema, csv2df, read_cric_csv
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'data')
+BY = ['Season', 'Batting_Team']
+QUANTILES = [0, 0.1, 0.25, 0.5, 0.75, 0.9, 1]
+
+
+def agg_rows(file_name):
+    """ Returns the aggregate state's input rows of a data file. """
+    dims, df_fact = build_star_schema(csv2df(os.path.join(DATA_DIR, file_name)))
+    return agg_frame(read_cric_csv(df_fact), dims)
+
+@pytest.fixture(scope='module')
+def df_agg():
+    return agg_rows('cricsheet_stdata_ODI.csv')
+
+
+# %% Part 2: Helpers
+
+def assert_matches_groupby(grp_state, df_in):
+    """ Checks every group's statistics against a pandas groupby of df_in. """
+    grouped = df_in.groupby(BY)['Half_Ball']
+    expected = grouped.agg(['count', 'sum', 'mean', 'std', 'min', 'max'])
+    assert sorted(grp_state.groups) == sorted(expected.index)
+
+    for key, row in expected.iterrows():
+        state = grp_state.groups[key]
+        assert state.count == row['count']
+        assert state.total == row['sum']
+        assert state.min == row['min'] and state.max == row['max']
+        assert state.mean() == pytest.approx(row['mean'])
+        assert state.std() == pytest.approx(row['std'], nan_ok=True)
+
+def assert_same_groups(left, right):
+    assert sorted(left.groups) == sorted(right.groups)
+    for key, state in left.groups.items():
+        assert state == right.groups[key], key
+
+
+# %% Part 3: Tests
+
+def test_full_compute_matches_groupby(df_agg):
+    assert_matches_groupby(GroupedAggState.from_frame(df_agg, BY), df_agg)
+
+def test_quantiles_match_pandas(df_agg):
+    grp_state = GroupedAggState.from_frame(df_agg, BY)
+    for key, values in df_agg.groupby(BY)['Half_Ball']:
+        np.testing.assert_allclose(grp_state.groups[key].quantile(QUANTILES),
+                                   values.quantile(QUANTILES).to_numpy())
+
+    overall = grp_state.rollup()
+    assert overall.quantile(0.5) == df_agg['Half_Ball'].median()
+
+def test_merge_equals_full_compute(df_agg):
+    half = len(df_agg) // 2
+    merged = GroupedAggState.from_frame(df_agg.iloc[:half], BY)
+    merged.merge(GroupedAggState.from_frame(df_agg.iloc[half:], BY))
+
+    assert_same_groups(merged, GroupedAggState.from_frame(df_agg, BY))
+    assert_matches_groupby(merged, df_agg)
+
+def test_subtract_equals_full_compute(df_agg):
+    half = len(df_agg) // 2
+    grp_state = GroupedAggState.from_frame(df_agg, BY)
+    grp_state.subtract(df_agg.iloc[half:], BY)
+
+    # groups whose rows are all removed disappear
+    assert_matches_groupby(grp_state, df_agg.iloc[:half])
+
+def test_empty_group():
+    state = AggState.from_values([])
+    assert (state.count, state.total, state.min, state.max) == (0, 0, None, None)
+    assert np.isnan(state.mean()) and np.isnan(state.std())
+    assert np.isnan(state.quantile(QUANTILES)).all()
+
+    # a state emptied by subtraction is the empty state again
+    full = AggState.from_values([120, 150])
+    assert full - AggState.from_values([120, 150]) == state
+
+def test_single_row_group(df_agg):
+    # e.g. a team's only innings of a season
+    df_one = df_agg[df_agg.groupby(BY)['Half_Ball'].transform('size') == 1]
+    assert len(df_one)
+    grp_state = GroupedAggState.from_frame(df_agg, BY)
+    assert_matches_groupby(GroupedAggState.from_frame(df_one, BY), df_one)
+
+    for row in df_one.itertuples(index=False):
+        state, value = grp_state.groups[(row.Season, row.Batting_Team)], row.Half_Ball
+        assert (state.count, state.total, state.min, state.max) == (1, value, value, value)
+        assert state.mean() == value and np.isnan(state.std())
+        np.testing.assert_allclose(state.quantile(QUANTILES), value)
+
+def test_sync_across_data_files():
+    aggregates = IncrementalAggregates(by=BY)
+    previous = None
+    for file_name in ['cricsheet_stdata_ODI - Feb2025.csv',
+                      'cricsheet_stdata_ODI - Mar2025.csv',
+                      'cricsheet_stdata_ODI.csv']:
+        df_in = agg_rows(file_name)
+        grp_state = aggregates.sync(df_in)
+        assert_same_groups(grp_state, GroupedAggState.from_frame(df_in, BY))
+        assert_matches_groupby(grp_state, df_in)
+        if previous is not None:  # published states are never modified
+            assert_same_groups(previous[0], previous[1])
+        previous = grp_state, GroupedAggState.from_frame(df_in, BY)
+
+def test_sync_appended_and_corrected_rows(df_agg):
+    aggregates = IncrementalAggregates(by=BY)
+    aggregates.sync(df_agg.iloc[:-50])
+    first_version = aggregates.version
+
+    aggregates.sync(df_agg)
+    assert aggregates.last_changes == 50
+    assert aggregates.version == first_version + 1
+
+    aggregates.sync(df_agg)
+    assert aggregates.last_changes == 0
+    assert aggregates.version == first_version + 1
+
+    # a corrected, a removed and an inserted innings
+    df_fix = df_agg.copy()
+    df_fix.loc[10, 'Half_Ball'] += 6
+    df_fix = pd.concat([df_fix.drop(index=20).iloc[:200], df_agg.iloc[[20]].assign(Inn_Num=9),
+                        df_fix.drop(index=20).iloc[200:]], ignore_index=True)
+    grp_state = aggregates.sync(df_fix)
+    assert aggregates.last_changes == 4
+    assert_same_groups(grp_state, GroupedAggState.from_frame(df_fix, BY))
+
+def test_published_state_is_read_only(df_agg):
+    aggregates = IncrementalAggregates(by=BY)
+    grp_state = aggregates.sync(df_agg)
+    assert aggregates.snapshot() == (grp_state, aggregates.version)
+
+    state = next(iter(grp_state.groups.values()))
+    with pytest.raises(ValueError):
+        state.merge(AggState.from_values([100]))
+    # copies are writable, so roll-ups work on the published state
+    assert grp_state.rollup().count == len(df_agg)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_aggregates_api.py
+# Description: Tests of the read-only aggregates API (cricdata/aggregates_api.py)
+#
+# The current data file is published to a temporary shared directory and
+# served on a free port.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import os
+import threading
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from cricdata.aggregates_api import make_server
+from cricdata.shared_dataset import publish
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'data')
+
+
+@pytest.fixture(scope='module')
+def base_url(tmp_path_factory):
+    shared_dir = str(tmp_path_factory.mktemp('shared'))
+    publish(os.path.join(DATA_DIR, 'cricsheet_stdata_ODI.csv'), shared_dir)
+    server = make_server(port=0, shared_dir=shared_dir)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield 'http://127.0.0.1:{}'.format(server.server_address[1])
+    server.shutdown()
+
+def get(url, etag=None):
+    """ Returns (status, ETag header) of a GET, revalidating etag if given. """
+    headers = {} if etag is None else {'If-None-Match': etag}
+    try:
+        with urlopen(Request(url, headers=headers), timeout=10) as response:
+            return response.status, response.headers.get('ETag')
+    except HTTPError as err:
+        return err.code, err.headers.get('ETag')
+
+
+# %% Part 2: Tests
+
+def test_each_page_and_filter_has_its_own_etag(base_url):
+    urls = [base_url + '/innings',
+            base_url + '/innings?offset=100',
+            base_url + '/innings?teams=India',
+            base_url + '/innings?teams=India&format=arrow']
+    etags = [get(url)[1] for url in urls]
+    assert len(set(etags)) == len(urls)
+
+    # the same query spelled differently is the same page
+    assert get(base_url + '/innings?teams=India,&limit=100')[1] == etags[2]
+    for url, etag in zip(urls, etags):
+        assert get(url, etag)[0] == 304
+    assert get(urls[1], etags[0])[0] == 200
+
+@pytest.mark.parametrize('query', ['offset=-1', 'limit=abc', 'teams=Atlantis',
+                                   'start=2030'])
+def test_malformed_query_fails_before_revalidation(base_url, query):
+    _, etag = get(base_url + '/innings')
+    assert get(base_url + '/innings?' + query, etag)[0] == 400
+    assert get(base_url + '/innings?' + query, '*')[0] == 400
+
+def test_summary_revalidates(base_url):
+    status, etag = get(base_url + '/summary')
+    assert status == 200
+    assert get(base_url + '/summary', etag)[0] == 304
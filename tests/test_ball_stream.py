@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_ball_stream.py
+# Description: Tests of innings completion in ball-by-ball replays
+#                (cricdata/ball_stream.py)
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import pandas as pd
+import pytest
+
+from cricdata.ball_stream import MatchReplay
+from cricdata.projection_service import ProjectionTable
+
+
+@pytest.fixture(scope='module')
+def table():
+    return ProjectionTable.from_innings([150, 170, 180, 190, 200])
+
+def deliveries(innings, balls, runs, match_id=1):
+    """ Returns one innings of legal deliveries, `runs` off each ball. """
+    return pd.DataFrame({'match_id': match_id, 'innings': innings,
+                         'ball': ['{}.{}'.format(i // 6, i % 6 + 1) for i in range(balls)],
+                         'batting_team': 'A' if innings == 1 else 'B',
+                         'bowling_team': 'B' if innings == 1 else 'A',
+                         'runs': runs, 'legal': True, 'wicket': False})
+
+def replay(df_del, table):
+    match = MatchReplay(df_del, table)
+    states = []
+    while match.step() is not None:
+        states.append({inn: t.complete for inn, t in match.trackers.items()})
+    return match, states
+
+
+# %% Part 2: Tests
+
+def test_next_innings_ends_a_shortened_innings(table):
+    # 40 balls only (e.g. a declaration or rain): over once innings 2 starts
+    match, states = replay(pd.concat([deliveries(1, 40, 2), deliveries(2, 10, 1)]),
+                           table)
+    assert states[39] == {1: False}
+    assert states[40][1] is True
+    first = match.trackers[1]
+    assert first.projected == first.runs == 80
+    assert first.state()['Half_Reached'] and first.state()['Half_Ball'] == 20
+
+def test_passing_the_target_completes_the_chase(table):
+    match, states = replay(pd.concat([deliveries(1, 30, 2), deliveries(2, 40, 4)]),
+                           table)
+    assert match.trackers[2].target == 61
+    # 4 runs a ball: 60 after 15 balls, 64 after 16
+    assert states[30 + 14][2] is False
+    assert states[30 + 15][2] is True
+    assert match.trackers[2].projected == match.trackers[2].runs
+
+def test_match_end_completes_all_innings(table):
+    match, states = replay(pd.concat([deliveries(1, 60, 1), deliveries(2, 20, 1)]),
+                           table)
+    assert states[-1] == {1: True, 2: False}
+    assert match.finished
+    assert all(t.complete for t in match.trackers.values())
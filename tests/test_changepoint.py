@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_changepoint.py
+# Description: Tests of the halfway delivery regimes (cricdata/changepoint.py)
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import os
+
+import pytest
+
+from cricdata.core import (build_star_schema, csv2df, filter_selection,
+                           read_cric_csv, selection_regimes)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'data')
+SEG_COLUMNS = ['Batting_Team', 'Start', 'End', 'Half_Ball', 'Count', 'Half_Del']
+
+
+@pytest.fixture(scope='module')
+def data():
+    dims, df_fact = build_star_schema(csv2df(os.path.join(DATA_DIR,
+                                                          'cricsheet_stdata_ODI.csv')))
+    return read_cric_csv(df_fact), dims
+
+
+# %% Part 2: Tests
+
+def test_regimes_cover_the_selection(data):
+    df_sel = filter_selection(*data, ('India', 'Australia'), '2005-2006', '2015')
+    df_seg = selection_regimes(df_sel)
+    assert list(df_seg.columns) == SEG_COLUMNS
+
+    counts = df_seg.groupby('Batting_Team')['Count'].sum()
+    assert counts['All'] == len(df_sel)
+    assert counts.drop('All').to_dict() == df_sel['Batting_Team'].value_counts().to_dict()
+
+def test_empty_selection_has_no_regimes(data):
+    # e.g. every team removed from the sidebar selection
+    df_sel = filter_selection(*data, (), '2005-2006', '2015')
+    assert df_sel.empty
+
+    df_seg = selection_regimes(df_sel)
+    assert df_seg.empty and list(df_seg.columns) == SEG_COLUMNS
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_import_budget.py
+# Description: Cold start regression tests (benchmarks/import_budget.py)
+#
+# The app's startup imports are timed in fresh interpreters against the
+# import budget, and must not pull in any of the modules that are only
+# imported on first use.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+BUDGET_FILE = os.path.join(os.path.dirname(__file__), os.pardir, 'benchmarks',
+                           'import_budget.py')
+
+
+@pytest.fixture(scope='module')
+def budget():
+    spec = importlib.util.spec_from_file_location('import_budget', BUDGET_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope='module')
+def modules(budget):
+    return [name for name in budget.startup_imports()
+            if name.split('.')[0] not in budget.BASELINE]
+
+
+# %% Part 2: Tests
+
+def test_startup_import_time_within_budget(budget, modules):
+    total_ms = statistics.median(budget.measure(modules)[0]
+                                 for _ in range(budget.RUNS))
+    assert total_ms <= budget.BUDGET_MS, \
+        'app-owned import time {:.1f} ms'.format(total_ms)
+
+def test_lazy_modules_not_imported_at_startup(budget, modules):
+    code = '\n'.join(['import json, sys'] + ['import ' + name for name in modules]
+                     + ['print(json.dumps(sorted(sys.modules)))'])
+    proc = subprocess.run([sys.executable, '-c', code], cwd=budget.ROOT,
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    imported = json.loads(proc.stdout.splitlines()[-1])
+    eager = sorted(name for name in imported for lazy in budget.LAZY_MODULES
+                   if name == lazy or name.startswith(lazy + '.'))
+    assert not eager, 'imported at startup: ' + ', '.join(eager)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_jobs.py
+# Description: Tests of the background job executor (cricdata/jobs.py)
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import math
+import time
+
+import pytest
+
+from cricdata.jobs import DONE, FAILED, QUEUED, RUNNING, JobManager
+
+BACKOFF = 0.5
+
+
+@pytest.fixture(scope='module')
+def manager():
+    return JobManager(max_workers=1, max_attempts=2, retry_backoff=BACKOFF)
+
+def wait(manager, key, timeout=60):
+    """ Returns the state of a job once it is no longer queued or running. """
+    deadline = time.time() + timeout
+    while manager.status(key)[0] in (QUEUED, RUNNING) and time.time() < deadline:
+        time.sleep(0.05)
+    return manager.status(key)[0]
+
+def attempts(manager, key):
+    """ Returns the attempt number of a job from the metrics table. """
+    df_metrics = manager.metrics()
+    return df_metrics.loc[df_metrics['key'] == str(key), 'attempt'].item()
+
+
+# %% Part 2: Tests
+
+def test_job_result(manager):
+    manager.submit(('sqrt', 4), math.sqrt, 4)
+    assert wait(manager, ('sqrt', 4)) == DONE
+    assert manager.result(('sqrt', 4)) == 2.0
+    assert manager.submit(('sqrt', 4), math.sqrt, 4) == DONE
+
+def test_failed_job_is_retried_with_backoff_then_kept(manager):
+    key = ('sqrt', -1)
+    manager.submit(key, math.sqrt, -1)
+    assert wait(manager, key) == FAILED
+    assert isinstance(manager.error(key), ValueError)
+    assert manager.errors([('sqrt', 4), key]) == [manager.error(key)]
+
+    # a rerun within the backoff keeps the failure instead of resubmitting
+    assert manager.submit(key, math.sqrt, -1) == FAILED
+    assert attempts(manager, key) == 1
+    time.sleep(BACKOFF)
+    manager.submit(key, math.sqrt, -1)
+    assert wait(manager, key) == FAILED
+    assert attempts(manager, key) == 2
+
+    # no attempts left: the failure stays, however long the page polls
+    time.sleep(2 * BACKOFF)
+    assert manager.submit(key, math.sqrt, -1) == FAILED
+    assert attempts(manager, key) == 2
+    assert manager.result(key) is None
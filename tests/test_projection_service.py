@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_projection_service.py
+# Description: Tests of the batched projection service
+#                (cricdata/projection_service.py)
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from cricdata.projection_service import MicroBatcher, ProjectionTable, make_server
+
+
+@pytest.fixture(scope='module')
+def table():
+    return ProjectionTable.from_innings([150, 170, 180, 190, 200])
+
+@pytest.fixture(scope='module')
+def base_url(table):
+    server = make_server(port=0, table=table)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield 'http://127.0.0.1:{}/project'.format(server.server_address[1])
+    server.shutdown()
+
+def request(url, payload=None):
+    """ Returns (status, JSON body) of a GET, or a POST when payload is given. """
+    data = None if payload is None else json.dumps(payload).encode('utf-8')
+    try:
+        with urlopen(Request(url, data=data), timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as err:
+        return err.code, json.loads(err.read())
+
+
+# %% Part 2: Tests
+
+def test_batcher_matches_table(table):
+    batcher = MicroBatcher(table)
+    assert batcher.project(120, 150) == tuple(v[()] for v in table.project(120, 150))
+
+def test_failed_batch_raises_in_callers(table):
+    class BrokenTable:
+        def project(self, runs, balls):
+            raise RuntimeError('broken')
+
+    batcher = MicroBatcher(BrokenTable())
+    with pytest.raises(RuntimeError, match='broken'):
+        batcher.project(120, 150)
+    # the batcher thread survives and serves the next batch
+    batcher.table = table
+    assert batcher.project(120, 150)[0] == pytest.approx(table.project(120, 150)[0])
+
+@pytest.mark.parametrize('runs', ['nan', 'inf', '-inf'])
+def test_get_rejects_non_finite_runs(base_url, runs):
+    status, body = request(base_url + '?runs={}&balls=150'.format(runs))
+    assert status == 400 and 'error' in body
+
+def test_post_rejects_non_finite_queries(base_url):
+    status, _ = request(base_url, {'queries': [[120, 150], ['NaN', 150]]})
+    assert status == 400
+    status, body = request(base_url, {'queries': [[120, 150], [90, 120]]})
+    assert status == 200 and len(body['projected']) == 2
+
+def test_get_projects(base_url, table):
+    status, body = request(base_url + '?runs=120&balls=150')
+    assert status == 200
+    assert body['projected'] == round(float(table.project(120, 150)[0]), 1)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_report.py
+# Description: Tests of the per-selection reports (cricdata/report.py)
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import json
+import os
+import warnings
+
+import pytest
+
+from cricdata.core import load_dataset, season_grp_state
+from cricdata.report import selection_report, write_report
+from cricdata.selection_log import canonical_selection
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'data')
+
+
+@pytest.fixture(scope='module')
+def data():
+    return load_dataset(os.path.join(DATA_DIR, 'cricsheet_stdata_ODI.csv'))
+
+@pytest.fixture(scope='module')
+def grp_state(data):
+    return season_grp_state(data['full'], data['dims'])
+
+
+# %% Part 2: Tests
+
+@pytest.mark.parametrize('team', ['Kenya', 'Jersey', 'India'])
+def test_single_team_report_has_no_warnings(data, grp_state, team, tmp_path):
+    # few innings, seasons without innings and no regime changes for the
+    # smaller teams (as in `cli report --per-team`)
+    selection = canonical_selection([team], data['seasons'][0], data['seasons'][-1])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        report = selection_report(data, grp_state, selection)
+        path = write_report(report, selection, None, str(tmp_path), data['dims']['team'])
+
+    assert len(report['season_ci']) == report['season_avg']['Count'].gt(0).sum()
+    with open(os.path.join(path, 'summary.json'), encoding='utf-8') as f:
+        assert json.load(f)['innings'] == len(report['innings'])
+    assert os.path.exists(os.path.join(path, 'scatter.vl.json'))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_selection_log.py
+# Description: Tests of the selection log (cricdata/selection_log.py)
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+from collections import Counter
+import json
+import os
+
+from cricdata.selection_log import SelectionLog, canonical_selection
+
+SELECTIONS = [canonical_selection(['India', 'England'], '2010', '2015'),
+              canonical_selection(['Australia'], '2002-2003', '2024'),
+              canonical_selection(['India'], '2019', '2019')]
+
+
+def logged(path):
+    """ Returns the selections in a log file, oldest first. """
+    with open(path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    return [canonical_selection(r['teams'], r['start'], r['end']) for r in records]
+
+
+# %% Part 2: Tests
+
+def test_popular_counts_recent_entries(tmp_path):
+    log = SelectionLog(str(tmp_path / 'log.jsonl'), max_records=5)
+    assert log.popular() == []
+    for i in [0, 0, 0, 1, 1, 2, 2, 2]:
+        log.append(SELECTIONS[i])
+
+    # the last 5 entries: 1, 1, 2, 2, 2
+    assert log.popular(2) == [(SELECTIONS[2], 3), (SELECTIONS[1], 2)]
+    assert SelectionLog(log.path, max_records=5).popular(2) == log.popular(2)
+
+def test_log_is_compacted_past_max_bytes(tmp_path):
+    log = SelectionLog(str(tmp_path / 'log.jsonl'), max_records=20, max_bytes=4096)
+    entries = [SELECTIONS[i % 3 if i % 5 else 0] for i in range(500)]
+    for selection in entries:
+        log.append(selection)
+
+    assert os.path.getsize(log.path) <= 4096
+    assert logged(log.path)[-20:] == entries[-20:]
+    expected = Counter(entries[-20:]).most_common()
+    assert sorted(log.popular(None)) == sorted(expected)
+
+def test_entries_of_another_writer_are_counted(tmp_path):
+    path = str(tmp_path / 'log.jsonl')
+    log, other = SelectionLog(path), SelectionLog(path)
+    log.append(SELECTIONS[0])
+    assert log.popular() == [(SELECTIONS[0], 1)]
+
+    other.append(SELECTIONS[1])
+    other.append(SELECTIONS[1])
+    assert log.popular() == [(SELECTIONS[1], 2), (SELECTIONS[0], 1)]
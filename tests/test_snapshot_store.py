@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_snapshot_store.py
+# Description: Tests of the delta snapshot store (cricdata/snapshot_store.py)
+#
+# Snapshots of the monthly data files are rebuilt and diffed, and the cost
+# of a one column correction is checked against the size of that column.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import os
+
+import numpy as np
+import pytest
+
+from cricdata.snapshot_store import (SnapshotStore, file_version, pack_text,
+                                     read_raw_csv)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'data')
+DATA_FILES = ['cricsheet_stdata_ODI - Feb2025.csv',
+              'cricsheet_stdata_ODI - Mar2025.csv',
+              'cricsheet_stdata_ODI.csv']
+
+
+@pytest.fixture(scope='module')
+def store(tmp_path_factory):
+    store = SnapshotStore(str(tmp_path_factory.mktemp('snapshots')))
+    for file_name in DATA_FILES:
+        store.add(os.path.join(DATA_DIR, file_name))
+    return store
+
+def compressed_size(path, **arrays):
+    """ Returns the size of the arrays saved with np.savez_compressed. """
+    np.savez_compressed(path, **arrays)
+    return os.path.getsize(path)
+
+
+# %% Part 2: Tests
+
+def test_snapshots_rebuild_their_files(store):
+    for name, file_name in zip(store.names(), DATA_FILES):
+        df_raw, columns = read_raw_csv(os.path.join(DATA_DIR, file_name))
+        assert store.load_raw(name).equals(df_raw[columns])
+        assert store._record(name)['version'] == file_version(
+            os.path.join(DATA_DIR, file_name))
+
+    # a fresh store object rebuilds the same frames from the delta files
+    fresh = SnapshotStore(store.root)
+    assert fresh.load_raw(store.names()[-1]).equals(store.load_raw(store.names()[-1]))
+
+def test_diff_of_monthly_files(store):
+    feb, mar, latest = store.names()
+    report = store.diff(feb, mar)
+    assert (len(report['added']), len(report['removed'])) == (48, 0)
+    # Home_Team was added to the file in March
+    assert set(report['corrected']['Changed']) == {'Home_Team'}
+
+    report = store.diff(mar, latest)
+    assert (len(report['added']), len(report['removed'])) == (31, 0)
+    assert len(report['corrected']) == 4785
+    assert report['corrected']['Changed'].str.contains('City').all()
+
+def test_one_column_change_costs_one_column(tmp_path):
+    df_raw, columns = read_raw_csv(os.path.join(DATA_DIR, DATA_FILES[-1]))
+    base_file, fixed_file = str(tmp_path / 'base.csv'), str(tmp_path / 'fixed.csv')
+    df_raw[columns].to_csv(base_file, index=False)
+    df_raw.assign(Venue=df_raw['Venue'].str.upper())[columns].to_csv(fixed_file, index=False)
+
+    store = SnapshotStore(str(tmp_path / 'store'))
+    base = store.add(base_file)
+    fixed = store.add(fixed_file)
+    changed = df_raw['Venue'] != df_raw['Venue'].str.upper()
+    assert fixed['new_rows'] == 0 and fixed['stored_cells'] == changed.sum()
+
+    column_size = compressed_size(str(tmp_path / 'venue.npz'),
+                                  rows=np.flatnonzero(changed).astype(np.int32),
+                                  text=pack_text(df_raw.loc[changed, 'Venue'].str.upper()))
+    delta_size = os.path.getsize(store.delta_file(fixed['name']))
+    assert delta_size < 1.2 * column_size
+    assert delta_size < os.path.getsize(store.delta_file(base['name'])) / 5
+
+    report = store.diff(base['name'], fixed['name'])
+    assert set(report['corrected']['Changed']) == {'Venue'}
+    assert len(report['corrected']) == changed.sum()
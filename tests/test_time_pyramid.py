@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Created on Mon Oct 20, 2025
+# Script Name: tests/test_time_pyramid.py
+# Description: Tests of the multi-resolution trend aggregates
+#                (cricdata/time_pyramid.py)
+#
+# The buckets of every level are checked against the innings of the same
+# selection filtered from the full innings table.
+#
+# @author: 18HIAGC
+# =============================================================================
+
+# %% Part 1: Imports
+
+import os
+
+import pytest
+
+from cricdata.core import (build_star_schema, csv2df, filter_selection,
+                           read_cric_csv, selection_rolling, selection_trend,
+                           time_pyramid)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'data')
+SELECTIONS = [(('Australia', 'India'), '2005-2006', '2015'),
+              (('England', 'Pakistan', 'Sri Lanka'), '2009', '2011-2012'),
+              (('New Zealand',), '2019-2020', '2019-2020')]
+
+
+@pytest.fixture(scope='module')
+def data():
+    dims, df_fact = build_star_schema(csv2df(os.path.join(DATA_DIR,
+                                                          'cricsheet_stdata_ODI.csv')))
+    df_full = read_cric_csv(df_fact)
+    return df_full, dims, time_pyramid(df_full, dims)
+
+
+# %% Part 2: Tests
+
+def test_india_australia_buckets_count_the_selection(data):
+    df_full, dims, pyramid = data
+    selection = SELECTIONS[0]
+    assert len(filter_selection(df_full, dims, *selection)) == 213
+    for level in ['Month', 'Season', 'Year']:
+        assert selection_trend(pyramid, dims, level, *selection)['Count'].sum() == 213
+    assert len(selection_rolling(pyramid, dims, 1, *selection)) == 213
+
+@pytest.mark.parametrize('selection', SELECTIONS)
+@pytest.mark.parametrize('level', ['Month', 'Season', 'Year'])
+@pytest.mark.parametrize('combine', [False, True])
+def test_bucket_totals_match_the_selection(data, selection, level, combine):
+    df_full, dims, pyramid = data
+    df_sel = filter_selection(df_full, dims, *selection)
+    df_trend = selection_trend(pyramid, dims, level, *selection, combine)
+    df_trend = df_trend.assign(Total=df_trend['Count'] * df_trend['Half_Ball'])
+
+    if combine:
+        assert set(df_trend['Batting_Team']) == {'All'}
+        assert df_trend['Count'].sum() == len(df_sel)
+        assert df_trend['Total'].sum() == pytest.approx(df_sel['Half_Ball'].sum())
+    else:
+        totals = df_trend.groupby('Batting_Team')[['Count', 'Total']].sum()
+        expected = df_sel.groupby('Batting_Team')['Half_Ball'].agg(['size', 'sum'])
+        assert totals['Count'].to_dict() == expected['size'].to_dict()
+        assert totals['Total'].to_dict() == pytest.approx(expected['sum'].to_dict())